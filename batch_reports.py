@@ -0,0 +1,147 @@
+# batch_reports.py
+"""
+Render career PDF reports for many profiles with a process pool.
+
+    python batch_reports.py results.jsonl -o reports.zip --workers 8
+    python batch_reports.py results.jsonl -o reports/          # one PDF per profile
+
+Input is JSONL, one profile per line: either
+{"profile": {...}, "matches": [...], "advice": "..."} or a bulk_ingest.py result
+line ({"file", "name", "skills", "matches"}). Missing advice is filled in with
+the mock advisor. Lines are read lazily and only a few reports are in flight at
+once, so memory stays flat however long the input is. Identical reports are
+rendered once and copied.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from engine.advisor import get_personalized_advice
+from pdf_report import report_key, write_report
+
+
+def iter_rows(path: str):
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def to_report(row: dict) -> tuple[dict, list[dict], str] | None:
+    """(profile, matches, advice) for an input line, or None for lines without a result."""
+    if "error" in row or "matches" not in row:
+        return None
+    profile = row.get("profile") or {"name": row.get("name", "Unknown"), "skills": row.get("skills", [])}
+    matches = row["matches"]
+    advice = row.get("advice") or get_personalized_advice(profile, matches[:3], use_mock=True)
+    return profile, matches, advice
+
+
+def report_name(row: dict, index: int) -> str:
+    base = row.get("file") or (row.get("profile") or {}).get("name") or row.get("name") or "report"
+    base = re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.splitext(base)[0]).strip("_") or "report"
+    return f"{index:05d}_{base}.pdf"
+
+
+def _render(profile: dict, matches: list[dict], advice: str, path: str) -> int:
+    return write_report(profile, matches, advice, path)
+
+
+def run(input_path: str, output: str, workers: int = 4, max_in_flight: int | None = None) -> dict:
+    """
+    Render every report of input_path into output: a .zip file, or otherwise a
+    directory. Returns counts, seconds, and reports/pages per second.
+    """
+    start = time.perf_counter()
+    to_zip = output.lower().endswith(".zip")
+    out_dir = tempfile.mkdtemp(prefix="reports_") if to_zip else output
+    os.makedirs(out_dir, exist_ok=True)
+    max_in_flight = max_in_flight or 2 * workers
+    stats = {"reports": 0, "duplicates": 0, "skipped": 0, "failed": 0, "pages": 0}
+
+    first = {}       # report key -> file name it is rendered to
+    failed = set()   # report keys whose rendering failed
+    copies = []      # (file name, report key) of repeated reports
+    pending = {}     # future -> (file name, report key)
+    zf = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) if to_zip else None
+
+    def collect(done):
+        for fut in done:
+            name, key = pending.pop(fut)
+            try:
+                stats["pages"] += fut.result()
+            except Exception as e:
+                stats["failed"] += 1
+                failed.add(key)
+                print(f"{name}: {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            stats["reports"] += 1
+            if zf is not None:
+                zf.write(os.path.join(out_dir, name), name)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for i, row in enumerate(iter_rows(input_path)):
+                report = to_report(row)
+                if report is None:
+                    stats["skipped"] += 1
+                    continue
+                name = report_name(row, i)
+                key = report_key(*report)
+                if key in first:
+                    copies.append((name, key))
+                    continue
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                first[key] = name
+                pending[pool.submit(_render, *report, os.path.join(out_dir, name))] = (name, key)
+            collect(list(pending))
+
+        for name, key in copies:
+            if key in failed:
+                stats["failed"] += 1
+                continue
+            stats["duplicates"] += 1
+            if zf is not None:
+                zf.write(os.path.join(out_dir, first[key]), name)
+            else:
+                shutil.copyfile(os.path.join(out_dir, first[key]), os.path.join(out_dir, name))
+    finally:
+        if zf is not None:
+            zf.close()
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    seconds = time.perf_counter() - start
+    stats["seconds"] = seconds
+    stats["reports_per_sec"] = stats["reports"] / seconds if seconds > 0 else 0.0
+    stats["pages_per_sec"] = stats["pages"] / seconds if seconds > 0 else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-render career PDF reports from JSONL.")
+    parser.add_argument("input", help="JSONL of profiles + matches (e.g. bulk_ingest.py output)")
+    parser.add_argument("-o", "--output", default="reports.zip", help="a .zip file, or a directory")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    stats = run(args.input, args.output, workers=args.workers)
+    print(
+        f"{stats['reports']} rendered, {stats['duplicates']} duplicates copied, "
+        f"{stats['skipped']} skipped, {stats['failed']} failed, "
+        f"{stats['pages']} pages in {stats['seconds']:.1f}s "
+        f"({stats['reports_per_sec']:.1f} reports/s, {stats['pages_per_sec']:.1f} pages/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# bench_advice.py
+"""
+Micro-benchmark of the mock advisor: per-call latency and allocations of the
+precompiled AdviceTemplate against the original per-call f-string.
+
+    python bench_advice.py --calls 20000
+"""
+import argparse
+import time
+import tracemalloc
+
+from engine.advice_template import get_template
+from engine.matcher import match_careers
+
+PROFILE = {
+    "name": "Ada Lovelace",
+    "age": 28,
+    "education": "Postgraduate",
+    "interests": ["AI", "Data Science", "Open Source"],
+    "career_goal": "Machine Learning Engineer",
+    "skills": ["python", "sql", "machine learning", "docker"],
+}
+
+
+def legacy_mock_advice(profile, top_matches=None):
+    """The mock branch as it was before templates (profile part only)."""
+    interests = ", ".join(profile.get("interests", [])) or "AI, Tech"
+    education = profile.get("education", "Undergraduate")
+    career_goal = profile.get("career_goal", "AI Engineer")
+    skills = ", ".join(profile.get("skills", [])) or "Python, SQL"
+
+    advice = f"""
+Personalized AI Career Guidance (Mock)
+
+Name: {profile.get('name','')}
+Age: {profile.get('age','')}
+Education: {education}
+Interests: {interests}
+Career Goal: {career_goal}
+Current Skills: {skills}
+
+Suggested Path:
+1. Focus on {interests.split(',')[0].strip()} fundamentals and core projects.
+2. Build 2-3 portfolio projects using {skills.split(',')[0].strip()}.
+3. Target internships / freelance projects to get hands-on experience.
+4. Practice interviews and data-structure basics if applying to tech roles.
+
+(Disclaimer: This is a mock response. Enable Gemini for richer AI output.)
+"""
+    return advice
+
+
+def measure(fn, args: tuple, calls: int) -> dict:
+    """Microseconds per call, and bytes / blocks allocated per call (tracemalloc)."""
+    fn(*args)  # warm up (compiles the template on first use)
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn(*args)
+    us = (time.perf_counter() - start) / calls * 1e6
+
+    sample = min(calls, 1000)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [fn(*args) for _ in range(sample)]  # keep results alive so they are counted
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(s.size_diff for s in stats)
+    blocks = sum(s.count_diff for s in stats)
+    del keep
+    return {"us_per_call": us, "bytes_per_call": size / sample, "blocks_per_call": blocks / sample}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the mock advice template.")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    template = get_template()
+    matches = match_careers(PROFILE["skills"])[:3]
+    assert template.render(PROFILE) == legacy_mock_advice(PROFILE), "template output drifted from the original"
+
+    rows = [
+        ("f-string (original)", legacy_mock_advice, (PROFILE,)),
+        ("template", template.render, (PROFILE,)),
+        ("template + 3 roles", template.render, (PROFILE, matches)),
+    ]
+    print(f"{'variant':<22}{'us/call':>10}{'bytes/call':>12}{'blocks/call':>13}")
+    for name, fn, fn_args in rows:
+        r = measure(fn, fn_args, args.calls)
+        print(f"{name:<22}{r['us_per_call']:>10.2f}{r['bytes_per_call']:>12.0f}{r['blocks_per_call']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
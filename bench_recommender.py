@@ -0,0 +1,102 @@
+# bench_recommender.py
+"""
+Benchmark of the greedy resource recommender against exhaustive search.
+
+    python bench_recommender.py --resources 100000 --queries 200
+
+Builds a synthetic resources CSV whose titles mention random skills from
+skills_database.json, then reports milliseconds per recommendation on the
+large catalog, and on a small catalog compares the greedy cover with the
+optimal one found by brute force (covered skills, minutes, time per query).
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+import tempfile
+import time
+
+from engine.recommender import ResourceRecommender
+from resource_index import ResourceIndex
+from skill_registry import get_registry
+
+TYPES = ["course", "youtube", "article", "book"]
+DURATIONS = ["15 min", "45 min", "2 hours", "5 hours", "2 weeks"]
+
+
+def make_catalog(path: str, n: int, skills: list[str], rng: random.Random):
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["role_id", "resource_type", "title", "url", "duration"])
+        for i in range(n):
+            taught = rng.sample(skills, rng.randint(1, 3))
+            w.writerow([f"role_{i % 50}", rng.choice(TYPES), "Learn " + " and ".join(taught),
+                        f"https://example.com/{i}", rng.choice(DURATIONS)])
+
+
+def brute_force(rec: ResourceRecommender, missing: list[str], budget: float) -> tuple[int, float]:
+    """(covered skills, minutes) of the best cover: most skills, then fewest minutes."""
+    wanted = {rec._canon.lookup(s) for s in missing} - {None}
+    cands = sorted(rec.candidates(wanted))
+    best = (0, 0.0)
+    for k in range(1, len(wanted) + 1):
+        for combo in itertools.combinations(cands, k):
+            minutes = sum(rec.cost(i) for i in combo)
+            if minutes > budget:
+                continue
+            covered = len(wanted & frozenset().union(*(rec.resource_skills[i] for i in combo)))
+            if covered > best[0] or (covered == best[0] and minutes < best[1]):
+                best = (covered, minutes)
+    return best
+
+
+def run_queries(rec, queries, budget):
+    start = time.perf_counter()
+    results = [rec.recommend(q, budget) for q in queries]
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark greedy resource recommendation vs brute force.")
+    parser.add_argument("--resources", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--budget-hours", type=float, default=40.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    skills = get_registry().skills
+    budget = args.budget_hours * 60
+    tmp = tempfile.mkdtemp()
+
+    # large catalog: latency of the greedy recommender
+    path = os.path.join(tmp, "large.csv")
+    make_catalog(path, args.resources, skills, rng)
+    start = time.perf_counter()
+    rec = ResourceRecommender(ResourceIndex(path))
+    rec.sync()
+    print(f"{args.resources} resources indexed in {time.perf_counter() - start:.2f}s")
+    queries = [rng.sample(skills, rng.randint(3, 8)) for _ in range(args.queries)]
+    results, ms = run_queries(rec, queries, budget)
+    picked = sum(len(r["resources"]) for r in results) / len(results)
+    print(f"greedy, {args.resources} resources: {ms:.2f} ms/query, {picked:.1f} resources per answer")
+
+    # small catalog: greedy vs optimal
+    path = os.path.join(tmp, "small.csv")
+    make_catalog(path, 300, skills[:40], rng)
+    rec = ResourceRecommender(ResourceIndex(path))
+    queries = [rng.sample(skills[:40], 4) for _ in range(min(args.queries, 30))]
+    results, greedy_ms = run_queries(rec, queries, budget)
+    start = time.perf_counter()
+    optimal = [brute_force(rec, q, budget) for q in queries]
+    brute_ms = (time.perf_counter() - start) / len(queries) * 1000
+    same_cover = sum(len(r["covered"]) == o[0] for r, o in zip(results, optimal))
+    ratio = [r["minutes"] / o[1] for r, o in zip(results, optimal) if o[1] and len(r["covered"]) == o[0]]
+    print(f"greedy, 300 resources: {greedy_ms:.3f} ms/query; brute force: {brute_ms:.1f} ms/query")
+    print(f"greedy covers as many skills as optimal in {same_cover}/{len(queries)} queries; "
+          f"minutes vs optimal: mean {sum(ratio) / max(len(ratio), 1):.2f}x, worst {max(ratio, default=1):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# bulk_ingest.py
+"""
+Headless bulk resume analysis: parse every PDF under a directory, detect skills,
+match careers, and append one JSON line per resume to the output file.
+
+    python bulk_ingest.py resumes/ -o results.jsonl --workers 8
+
+The output file doubles as the checkpoint: re-running the same command skips
+resumes already written successfully, so an interrupted run picks up where it
+stopped (failed resumes are retried). Before appending, the file is compacted
+to one successful line per resume: error lines, duplicates and a partial last
+line left by a crash are dropped.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from engine.matcher import match_careers
+from resume_parser import ResumeCache, parse_resume
+from skill_registry import SKILLS_DB_PATH, SkillRegistry
+
+_SKILL_DB = None
+_NO_CACHE = ResumeCache(max_entries=0)  # each resume is seen once; don't hold texts
+
+
+def _init_worker(skills_db_path: str):
+    global _SKILL_DB
+    # None -> the shared registry used by the app
+    _SKILL_DB = None if skills_db_path == SKILLS_DB_PATH else SkillRegistry(skills_db_path).current.skills
+
+
+def analyse_resume(path: str, rel_path: str, top_k: int) -> dict:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        parsed = parse_resume(data, _SKILL_DB, cache=_NO_CACHE)
+        text = parsed["text"]
+        return {
+            "file": rel_path,
+            "name": text.split("\n")[0] if text else "Unknown",
+            "skills": parsed["skills"],
+            "matches": match_careers(parsed["skills"], top_k=top_k),
+        }
+    except Exception as e:
+        return {"file": rel_path, "error": f"{type(e).__name__}: {e}"}
+
+
+def find_pdfs(root: str) -> list[tuple[str, str]]:
+    """(absolute path, path relative to root) of every PDF under root, sorted."""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.lower().endswith(".pdf"):
+                path = os.path.join(dirpath, name)
+                found.append((path, os.path.relpath(path, root)))
+    return sorted(found, key=lambda p: p[1])
+
+
+def load_checkpoint(output: str) -> set[str]:
+    """
+    Files already written successfully to output. Rewrites output (tmp file +
+    os.replace) when it holds anything else, so appends start on a clean line
+    and a retried resume ends up with exactly one line.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    dirty = False
+    tmp = f"{output}.{os.getpid()}.tmp"
+    with open(output, "rb") as f, open(tmp, "wb") as clean:
+        for line in f:
+            try:
+                row = json.loads(line) if line.endswith(b"\n") else None
+            except ValueError:
+                row = None
+            # partial last line from an interrupted run, an error to retry, or a duplicate
+            if row is None or "error" in row or row.get("file") in done:
+                dirty = True
+                continue
+            done.add(row["file"])
+            clean.write(line)
+    if dirty:
+        os.replace(tmp, output)
+    else:
+        os.remove(tmp)
+    return done
+
+
+def run(root: str, output: str, workers: int = 4, top_k: int = 3,
+        skills_db_path: str = SKILLS_DB_PATH, progress_every: int = 50, max_in_flight: int | None = None) -> dict:
+    start = time.perf_counter()
+    pdfs = find_pdfs(root)
+    done = load_checkpoint(output)
+    todo = ((path, rel) for path, rel in pdfs if rel not in done)
+    stats = {"total": len(pdfs), "skipped": len(done & {rel for _, rel in pdfs}), "processed": 0, "failed": 0}
+    remaining = stats["total"] - stats["skipped"]
+    max_in_flight = max_in_flight or 4 * workers  # enough queued to keep every worker busy
+
+    with open(output, "a") as out, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(skills_db_path,)
+    ) as pool:
+        pending = set()
+        while True:
+            # only a bounded window of resumes (and their results) is held at a time
+            for path, rel in todo:
+                pending.add(pool.submit(analyse_resume, path, rel, top_k))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                row = fut.result()
+                out.write(json.dumps(row) + "\n")
+                out.flush()  # each line is a checkpoint
+                stats["processed"] += 1
+                if "error" in row:
+                    stats["failed"] += 1
+                if progress_every and stats["processed"] % progress_every == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"{stats['processed']}/{remaining} resumes, {stats['processed'] / elapsed:.1f}/s",
+                          file=sys.stderr)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["resumes_per_sec"] = stats["processed"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk resume -> skills -> career matches (JSONL).")
+    parser.add_argument("root", help="directory containing resume PDFs (searched recursively)")
+    parser.add_argument("-o", "--output", default="results.jsonl", help="JSONL output / checkpoint file")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-k", "--top-k", type=int, default=3, help="career matches kept per resume")
+    parser.add_argument("--skills-db", default=SKILLS_DB_PATH)
+    parser.add_argument("--progress-every", type=int, default=50)
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="resumes queued or running at once (default 4 per worker)")
+    args = parser.parse_args(argv)
+
+    stats = run(args.root, args.output, workers=args.workers, top_k=args.top_k,
+                skills_db_path=args.skills_db, progress_every=args.progress_every,
+                max_in_flight=args.max_in_flight)
+    print(
+        f"{stats['processed']} processed ({stats['failed']} failed), {stats['skipped']} already done, "
+        f"{stats['seconds']:.1f}s, {stats['resumes_per_sec']:.1f} resumes/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+# catalog.py
+"""
+Role catalog compiled to a compact binary format: roles, learning plans,
+and interview questions, each a table of JSON records
+grouped by key and memory-mapped, so opening a catalog reads no records and
+looking up one role decodes only that role's bytes.
+
+    python catalog.py build                 # catalog_src/*.json -> .cache/catalog
+    python catalog.py build -o dist/catalog # prebuilt catalog to ship (point CATALOG_DIR at it)
+
+get_catalog() rebuilds automatically when a source file is newer than the
+compiled tables.
+
+Each build writes its tables into a new generation directory and then points
+manifest.json at it (written last, atomically), so a reader or a crash mid-build
+only ever sees one complete set of tables. The previous generation is kept for
+readers still opening tables from it; older ones are removed.
+"""
+import argparse
+import bisect
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import threading
+import time
+
+SRC_DIR = "catalog_src"
+SOURCES = {
+    "roles": os.path.join(SRC_DIR, "roles.json"),
+    "plans": os.path.join(SRC_DIR, "learning_plans.json"),
+    "questions": os.path.join(SRC_DIR, "questions.json"),
+}
+CATALOG_DIR = os.path.join(".cache", "catalog")
+FORMAT_VERSION = 5  # bump when the set or layout of tables changes
+DEFAULT_DIFFICULTY = 0.0  # item-response difficulty of questions that don't set one
+
+# table file: header | entries (sorted by key) | source order | keys | records
+_MAGIC = b"CATTBL01"
+_HEADER = struct.Struct("<8sI")      # magic, entry count
+_ENTRY = struct.Struct("<IIQI")      # key offset, key length, record offset, record length
+_ORDER = struct.Struct("<I")
+
+
+def write_table(path: str, items) -> int:
+    """
+    Write (key, value) pairs to a table file; values are stored as compact JSON,
+    keys must be unique. Source order is kept for values(). Returns the count.
+    """
+    keys, records = [], []
+    for key, value in items:
+        keys.append(key.encode("utf-8"))
+        records.append(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    n = len(keys)
+    if len(set(keys)) != n:
+        raise ValueError(f"duplicate keys in {path}")
+    sorted_ids = sorted(range(n), key=keys.__getitem__)
+    rank = {i: r for r, i in enumerate(sorted_ids)}
+
+    keys_start = _HEADER.size + n * _ENTRY.size + n * _ORDER.size
+    key_offsets, pos = [], keys_start
+    for k in keys:
+        key_offsets.append(pos)
+        pos += len(k)
+    record_offsets = []
+    for r in records:
+        record_offsets.append(pos)
+        pos += len(r)
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, n))
+        for i in sorted_ids:
+            f.write(_ENTRY.pack(key_offsets[i], len(keys[i]), record_offsets[i], len(records[i])))
+        for i in range(n):
+            f.write(_ORDER.pack(rank[i]))
+        f.writelines(keys)
+        f.writelines(records)
+    os.replace(tmp, path)  # readers never see a half-written table
+    return n
+
+
+class Table:
+    """Read side of write_table(): lookups are a binary search over the mapped file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        magic, self._n = _HEADER.unpack_from(self._buf, 0) if size else (_MAGIC, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a catalog table")
+        self._order_start = _HEADER.size + self._n * _ENTRY.size
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> bytes:
+        """Key of the i-th entry in sorted order (lets bisect search the file)."""
+        key_off, key_len, _, _ = _ENTRY.unpack_from(self._buf, _HEADER.size + i * _ENTRY.size)
+        return self._buf[key_off:key_off + key_len]
+
+    def _find(self, key: str) -> int | None:
+        k = key.encode("utf-8")
+        i = bisect.bisect_left(self, k)
+        return i if i < self._n and self[i] == k else None
+
+    def _record(self, i: int):
+        _, _, off, length = _ENTRY.unpack_from(self._buf, _HEADER.size + i * _ENTRY.size)
+        return json.loads(self._buf[off:off + length])
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def get(self, key: str, default=None):
+        """The value stored under key, decoded fresh on every call (safe to mutate)."""
+        i = self._find(key)
+        return default if i is None else self._record(i)
+
+    def _source_order(self):
+        for j in range(self._n):
+            yield _ORDER.unpack_from(self._buf, self._order_start + j * _ORDER.size)[0]
+
+    def keys(self) -> list[str]:
+        """Keys in source order."""
+        return [self[i].decode("utf-8") for i in self._source_order()]
+
+    def values(self):
+        """Values in source order (decoded one at a time)."""
+        for i in self._source_order():
+            yield self._record(i)
+
+
+# ---------- build ----------
+def _load_json(path: str, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def question_key(role: str, i: int) -> str:
+    """Key of a role's i-th interview question (one record per question, so one can be read alone)."""
+    return f"{role}\x00{i:08d}"
+
+
+def _difficulty_index(questions: list[dict]) -> dict:
+    """A role's question difficulties sorted ascending, with the question number of each."""
+    order = sorted(range(len(questions)), key=lambda i: questions[i].get("difficulty", DEFAULT_DIFFICULTY))
+    return {"difficulty": [float(questions[i].get("difficulty", DEFAULT_DIFFICULTY)) for i in order], "ids": order}
+
+
+def read_manifest(out_dir: str) -> dict | None:
+    """out_dir's manifest if it describes a complete build of this format version, else None."""
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != FORMAT_VERSION or not isinstance(manifest.get("generation"), str):
+        return None
+    if not os.path.isdir(os.path.join(out_dir, manifest["generation"])):
+        return None
+    return manifest
+
+
+def build(out_dir: str = CATALOG_DIR, sources: dict | None = None) -> dict:
+    """Compile the source files into a new generation under out_dir. Returns record counts per table."""
+    sources = {**SOURCES, **(sources or {})}
+    os.makedirs(out_dir, exist_ok=True)
+    previous = read_manifest(out_dir)
+    generation = f"g{time.time_ns():020d}-{os.getpid()}"  # sorts by build start
+    gen_dir = os.path.join(out_dir, generation)
+    os.makedirs(gen_dir)
+    try:
+        roles = _load_json(sources["roles"], [])
+        questions = _load_json(sources["questions"], {})
+        counts = {
+            "roles": write_table(os.path.join(gen_dir, "roles.tbl"), ((r["role"], r) for r in roles)),
+            "plans": write_table(os.path.join(gen_dir, "plans.tbl"), _load_json(sources["plans"], {}).items()),
+            "questions": write_table(os.path.join(gen_dir, "questions.tbl"), (
+                (question_key(role, i), q) for role, qs in questions.items() for i, q in enumerate(qs))),
+        }
+        write_table(os.path.join(gen_dir, "question_counts.tbl"), ((role, len(qs)) for role, qs in questions.items()))
+        # one record per role, so the adaptive interview can pick questions without decoding them
+        write_table(os.path.join(gen_dir, "question_difficulty.tbl"),
+                    ((role, _difficulty_index(qs)) for role, qs in questions.items()))
+        # role name -> id, for data keyed by role id (resources.csv, see resource_index.py)
+        write_table(os.path.join(gen_dir, "role_ids.tbl"), ((r["role"], r["id"]) for r in roles if "id" in r))
+    except BaseException:
+        shutil.rmtree(gen_dir, ignore_errors=True)
+        raise
+    manifest = os.path.join(out_dir, "manifest.json")
+    tmp = f"{manifest}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"version": FORMAT_VERSION, "generation": generation, "built_at": time.time(),
+                   "counts": counts, "sources": sources}, f, indent=2)
+    os.replace(tmp, manifest)  # the switch to the new tables: readers see the old set or the new one
+    _remove_old_generations(out_dir, keep=previous["generation"] if previous else generation)
+    return counts
+
+
+def _remove_old_generations(out_dir: str, keep: str):
+    """Delete generations older than `keep` (the one in use before this build), and stray tables of old formats."""
+    for name in os.listdir(out_dir):
+        path = os.path.join(out_dir, name)
+        if name.startswith("g") and os.path.isdir(path) and name < keep:
+            shutil.rmtree(path, ignore_errors=True)
+        elif name.endswith(".tbl"):  # format 4 and older wrote tables next to the manifest
+            os.remove(path)
+
+
+# ---------- read ----------
+class Catalog:
+    """
+    The compiled tables of one catalog directory, as of the generation its
+    manifest named when the Catalog was made; tables are opened on first use.
+    """
+
+    def __init__(self, path: str = CATALOG_DIR):
+        self.path = path
+        manifest = read_manifest(path)
+        if manifest is None:
+            raise ValueError(f"{path} holds no complete catalog of format {FORMAT_VERSION} (run catalog.py build)")
+        self.generation = manifest["generation"]
+        self._tables = {}
+        self._roles = None
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> Table:
+        t = self._tables.get(name)
+        if t is None:
+            with self._lock:
+                t = self._tables.get(name)
+                if t is None:
+                    t = self._tables[name] = Table(os.path.join(self.path, self.generation, f"{name}.tbl"))
+        return t
+
+    def role(self, name: str) -> dict | None:
+        return self.table("roles").get(name)
+
+    def roles(self) -> list[dict]:
+        """Every role in source order, decoded once (the matcher needs them all)."""
+        if self._roles is None:
+            table = self.table("roles")
+            with self._lock:
+                if self._roles is None:
+                    self._roles = list(table.values())
+        return self._roles
+
+    def role_names(self) -> list[str]:
+        return self.table("roles").keys()
+
+    def role_id(self, name: str) -> str | None:
+        return self.table("role_ids").get(name)
+
+    def plans(self, role: str) -> dict | None:
+        return self.table("plans").get(role)
+
+    def plan_roles(self) -> list[str]:
+        return self.table("plans").keys()
+
+    def question_count(self, role: str) -> int:
+        return self.table("question_counts").get(role, 0)
+
+    def question(self, role: str, i: int) -> dict | None:
+        """A role's i-th interview question, decoded on its own (see question_bank.py)."""
+        return self.table("questions").get(question_key(role, i))
+
+    def question_difficulties(self, role: str) -> tuple[list[float], list[int]]:
+        """A role's question difficulties, ascending, and the question number of each."""
+        index = self.table("question_difficulty").get(role)
+        return (index["difficulty"], index["ids"]) if index else ([], [])
+
+
+def _stale(out_dir: str) -> bool:
+    if read_manifest(out_dir) is None:
+        return True
+    built = os.stat(os.path.join(out_dir, "manifest.json")).st_mtime_ns
+    return any(os.path.exists(p) and os.stat(p).st_mtime_ns > built for p in SOURCES.values())
+
+
+CHECK_INTERVAL = 1.0  # seconds between checks of the files on disk
+
+_catalog = None
+_catalog_mtime = None
+_checked_at = 0.0
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    """
+    The process-wide catalog: CATALOG_DIR from the environment if set (a prebuilt,
+    shipped catalog), otherwise built from the sources into .cache/catalog and
+    rebuilt when a source changes.
+    """
+    global _catalog, _catalog_mtime, _checked_at
+    if _catalog is not None and time.monotonic() - _checked_at < CHECK_INTERVAL:
+        return _catalog
+    out_dir = os.environ.get("CATALOG_DIR")
+    with _catalog_lock:
+        if out_dir is None:
+            out_dir = CATALOG_DIR
+            if _stale(out_dir):
+                build(out_dir)
+        mtime = os.stat(os.path.join(out_dir, "manifest.json")).st_mtime_ns
+        if _catalog is None or _catalog.path != out_dir or mtime != _catalog_mtime:
+            _catalog = Catalog(out_dir)
+            _catalog_mtime = mtime
+        _checked_at = time.monotonic()
+    return _catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the binary role catalog.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("build", help="compile catalog_src/*.json")
+    b.add_argument("-o", "--output", default=CATALOG_DIR)
+    for name, path in SOURCES.items():
+        b.add_argument(f"--{name}", default=path, help=f"source for the {name} table")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    counts = build(args.output, {name: getattr(args, name) for name in SOURCES})
+    print(", ".join(f"{n} {name}" for name, n in counts.items()) + f" in {time.perf_counter() - start:.2f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# engine/adaptive.py
+import bisect
+import math
+import random
+
+DEFAULT_GUESS = 0.25  # 4-option multiple choice
+GRID = [-4.0 + 0.1 * i for i in range(81)]  # ability values the posterior is kept on
+_LOG_PRIOR = [-t * t / 2 for t in GRID]      # standard normal prior (up to a constant)
+
+
+def p_correct(theta: float, b: float, guess: float = DEFAULT_GUESS) -> float:
+    """Chance that someone of ability theta answers a question of difficulty b correctly (3PL, a=1)."""
+    return guess + (1 - guess) / (1 + math.exp(b - theta))
+
+
+class AdaptiveInterview:
+    """
+    Item-response-theory interview: keeps a posterior over the candidate's
+    ability (expected a posteriori on a grid, standard normal prior), asks the
+    unused question closest to the most informative difficulty for the current
+    estimate, and stops once the estimate's standard error is below target_se
+    (or max_questions were asked).
+
+    difficulties must be sorted ascending, with ids[i] the question number of
+    difficulties[i]. responses replays earlier answers as (question, correct).
+    """
+
+    def __init__(self, difficulties: list[float], ids: list[int], responses=(), max_questions: int = 15,
+                 min_questions: int = 3, target_se: float = 0.7, guess: float = DEFAULT_GUESS,
+                 randomesque: int = 3, rng: random.Random | None = None):
+        self.difficulties = difficulties
+        self.ids = ids
+        self.max_questions = max_questions
+        self.min_questions = min_questions
+        self.target_se = target_se
+        self.guess = guess
+        self.randomesque = randomesque  # pick among the n best questions, so sessions differ
+        self.rng = rng or random
+        # for 3PL, information peaks slightly above b
+        self._shift = math.log((1 + math.sqrt(1 + 8 * guess)) / 2)
+        self._difficulty_of = None
+        self.responses = []
+        self._log_post = list(_LOG_PRIOR)
+        for qid, correct in responses:
+            self.record(qid, correct)
+
+    def difficulty(self, qid: int) -> float:
+        if self._difficulty_of is None:
+            self._difficulty_of = dict(zip(self.ids, self.difficulties))
+        return self._difficulty_of[qid]
+
+    def record(self, qid: int, correct: bool):
+        b = self.difficulty(qid)
+        self.responses.append((qid, bool(correct)))
+        for i, theta in enumerate(GRID):
+            p = p_correct(theta, b, self.guess)
+            self._log_post[i] += math.log(p if correct else 1 - p)
+
+    def _posterior(self) -> tuple[float, float]:
+        top = max(self._log_post)
+        w = [math.exp(lp - top) for lp in self._log_post]
+        total = sum(w)
+        mean = sum(wi * t for wi, t in zip(w, GRID)) / total
+        var = sum(wi * (t - mean) ** 2 for wi, t in zip(w, GRID)) / total
+        return mean, math.sqrt(var)
+
+    @property
+    def ability(self) -> float:
+        return self._posterior()[0]
+
+    @property
+    def se(self) -> float:
+        return self._posterior()[1]
+
+    @property
+    def done(self) -> bool:
+        n = len(self.responses)
+        if n >= min(self.max_questions, len(self.ids)):
+            return True
+        return n >= self.min_questions and self.se <= self.target_se
+
+    def next_question(self) -> int | None:
+        """Question number to ask next, or None when the interview is over."""
+        if self.done:
+            return None
+        used = {qid for qid, _ in self.responses}
+        target = self.ability - self._shift
+        lo = bisect.bisect_left(self.difficulties, target)
+        hi = lo
+        best = []
+        # walk outwards from the target difficulty, collecting the nearest unused questions
+        while len(best) < self.randomesque and (lo > 0 or hi < len(self.ids)):
+            take_low = hi >= len(self.ids) or (
+                lo > 0 and target - self.difficulties[lo - 1] <= self.difficulties[hi] - target)
+            if take_low:
+                lo -= 1
+                i = lo
+            else:
+                i = hi
+                hi += 1
+            if self.ids[i] not in used:
+                best.append(self.ids[i])
+        return self.rng.choice(best) if best else None
+
+    def score(self) -> float:
+        """
+        Expected percentage of the role's questions answered correctly: the
+        actual result for the questions asked, the model's estimate for the rest.
+        """
+        if not self.difficulties:
+            return 0.0
+        theta = self.ability
+        expected = sum(p_correct(theta, b, self.guess) for b in self.difficulties)
+        for qid, correct in self.responses:
+            expected += correct - p_correct(theta, self.difficulty(qid), self.guess)
+        return 100 * expected / len(self.difficulties)
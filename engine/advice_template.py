@@ -0,0 +1,114 @@
+# engine/advice_template.py
+import threading
+from collections import OrderedDict
+
+from catalog import get_catalog
+
+DEFAULT_INTERESTS = "AI, Tech"
+DEFAULT_SKILLS = "Python, SQL"
+
+_HEADER = "\nPersonalized AI Career Guidance (Mock)\n\nName: "
+_PATH = "\n\nSuggested Path:\n1. Focus on "
+_PATH_2 = " fundamentals and core projects.\n2. Build 2-3 portfolio projects using "
+_PATH_3 = """.
+3. Target internships / freelance projects to get hands-on experience.
+4. Practice interviews and data-structure basics if applying to tech roles.
+"""
+_ROLE_FOCUS = "\nRole Focus:\n"
+_DISCLAIMER = "\n(Disclaimer: This is a mock response. Enable Gemini for richer AI output.)\n"
+
+
+class RoleFragment:
+    """
+    One role's advice pieces, built on first use of the role: the "learn ..."
+    line per skill of the role. The heading and the missing-skill block are
+    assembled from them per call.
+    """
+
+    __slots__ = ("role", "about", "skill_lines", "complete")
+
+    def __init__(self, career: dict):
+        self.role = role = career["role"]
+        self.about = career["about"]
+        self.skill_lines = {s: f"  * Learn {s}: a core skill for a {role}.\n" for s in career["skills"]}
+        self.complete = f"  * You already have every core skill for a {role}; go deeper with projects.\n"
+
+    def render(self, match, missing) -> str:
+        head = f"- {self.role} ({match}% match): {self.about}\n"
+        if not missing:
+            return head + self.complete
+        return head + "".join(self.skill_lines.get(s) or f"  * Learn {s}.\n" for s in missing)
+
+
+class AdviceTemplate:
+    """
+    Mock advice compiled from the catalog roles: the static text is prebuilt
+    and RoleFragments are made for the roles that actually get matched (the
+    most recent max_fragments kept), so render() only fills the per-profile slots.
+    """
+
+    def __init__(self, careers: list[dict], max_fragments: int = 256):
+        self.careers = careers
+        self.max_fragments = max_fragments
+        self._by_role = None
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fragment(self, role: str) -> RoleFragment | None:
+        """The RoleFragment for a catalog role (None if the role is not in the catalog)."""
+        with self._lock:
+            frag = self._fragments.get(role)
+            if frag is not None:
+                self._fragments.move_to_end(role)
+                return frag
+            if self._by_role is None:
+                self._by_role = {c["role"]: c for c in self.careers}
+            career = self._by_role.get(role)
+            if career is None:
+                return None
+            frag = self._fragments[role] = RoleFragment(career)
+            while len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+            return frag
+
+    def _role_focus(self, top_matches: list[dict]) -> str:
+        lines = [_ROLE_FOCUS]
+        for m in top_matches:
+            frag = self.fragment(m["role"])
+            if frag is None:  # role not in the catalog
+                lines.append(f"- {m['role']} ({m['match']}% match)\n")
+            else:
+                lines.append(frag.render(m["match"], m.get("missing")))
+        return "".join(lines)
+
+    def render(self, profile: dict, top_matches: list[dict] | None = None) -> str:
+        # join once for display; the first entry comes from the list, not from re-splitting the join
+        items = profile.get("interests", [])
+        interests = ", ".join(items)
+        first_interest = items[0].split(",", 1)[0].strip() if interests else "AI"
+        if not interests:
+            interests = DEFAULT_INTERESTS
+        items = profile.get("skills", [])
+        skills = ", ".join(items)
+        first_skill = items[0].split(",", 1)[0].strip() if skills else "Python"
+        if not skills:
+            skills = DEFAULT_SKILLS
+        roles = self._role_focus(top_matches) if top_matches else ""
+        return (
+            f"{_HEADER}{profile.get('name', '')}\nAge: {profile.get('age', '')}"
+            f"\nEducation: {profile.get('education', 'Undergraduate')}\nInterests: {interests}"
+            f"\nCareer Goal: {profile.get('career_goal', 'AI Engineer')}\nCurrent Skills: {skills}"
+            f"{_PATH}{first_interest}{_PATH_2}{first_skill}{_PATH_3}{roles}{_DISCLAIMER}"
+        )
+
+
+_template = None
+
+
+def get_template() -> AdviceTemplate:
+    """The AdviceTemplate for the catalog's roles, compiled on first use (and again if the catalog changes)."""
+    global _template
+    careers = get_catalog().roles()
+    if _template is None or _template.careers is not careers:
+        _template = AdviceTemplate(careers)
+    return _template
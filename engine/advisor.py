@@ -1,41 +1,62 @@
 # engine/advisor.py
-def get_personalized_advice(profile, top_matches, use_mock=True):
+import json
+
+from .advice_template import get_template
+from .llm import MODEL_NAME, generate_stream, iter_chunks
+
+
+def _mock_advice(profile, top_matches=None):
+    # precompiled per catalog role; only the profile slots are filled per call
+    return get_template().render(profile, top_matches)
+
+
+class Restart(str):
+    """
+    A chunk that replaces everything yielded before it: sent when the model
+    fails mid-stream, so consumers drop the partial response before the fallback.
+    """
+
+
+def join_chunks(chunks) -> str:
+    """The text a stream of advice chunks adds up to (honouring Restart chunks)."""
+    parts = []
+    for chunk in chunks:
+        if isinstance(chunk, Restart):
+            parts.clear()
+        parts.append(chunk)
+    return "".join(parts)
+
+
+def _advice_prompt(profile, top_matches) -> str:
+    # canonical JSON, so the prompt (and its cache key) does not depend on dict insertion order
+    return (f"Create personalized career advice for profile: {json.dumps(profile, sort_keys=True, default=str)}"
+            f" and top matches: {json.dumps(top_matches, sort_keys=True, default=str)}")
+
+
+def stream_personalized_advice(profile, top_matches, use_mock=True, model=None, model_name=MODEL_NAME):
+    """
+    get_personalized_advice() as a generator of text chunks, so the page can show
+    the advice as it is generated. The mock path yields its text in the same
+    chunked form. If the model fails, a Restart chunk (the error notice)
+    precedes the mock advice; anything accumulated before it must be discarded.
+    """
+    if use_mock:
+        yield from iter_chunks(_mock_advice(profile, top_matches))
+        return
+    try:
+        yield from generate_stream(_advice_prompt(profile, top_matches), model_name=model_name, model=model)
+    except Exception as e:
+        yield Restart(f"⚠️ Error calling Gemini: {e}\n\nFalling back to mock advice.\n")
+        yield from iter_chunks(_mock_advice(profile, top_matches))
+
+
+def get_personalized_advice(profile, top_matches, use_mock=True, model=None, model_name=MODEL_NAME):
     """
     Mock-first personalized advice. If use_mock=False and Gemini configured,
-    it will attempt to call Gemini (not invoked by default).
+    it will attempt to call Gemini (not invoked by default). Gemini responses
+    are cached by prompt (see engine.llm); `model` overrides the client.
     """
     if use_mock:
-        interests = ", ".join(profile.get("interests", [])) or "AI, Tech"
-        education = profile.get("education", "Undergraduate")
-        career_goal = profile.get("career_goal", "AI Engineer")
-        skills = ", ".join(profile.get("skills", [])) or "Python, SQL"
-
-        advice = f"""
-Personalized AI Career Guidance (Mock)
-
-Name: {profile.get('name','')}
-Age: {profile.get('age','')}
-Education: {education}
-Interests: {interests}
-Career Goal: {career_goal}
-Current Skills: {skills}
-
-Suggested Path:
-1. Focus on {interests.split(',')[0].strip()} fundamentals and core projects.
-2. Build 2-3 portfolio projects using {skills.split(',')[0].strip()}.
-3. Target internships / freelance projects to get hands-on experience.
-4. Practice interviews and data-structure basics if applying to tech roles.
-
-(Disclaimer: This is a mock response. Enable Gemini for richer AI output.)
-"""
-        return advice
-    else:
-        # Placeholder for real Gemini call (keep existing code in planner.py for reference)
-        try:
-            from google.generativeai import generativelanguage as genai
-            prompt = f"Create personalized career advice for profile: {profile} and top matches: {top_matches}"
-            model = genai.models.get("gemini-1.5-pro")
-            response = model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"⚠️ Error calling Gemini: {e}\n\nFalling back to mock advice.\n" + get_personalized_advice(profile, top_matches, use_mock=True)
+        return _mock_advice(profile, top_matches)  # skip chunking when nobody streams
+    return join_chunks(stream_personalized_advice(profile, top_matches, use_mock, model=model, model_name=model_name))
+
@@ -0,0 +1,166 @@
+# engine/llm.py
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+MODEL_NAME = "gemini-1.5-pro"
+LLM_CACHE_PATH = os.path.join(".cache", "llm_cache.sqlite")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Whitespace-insensitive form of a prompt (indentation, blank lines, runs of spaces)."""
+    return "\n".join(" ".join(line.split()) for line in prompt.strip().splitlines() if line.strip())
+
+
+class LLMCache:
+    """
+    Persistent, content-addressed cache of model responses: the key is the SHA-256
+    of model name + normalized prompt. Entries expire after `ttl` seconds and the
+    least recently used are evicted beyond `max_entries`. Hits note their access
+    time in memory and write them in one batch every `flush_every` entries or
+    `flush_interval` seconds (and before evicting).
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH, ttl: float = 7 * 24 * 3600, max_entries: int = 5000,
+                 flush_every: int = 64, flush_interval: float = 30.0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.stats = {"hits": 0, "misses": 0}
+        self._accessed = {}  # key -> last access time not yet written
+        self._flushed_at = time.monotonic()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                text TEXT,
+                created_at REAL,
+                last_access REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_by_access ON responses (last_access)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_by_age ON responses (created_at)")
+        self._db.commit()
+        # kept up to date on put, recounted when it looks over max_entries (other processes share the file)
+        self._count = self._recount()
+
+    def _recount(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(prompt: str, model_name: str) -> str:
+        return hashlib.sha256(f"{model_name}\n{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str, model_name: str) -> str | None:
+        key = self.key(prompt, model_name)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT text, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] >= self.ttl:
+                self.stats["misses"] += 1
+                return None
+            self._accessed[key] = now
+            if len(self._accessed) >= self.flush_every or time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._flush()
+            self.stats["hits"] += 1
+            return row[0]
+
+    def _flush(self):
+        """Write the pending access times in one transaction (lock held)."""
+        self._flushed_at = time.monotonic()
+        if not self._accessed:
+            return
+        self._db.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                             ((t, k) for k, t in self._accessed.items()))
+        self._db.commit()
+        self._accessed.clear()
+
+    def flush(self):
+        """Write access times noted by cache hits that are still only in memory."""
+        with self._lock:
+            self._flush()
+
+    def put(self, prompt: str, model_name: str, text: str):
+        key = self.key(prompt, model_name)
+        now = time.time()
+        with self._lock:
+            db = self._db
+            if db.execute("SELECT 1 FROM responses WHERE key = ?", (key,)).fetchone() is None:
+                self._count += 1
+            db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", (key, model_name, text, now, now))
+            self._accessed.pop(key, None)
+            self._count -= db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)).rowcount
+            if self._count > self.max_entries:
+                self._count = self._recount()
+            if self._count > self.max_entries:
+                self._flush()  # evict by the real access order
+                self._count -= db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                    (self._count - self.max_entries,),
+                ).rowcount
+            db.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """The process-wide response cache (shared by the orchestrator's worker threads)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache()
+    return _cache
+
+
+def get_model(model_name: str = MODEL_NAME):
+    import google.generativeai as genai  # heavy import, only paid when a model is actually called
+    return genai.GenerativeModel(model_name)
+
+
+_CHUNK_RE = re.compile(r"\s*\S+\s*")
+
+
+def iter_chunks(text: str, words: int = 4):
+    """text in chunks of a few words each (joined back they are exactly text)."""
+    pieces = _CHUNK_RE.findall(text)
+    if not pieces:
+        if text:
+            yield text
+        return
+    for i in range(0, len(pieces), words):
+        yield "".join(pieces[i:i + words])
+
+
+def generate_stream(prompt: str, model_name: str = MODEL_NAME, model=None, cache: LLMCache | None = None):
+    """
+    Text of the model's response to prompt, yielded in chunks as they arrive
+    (model.generate_content(prompt, stream=True) -> iterable of chunks with .text).
+    Served from the response cache when the same (normalized) prompt was already
+    asked of the same model, replayed in chunks; a response is only cached once
+    it has been streamed completely. `model` defaults to the Gemini model; pass
+    a fake client in tests.
+    """
+    cache = cache or get_llm_cache()
+    text = cache.get(prompt, model_name)
+    if text is not None:
+        yield from iter_chunks(text)
+        return
+    model = model or get_model(model_name)
+    parts = []
+    for chunk in model.generate_content(prompt, stream=True):
+        if chunk.text:
+            parts.append(chunk.text)
+            yield chunk.text
+    if parts:  # an empty response is not worth replaying
+        cache.put(prompt, model_name, "".join(parts))
@@ -1,100 +1,245 @@
 # engine/matcher.py
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-CAREERS = [
-    {
-        "role": "Data Scientist",
-        "skills": ["python", "machine learning", "statistics", "sql"],
-        "about": "Analyze data, build ML models, and derive insights."
-    },
-    {
-        "role": "Backend Developer",
-        "skills": ["python", "django", "sql", "api"],
-        "about": "Build and maintain the server side of web apps."
-    },
-    {
-        "role": "Frontend Developer",
-        "skills": ["javascript", "react", "css", "html"],
-        "about": "Design and implement user interfaces for web apps."
-    },
-    {
-        "role": "Full Stack Developer",
-        "skills": ["javascript", "react", "node.js", "sql", "api"],
-        "about": "Work on both frontend and backend of applications."
-    },
-    {
-        "role": "AI Engineer",
-        "skills": ["python", "deep learning", "ml", "data pipelines"],
-        "about": "Build AI-powered products using ML models."
-    },
-    {
-        "role": "Machine Learning Engineer",
-        "skills": ["python", "tensorflow", "pytorch", "mlops"],
-        "about": "Design, train, and deploy ML systems at scale."
-    },
-    {
-        "role": "DevOps Engineer",
-        "skills": ["linux", "docker", "kubernetes", "ci/cd", "aws"],
-        "about": "Automate infrastructure, CI/CD, and cloud deployments."
-    },
-    {
-        "role": "Cloud Architect",
-        "skills": ["aws", "azure", "gcp", "networking", "terraform"],
-        "about": "Design and manage scalable cloud solutions."
-    },
-    {
-        "role": "Cybersecurity Analyst",
-        "skills": ["networking", "linux", "python", "security"],
-        "about": "Protect systems and networks from cyber threats."
-    },
-    {
-        "role": "Blockchain Developer",
-        "skills": ["solidity", "ethereum", "smart contracts", "web3"],
-        "about": "Build decentralized applications and smart contracts."
-    },
-    {
-        "role": "Data Engineer",
-        "skills": ["python", "sql", "spark", "etl", "airflow"],
-        "about": "Design and maintain large-scale data pipelines."
-    },
-    {
-        "role": "Mobile App Developer",
-        "skills": ["kotlin", "swift", "flutter", "react native"],
-        "about": "Build apps for Android and iOS platforms."
-    },
-    {
-        "role": "Game Developer",
-        "skills": ["c++", "unity", "unreal engine", "3d modeling"],
-        "about": "Create interactive video games and simulations."
-    },
-    {
-        "role": "Product Manager",
-        "skills": ["communication", "strategy", "market research", "agile"],
-        "about": "Define product vision, strategy, and manage delivery."
-    },
-    {
-        "role": "UI/UX Designer",
-        "skills": ["figma", "adobe xd", "prototyping", "usability testing"],
-        "about": "Design user-centered interfaces and experiences."
-    },
-    {
-        "role": "Digital Marketing Specialist",
-        "skills": ["seo", "content", "analytics", "social media"],
-        "about": "Promote products/services through digital channels."
-    }
-]
-
-
-def match_careers(user_skills: list[str]) -> list[dict]:
-    matches = []
-    user_skills_set = set([s.lower() for s in user_skills])
-    for c in CAREERS:
-        have = len([s for s in c["skills"] if s.lower() in user_skills_set])
-        match_score = int((have / len(c["skills"])) * 100)
-        missing = [s for s in c["skills"] if s.lower() not in user_skills_set]
-        matches.append({
+import numpy as np
+from scipy import sparse
+
+from catalog import get_catalog
+from skill_normalizer import SkillCanonicalizer, get_canonicalizer
+
+
+def get_careers() -> list[dict]:
+    """Every role of the catalog (see catalog.py), in catalog order."""
+    return get_catalog().roles()
+
+
+def __getattr__(name):
+    # CAREERS used to be a literal in this module; it is the catalog's role list now
+    if name == "CAREERS":
+        return get_careers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class CareerIndex:
+    """
+    Roles compiled once into a sparse role x skill count matrix, so scoring a
+    user is one sparse mat-vec plus a top-k selection. Skills are compared by
+    canonical skill ID, so aliases ('ml' / 'machine learning') match. Role skills
+    missing from the skills database get IDs in the index's own copy of the
+    canonicalizer; the shared one is never modified.
+    """
+
+    def __init__(self, careers: list[dict], canon: SkillCanonicalizer | None = None):
+        self.careers = careers
+        self.base_canon = canon or get_canonicalizer()
+        self.canon = self.base_canon.extended(s for c in careers for s in c["skills"])
+        self.vocab = {}  # canonical skill id -> column
+        self.role_skill_ids = []  # per role, canonical id of each listed skill
+        rows, cols = [], []
+        for r, c in enumerate(careers):
+            ids = [self.canon.lookup(s) for s in c["skills"]]
+            self.role_skill_ids.append(ids)
+            for cid in ids:
+                rows.append(r)
+                cols.append(self.vocab.setdefault(cid, len(self.vocab)))
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(careers), len(self.vocab)),
+        )  # duplicate (role, skill) pairs are summed, like counting them twice
+        self.sizes = np.array([max(len(c["skills"]), 1) for c in careers], dtype=np.float64)
+        # rank by score, then catalog order (same as a stable sort)
+        self._tiebreak = np.arange(len(careers), dtype=np.int64)
+        # inverted index: skill column -> (role ids, counts), straight from the CSC layout
+        self.postings = self.matrix.tocsc()
+        # order of roles that share no skill with the user (all score 0)
+        self._zero_order = self._tiebreak
+
+    @classmethod
+    def from_json(cls, path: str) -> "CareerIndex":
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def _columns(self, user_skills: list[str]) -> set[int]:
+        return {self.vocab.get(cid) for cid in self.canon.ids(user_skills)} - {None}
+
+    def user_vector(self, user_skills: list[str]) -> np.ndarray:
+        u = np.zeros(len(self.vocab), dtype=np.float64)
+        u[list(self._columns(user_skills))] = 1.0
+        return u
+
+    def scores(self, user_skills: list[str]) -> np.ndarray:
+        have = self.matrix @ self.user_vector(user_skills)
+        return ((have / self.sizes) * 100).astype(np.int64)
+
+    def _top(self, scores: np.ndarray, top_k: int | None) -> np.ndarray:
+        n = len(scores)
+        key = scores * n - self._tiebreak  # unique, larger is better
+        if top_k is not None and top_k < n:
+            idx = np.argpartition(-key, top_k)[:top_k]
+        else:
+            idx = np.arange(n)
+        return idx[np.argsort(-key[idx])]
+
+    def _result(self, r: int, score: int, user_ids: set[int]) -> dict:
+        c = self.careers[r]
+        return {
             "role": c["role"],
-            "match": match_score,
+            "match": int(score),
             "about": c["about"],
-            "missing": missing
+            "missing": [s for s, cid in zip(c["skills"], self.role_skill_ids[r]) if cid not in user_ids],
+        }
+
+    def _candidate_scores(self, user_skills: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """(role ids, scores) for the roles sharing at least one skill with the user."""
+        cols = sorted(self._columns(user_skills))
+        indptr, indices, data = self.postings.indptr, self.postings.indices, self.postings.data
+        roles = np.concatenate([indices[indptr[c]:indptr[c + 1]] for c in cols] or [np.empty(0, np.int32)])
+        counts = np.concatenate([data[indptr[c]:indptr[c + 1]] for c in cols] or [np.empty(0)])
+        roles, inverse = np.unique(roles, return_inverse=True)
+        have = np.bincount(inverse, weights=counts, minlength=len(roles))
+        return roles.astype(np.int64), ((have / self.sizes[roles]) * 100).astype(np.int64)
+
+    def _top_candidates(self, roles: np.ndarray, scores: np.ndarray, top_k: int | None) -> list[tuple[int, int]]:
+        """
+        Top-k (role, score) from the scores of the roles sharing a skill with the
+        user; the rest is filled from the zero-score ordering. Same result as _top().
+        """
+        n = len(self.careers)
+        top_k = n if top_k is None else min(top_k, n)
+        positive = scores > 0
+        roles, scores = roles[positive], scores[positive]
+        key = scores * n - roles
+        sel = np.argpartition(-key, top_k)[:top_k] if top_k < len(roles) else np.arange(len(roles))
+        sel = sel[np.argsort(-key[sel])]
+        top = [(int(roles[i]), int(scores[i])) for i in sel]
+        if len(top) < top_k:
+            taken = set(roles.tolist())
+            for r in self._zero_order:
+                if len(top) >= top_k:
+                    break
+                if r not in taken:
+                    top.append((int(r), 0))
+        return top
+
+    def _top_sparse(self, user_skills: list[str], top_k: int) -> list[tuple[int, int]]:
+        """Top-k (role, score) touching only roles that share a skill with the user."""
+        return self._top_candidates(*self._candidate_scores(user_skills), top_k)
+
+    def match(self, user_skills: list[str], top_k: int | None = None) -> list[dict]:
+        user_ids = self.canon.ids(user_skills)
+        if top_k is not None and top_k < len(self.careers):
+            top = self._top_sparse(user_skills, top_k)
+        else:
+            scores = self.scores(user_skills)
+            top = [(r, scores[r]) for r in self._top(scores, top_k)]
+        return [self._result(r, score, user_ids) for r, score in top]
+
+    def user_matrix(self, skill_lists: list[list[str]]) -> sparse.csr_matrix:
+        rows, cols = [], []
+        for i, user_skills in enumerate(skill_lists):
+            for col in self._columns(user_skills):
+                rows.append(i)
+                cols.append(col)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(skill_lists), len(self.vocab)),
+        )
+
+    def match_batch(self, skill_lists: list[list[str]], top_k: int | None = 3,
+                    info: dict | None = None) -> list[list[dict]]:
+        """
+        match() for many users at once: one sparse (users x skills) @ (skills x roles)
+        product, kept sparse, so memory follows the (user, role) pairs that share a
+        skill rather than users x roles. If an info dict is passed it receives the
+        product's nonzeros (product_nnz) and size in bytes (product_bytes).
+        """
+        if not skill_lists or len(self.careers) == 0:
+            return [[] for _ in skill_lists]
+        have = (self.user_matrix(skill_lists) @ self.matrix.T).tocsr()
+        if info is not None:
+            info["product_nnz"] = int(have.nnz)
+            info["product_bytes"] = int(have.data.nbytes + have.indices.nbytes + have.indptr.nbytes)
+
+        results = []
+        for i, user_skills in enumerate(skill_lists):
+            lo, hi = have.indptr[i], have.indptr[i + 1]
+            roles = have.indices[lo:hi].astype(np.int64)
+            scores = ((have.data[lo:hi] / self.sizes[roles]) * 100).astype(np.int64)
+            user_ids = self.canon.ids(user_skills)
+            top = self._top_candidates(roles, scores, top_k)
+            results.append([self._result(r, score, user_ids) for r, score in top])
+        return results
+
+_INDEX = None
+
+
+def get_index() -> CareerIndex:
+    """CareerIndex over the catalog roles, compiled on first use (and again if the catalog or skill registry reloads)."""
+    global _INDEX
+    careers = get_careers()
+    if _INDEX is None or _INDEX.careers is not careers or _INDEX.base_canon is not get_canonicalizer():
+        _INDEX = CareerIndex(careers)
+    return _INDEX
+
+
+def match_careers(user_skills: list[str], top_k: int | None = None) -> list[dict]:
+    """
+    Score every role against user_skills; returns roles sorted by match (best
+    first), or only the best top_k. Each result has role, match, about, missing.
+    """
+    return get_index().match(user_skills, top_k)
+
+
+_WORKER_INDEX = None
+
+
+def _init_worker(careers: list[dict]):
+    global _WORKER_INDEX
+    _WORKER_INDEX = CareerIndex(careers)
+
+
+def _match_chunk(args):
+    skill_lists, top_k = args
+    info = {}
+    return _WORKER_INDEX.match_batch(skill_lists, top_k, info=info), info
+
+
+def match_careers_batch(skill_lists: list[list[str]], top_k: int | None = 3, chunk_size: int = 2048,
+                        workers: int | None = None, stats: dict | None = None) -> list[list[dict]]:
+    """
+    Top-k career matches for many skill lists (one list of results per input).
+    Profiles are scored chunk_size at a time; with workers > 1 the chunks are
+    spread over a process pool. If a stats dict is passed it receives
+    profiles, chunks, seconds and profiles_per_sec, plus what they were measured
+    on: roles, chunk_size, and the largest per-chunk score product
+    (max_product_nnz, max_product_bytes) a worker held in memory.
+    """
+    start = time.perf_counter()
+    index = get_index()
+    chunks = [skill_lists[i:i + chunk_size] for i in range(0, len(skill_lists), chunk_size)]
+
+    if workers and workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index.careers,)) as pool:
+            outputs = list(pool.map(_match_chunk, [(chunk, top_k) for chunk in chunks]))
+    else:
+        outputs = []
+        for chunk in chunks:
+            info = {}
+            outputs.append((index.match_batch(chunk, top_k, info=info), info))
+
+    results = [r for chunk_results, _ in outputs for r in chunk_results]
+    if stats is not None:
+        seconds = time.perf_counter() - start
+        stats.update({
+            "profiles": len(skill_lists),
+            "chunks": len(chunks),
+            "seconds": seconds,
+            "profiles_per_sec": len(skill_lists) / seconds if seconds > 0 else float("inf"),
+            "roles": len(index.careers),
+            "chunk_size": chunk_size,
+            "max_product_nnz": max((info.get("product_nnz", 0) for _, info in outputs), default=0),
+            "max_product_bytes": max((info.get("product_bytes", 0) for _, info in outputs), default=0),
         })
-    return sorted(matches, key=lambda m: m["match"], reverse=True)
+    return results
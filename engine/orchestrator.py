@@ -0,0 +1,237 @@
+# engine/orchestrator.py
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from .advisor import Restart, stream_personalized_advice
+from .planner import stream_learning_plan
+
+DEFAULT_TIMEOUTS = {"advice": 60.0, "plan": 90.0, "report": 30.0}
+MAX_PARALLEL = 4   # steps of one analysis running at once (advice + 3 plans)
+MAX_WORKERS = 32   # shared pool: room for MAX_WORKERS // MAX_PARALLEL analyses at full speed
+POLL_INTERVAL = 0.1  # seconds between cancellation checks while a stream is silent
+
+_DONE = object()  # end of a chunk queue
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all analyses (the steps are I/O-bound model calls)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="analysis")
+    return _executor
+
+
+class Analysis:
+    """
+    One running analysis: advice for the top matches and a learning plan per top
+    role run concurrently (at most max_parallel at a time), then the PDF report
+    is assembled from whatever finished. Each step has its own timeout, counted
+    from when the step starts running, not while it waits for a pool worker; a
+    step that times out or is cancelled is recorded in errors, and the others
+    carry on.
+    """
+
+    def __init__(self, profile: dict, matches: list[dict], top_n: int = 3, use_mock: bool = True,
+                 model=None, timeouts: dict | None = None, executor: ThreadPoolExecutor | None = None,
+                 render: bool = True, max_parallel: int = MAX_PARALLEL):
+        self.profile = profile
+        self.matches = matches
+        self.roles = [m["role"] for m in matches[:top_n]]
+        self.use_mock = use_mock
+        self.model = model
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.render = render
+        self.errors = {}
+        self.timings = {}
+        self.advice = None
+        self.plans = {}
+        self.report = None
+        self._executor = executor or get_executor()
+        self._slots = threading.Semaphore(max_parallel)
+        self._futures = {}
+        self._stops = {}
+        self._running = {}  # name -> Event, set once the step starts running (or finishes unstarted)
+        self._began = {}    # name -> monotonic time the step started running
+        self._cancelled = threading.Event()
+        self._chunks = queue.Queue()
+        self._start = time.monotonic()
+
+        self._steps = [("advice", self._advice, self.timeouts["advice"], ())]
+        self._steps += [(f"plan:{role}", self._plan, self.timeouts["plan"], (role,)) for role in self.roles]
+        self._done = threading.Event()
+        threading.Thread(target=self._coordinate, name="analysis-coordinator", daemon=True).start()
+
+    # ---------- steps (run on the pool) ----------
+    def _submit(self, name, fn, timeout, *args):
+        """Run a step on the pool once one of this analysis' slots is free (None if cancelled meanwhile)."""
+        self._slots.acquire()  # blocks the coordinator, never a pool worker
+        if self._cancelled.is_set():
+            self._slots.release()
+            return None
+        self._stops[name] = threading.Event()
+        running = self._running[name] = threading.Event()
+
+        def finished(_):
+            running.set()  # also wakes _collect for a step cancelled before it started
+            self._slots.release()
+
+        fut = self._futures[name] = self._executor.submit(self._timed, name, fn, timeout, *args)
+        fut.add_done_callback(finished)
+        return fut
+
+    def _timed(self, name, fn, timeout, *args):
+        start = self._began[name] = time.monotonic()
+        self._running[name].set()
+        try:
+            return fn(name, start + timeout, *args)
+        finally:
+            self.timings[name] = time.monotonic() - start
+
+    def _consume(self, name, stream, deadline, sink=None) -> str:
+        # the stream is read on its own thread, so a stalled model call cannot hold
+        # this step past its deadline; the reader closes the stream once told to stop
+        stop = self._stops[name]
+        chunks = queue.Queue()
+        threading.Thread(target=self._read, args=(stream, stop, chunks), name=f"{name}-reader", daemon=True).start()
+        parts = []
+        try:
+            while True:
+                if stop.is_set():
+                    raise CancelledError(name)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{name} timed out")
+                try:
+                    chunk = chunks.get(timeout=min(remaining, POLL_INTERVAL))
+                except queue.Empty:
+                    continue
+                if chunk is _DONE:
+                    break
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                if isinstance(chunk, Restart):
+                    parts.clear()
+                parts.append(chunk)
+                if sink is not None:
+                    sink.put(chunk)
+        finally:
+            stop.set()
+        return "".join(parts)
+
+    @staticmethod
+    def _read(stream, stop, chunks):
+        try:
+            for chunk in stream:
+                if stop.is_set():
+                    break
+                chunks.put(chunk)
+        except BaseException as e:
+            chunks.put(e)
+        finally:
+            stream.close()  # stops the model stream; partial responses are never cached
+            chunks.put(_DONE)
+
+    def _advice(self, name, deadline):
+        try:
+            stream = stream_personalized_advice(self.profile, self.matches[:3], use_mock=self.use_mock, model=self.model)
+            return self._consume(name, stream, deadline, sink=self._chunks)
+        finally:
+            self._chunks.put(_DONE)
+
+    def _plan(self, name, deadline, role):
+        stream = stream_learning_plan(self.profile.get("skills", []), role, model=self.model, use_mock=self.use_mock)
+        return self._consume(name, stream, deadline)
+
+    def _report(self, name, deadline):
+        from pdf_report import render_report  # reportlab loads on first report
+        return render_report(self.profile, self.matches, self.advice, plans=self.plans or None)
+
+    # ---------- coordination ----------
+    def _collect(self, name, fut, timeout):
+        self._running[name].wait()  # queued steps have not used any of their time yet
+        began = self._began.get(name)
+        remaining = began + timeout - time.monotonic() if began is not None else 0
+        try:
+            return fut.result(timeout=max(remaining, 0))
+        except Exception as e:  # TimeoutError / CancelledError / step failure
+            if not fut.done():
+                self._stops[name].set()
+                fut.cancel()
+                e = TimeoutError(f"{name} timed out")
+            self.errors[name] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            return None
+
+    def _coordinate(self):
+        try:
+            for name, fn, timeout, args in self._steps:
+                if self._submit(name, fn, timeout, *args) is None:
+                    self.errors[name] = "CancelledError"
+            for name, fn, timeout, args in self._steps:
+                if name not in self._futures:
+                    continue
+                result = self._collect(name, self._futures[name], timeout)
+                if name == "advice":
+                    self.advice = result
+                elif result is not None:
+                    self.plans[name.split(":", 1)[1]] = result
+            if not self.render or self._cancelled.is_set():
+                return
+            if self.advice is None:
+                self.errors["report"] = "skipped: no advice"
+                return
+            fut = self._submit("report", self._report, self.timeouts["report"])
+            if fut is not None:
+                self.report = self._collect("report", fut, self.timeouts["report"])
+        finally:
+            self._chunks.put(_DONE)  # unblock iter_advice() if advice never started
+            self._done.set()
+
+    # ---------- consumer side ----------
+    def iter_advice(self):
+        """
+        Advice chunks as they are generated (ends early if the advice step times
+        out or is cancelled). A Restart chunk means: drop what was shown so far,
+        then carry on.
+        """
+        while True:
+            chunk = self._chunks.get()  # the advice step and the coordinator always end it with _DONE
+            if chunk is _DONE:
+                return
+            yield chunk
+
+    def cancel(self):
+        """Stop every step that is still running; finished results are kept."""
+        self._cancelled.set()
+        for stop in list(self._stops.values()):
+            stop.set()
+        for fut in list(self._futures.values()):
+            fut.cancel()
+
+    def result(self, timeout: float | None = None) -> dict:
+        """Wait for the analysis to finish and return its outputs."""
+        self._done.wait(timeout)
+        return {
+            "advice": self.advice,
+            "plans": dict(self.plans),
+            "report": self.report,
+            "errors": dict(self.errors),
+            "timings": dict(self.timings),
+            "seconds": time.monotonic() - self._start,
+        }
+
+
+def start_analysis(profile: dict, matches: list[dict], **kwargs) -> Analysis:
+    """Kick off the advice / plan / report steps for one analysis and return its handle."""
+    return Analysis(profile, matches, **kwargs)
+
+
+def run_analysis(profile: dict, matches: list[dict], **kwargs) -> dict:
+    """Blocking start_analysis(): wall time is set by the slowest step, not the sum."""
+    return start_analysis(profile, matches, **kwargs).result()
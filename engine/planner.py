@@ -1,12 +1,46 @@
-import google.generativeai as genai
+from .llm import MODEL_NAME, generate_stream, iter_chunks
 
-def generate_learning_plan(user_skills: list[str], target_role: str) -> str:
-    prompt = f"""
+
+def _plan_prompt(user_skills: list[str], target_role: str) -> str:
+    return f"""
     The user has these skills: {", ".join(user_skills)}.
     They want to become a {target_role}.
     Make a 3-month step-by-step learning roadmap with milestones.
     Show clear weekly tasks and goals.
     """
-    model = genai.GenerativeModel("gemini-1.5-pro")
-    response = model.generate_content(prompt)
-    return response.text
+
+
+def _mock_plan(user_skills: list[str], target_role: str) -> str:
+    skills = ", ".join(user_skills) or "your current skills"
+    return f"""
+3-Month Learning Roadmap: {target_role} (Mock)
+
+Month 1 - Foundations
+Weeks 1-2: Review {skills} and close gaps in the fundamentals of the role.
+Weeks 3-4: Learn the core tools a {target_role} uses day to day.
+
+Month 2 - Projects
+Weeks 5-8: Build 1-2 portfolio projects typical of a {target_role} and publish them.
+
+Month 3 - Job readiness
+Weeks 9-10: Polish the portfolio and write up what you built.
+Weeks 11-12: Practice interviews and start applying.
+
+(Disclaimer: This is a mock response. Enable Gemini for richer AI output.)
+"""
+
+
+def stream_learning_plan(user_skills: list[str], target_role: str, model=None, model_name: str = MODEL_NAME,
+                         use_mock: bool = False):
+    """The learning plan as a generator of text chunks, yielded as the model produces them."""
+    if use_mock:
+        yield from iter_chunks(_mock_plan(user_skills, target_role))
+        return
+    # cached by prompt; google.generativeai is only imported on a cache miss
+    yield from generate_stream(_plan_prompt(user_skills, target_role), model_name=model_name, model=model)
+
+
+def generate_learning_plan(user_skills: list[str], target_role: str, model=None, model_name: str = MODEL_NAME,
+                           use_mock: bool = False) -> str:
+    return "".join(stream_learning_plan(user_skills, target_role, model=model, model_name=model_name,
+                                        use_mock=use_mock))
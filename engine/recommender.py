@@ -0,0 +1,142 @@
+# engine/recommender.py
+import heapq
+import math
+import threading
+from collections import Counter
+
+from resource_index import ResourceIndex, get_resource_index
+from skill_registry import get_registry
+
+DEFAULT_MINUTES = 60.0  # cost of a resource whose duration is unknown
+
+
+class ResourceRecommender:
+    """
+    Picks learning resources for a set of missing skills: greedy weighted set
+    cover (most newly covered skills per minute first) within a time budget.
+
+    Each resource's skills are detected once from its title with the registry's
+    SkillMatcher and kept as canonical IDs, together with a skill ID ->
+    resources inverted index, so a recommendation only looks at resources that
+    teach at least one missing skill. New rows of the ResourceIndex are picked
+    up incrementally.
+    """
+
+    def __init__(self, index: ResourceIndex, default_minutes: float = DEFAULT_MINUTES):
+        self.index = index
+        self.default_minutes = default_minutes
+        self._lock = threading.Lock()
+        self._rows = None
+        self._canon = None
+        self.resource_skills = []  # row id -> frozenset of canonical skill IDs
+        self.costs = []            # row id -> minutes used as its cost
+        self.postings = {}         # skill ID -> row ids
+
+    def sync(self) -> tuple:
+        """
+        Index resource rows added since the last call (all of them after a reload).
+        Returns the state to recommend from, taken under the lock:
+        (rows, canon, resource_skills, costs, postings).
+        """
+        registry = get_registry()
+        rows, n = self.index.snapshot()
+        with self._lock:
+            if rows is not self._rows or registry.canon is not self._canon:
+                self._rows, self._canon = rows, registry.canon
+                self.resource_skills, self.costs, self.postings = [], [], {}
+            matcher, canon = registry.matcher, registry.canon
+            for i in range(len(self.resource_skills), n):
+                skills = frozenset(canon.ids(matcher.find(rows[i][2])))
+                minutes = rows[i][5]
+                self.costs.append(max(self.default_minutes if minutes == math.inf else minutes, 1.0))
+                self.resource_skills.append(skills)
+                for sid in skills:
+                    self.postings.setdefault(sid, []).append(i)
+            return self._rows, self._canon, self.resource_skills, self.costs, self.postings
+
+    def cost(self, row_id: int) -> float:
+        return self.costs[row_id]
+
+    def candidates(self, skill_ids: set[int], resource_type: str | None = None, state: tuple | None = None) -> Counter:
+        """Row id -> how many of skill_ids it teaches, for every resource teaching any of them."""
+        rows, _, _, _, postings = state or self.sync()
+        found = Counter()
+        for sid in skill_ids:
+            found.update(postings.get(sid, ()))
+        if resource_type:
+            rtype = resource_type.lower()
+            found = Counter({i: g for i, g in found.items() if rows[i][1] == rtype})
+        return found
+
+    def recommend(self, missing_skills: list[str], budget_minutes: float | None = None,
+                  resource_type: str | None = None) -> dict:
+        """
+        Resources covering missing_skills, cheapest cover first (greedy), with a
+        total duration of at most budget_minutes. Returns the chosen resources
+        (each with the skills it covers), covered and uncovered skills, and minutes.
+        Skills the registry doesn't know can't be taught by any resource and are
+        reported as uncovered.
+        """
+        state = self.sync()
+        rows, canon, resource_skills, costs, _ = state
+        wanted, unknown = set(), set()
+        for s in missing_skills:
+            sid = canon.lookup(s)  # read-only: request data never grows the shared canonicalizer
+            if sid is None:
+                unknown.add(canon.canonical(s))
+            else:
+                wanted.add(sid)
+        uncovered = set(wanted)
+        budget = math.inf if budget_minutes is None else budget_minutes
+        spent = 0.0
+        chosen = []
+
+        # lazy greedy: a resource's gain only shrinks as skills get covered, so a
+        # stale heap entry is re-scored only when it reaches the top
+        heap = [(-gain / costs[i], costs[i], i) for i, gain in self.candidates(uncovered, resource_type, state).items()
+                if costs[i] <= budget]
+        heapq.heapify(heap)
+        while heap and uncovered:
+            neg_ratio, cost, i = heapq.heappop(heap)
+            if spent + cost > budget:
+                continue  # no longer fits; the budget only shrinks
+            gain = len(resource_skills[i] & uncovered)
+            if gain == 0:
+                continue
+            ratio = gain / cost
+            if heap and -heap[0][0] > ratio:
+                heapq.heappush(heap, (-ratio, cost, i))
+                continue
+            covers = resource_skills[i] & uncovered
+            uncovered -= covers
+            spent += cost
+            row = ResourceIndex.as_dict(rows[i])
+            row["covers"] = sorted(canon.name(s) for s in covers)
+            chosen.append(row)
+
+        return {
+            "resources": chosen,
+            "covered": sorted(canon.name(s) for s in wanted - uncovered),
+            "uncovered": sorted({canon.name(s) for s in uncovered} | unknown),
+            "minutes": spent,
+        }
+
+
+_recommender = None
+_recommender_lock = threading.Lock()
+
+
+def get_recommender() -> ResourceRecommender:
+    global _recommender
+    index = get_resource_index()
+    if _recommender is None or _recommender.index is not index:
+        with _recommender_lock:
+            if _recommender is None or _recommender.index is not index:
+                _recommender = ResourceRecommender(index)
+    return _recommender
+
+
+def recommend_resources(missing_skills: list[str], budget_minutes: float | None = None,
+                        resource_type: str | None = None) -> dict:
+    """Smallest-cost set of resources.csv resources covering missing_skills (see ResourceRecommender)."""
+    return get_recommender().recommend(missing_skills, budget_minutes, resource_type)
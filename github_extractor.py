@@ -1,54 +1,243 @@
 import requests
-import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-# Load your skills database from JSON
-with open("skills_database.json", "r") as f:
-    skills_db = json.load(f)
+from requests.adapters import HTTPAdapter
 
-skills_db = set([s.lower() for s in skills_db])  # normalize to lowercase
+from http_cache import HTTPCache, get_default_cache
+from skill_registry import get_registry
 
+GITHUB_API = "https://api.github.com"
 
-def extract_github_skills(username: str, token: str | None = None):
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
 
-    repos_url = f"https://api.github.com/users/{username}/repos"
-    repos_res = requests.get(repos_url, headers=headers)
-    if repos_res.status_code != 200:
-        return []
+class GitHubClient:
+    """
+    Shared HTTP session for GitHub API calls made from a worker pool.
+    Honours Retry-After / X-RateLimit-* headers and a total time budget:
+    once the budget is spent (or the rate limit can't be waited out in time)
+    get() returns None instead of blocking.
+    Responses go through an HTTPCache (ETag / Last-Modified revalidation) unless
+    cache is None.
+    """
 
-    repos = repos_res.json()
+    def __init__(self, token: str | None = None, api_url: str = GITHUB_API,
+                 max_workers: int = 8, time_budget: float = 20.0, request_timeout: float = 10.0,
+                 cache: HTTPCache | None = None):
+        self.api_url = api_url.rstrip("/")
+        self.headers = {"Accept": "application/vnd.github.v3+json"}
+        if token:
+            self.headers["Authorization"] = f"token {token}"
+        self.request_timeout = request_timeout
+        self.cache = cache
+        self.deadline = time.monotonic() + time_budget
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._resume_at = 0.0  # monotonic time before which no request is sent
+        self.exhausted = False  # rate limit or time budget ran out
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def _pause(self, seconds: float):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _wait_turn(self) -> bool:
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            if delay >= self.remaining():
+                self.exhausted = True
+                return False
+            time.sleep(delay)
+        return self.remaining() > 0
+
+    def _note_rate_limit(self, res: requests.Response) -> float | None:
+        """Return how long to back off before retrying, or None if no retry is needed."""
+        retry_after = res.headers.get("Retry-After")
+        if res.status_code in (403, 429) and retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return 1.0
+        if res.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset_in = float(res.headers.get("X-RateLimit-Reset", 0)) - time.time()
+            except ValueError:
+                reset_in = 60.0
+            if res.status_code in (403, 429):
+                return max(reset_in, 1.0)
+            # this request went through but the next one won't
+            self._pause(max(reset_in, 0.0))
+        return None
+
+    def get(self, url: str, headers: dict | None = None, max_retries: int = 3) -> requests.Response | None:
+        if url.startswith("/"):
+            url = self.api_url + url
+        for _ in range(max_retries + 1):
+            if self.exhausted or not self._wait_turn():
+                self.exhausted = True
+                return None
+            req_headers = {**self.headers, **(headers or {})}
+            timeout = min(self.request_timeout, self.remaining())
+            if timeout <= 0:  # budget ran out since _wait_turn; requests rejects a non-positive timeout
+                self.exhausted = True
+                return None
+            try:
+                if self.cache is not None:
+                    res = self.cache.get(url, headers=req_headers, fetch=self.session.get, timeout=timeout)
+                else:
+                    res = self.session.get(url, headers=req_headers, timeout=timeout)
+            except requests.RequestException:
+                return None
+            if getattr(res, "from_cache", False):
+                return res
+            backoff = self._note_rate_limit(res)
+            if backoff is None:
+                return res
+            self._pause(backoff)
+        return None
+
+    def close(self):
+        self.session.close()
+
+    def close_after(self, futures):
+        """Close the session once every future has finished (running workers still use it)."""
+        futures = list(futures)
+        if not futures:
+            self.close()
+            return
+        left = [len(futures)]
+        lock = threading.Lock()
+
+        def finished(_):
+            with lock:
+                left[0] -= 1
+                last = left[0] == 0
+            if last:
+                self.close()
+
+        for fut in futures:
+            fut.add_done_callback(finished)
+
+
+def _repo_skills(client: GitHubClient, owner: str, repo_name: str, registry, skill_ids: frozenset) -> set:
+    canon = registry.canon
     detected = set()
 
-    for repo in repos:
-        repo_name = repo["name"]
-        owner = repo["owner"]["login"]
-
-        # Languages
-        lang_url = f"https://api.github.com/repos/{owner}/{repo_name}/languages"
-        langs_res = requests.get(lang_url, headers=headers).json()
-        for lang in langs_res.keys():
-            if lang.lower() in skills_db:
-                detected.add(lang.lower())
-
-        # Topics
-        topics_url = f"https://api.github.com/repos/{owner}/{repo_name}/topics"
-        topics_res = requests.get(
-            topics_url,
-            headers={**headers, "Accept": "application/vnd.github.mercy-preview+json"},
-        ).json()
-        for topic in topics_res.get("names", []):
-            if topic.lower() in skills_db:
-                detected.add(topic.lower())
-
-        # README
-        readme_url = f"https://api.github.com/repos/{owner}/{repo_name}/readme"
-        readme_res = requests.get(readme_url, headers=headers)
-        if readme_res.status_code == 200:
-            readme_text = requests.get(readme_res.json()["download_url"]).text.lower()
-            for word in skills_db:
-                if word in readme_text:
-                    detected.add(word)
+    # Languages
+    langs_res = client.get(f"/repos/{owner}/{repo_name}/languages")
+    if langs_res is not None and langs_res.status_code == 200:
+        for lang in langs_res.json().keys():
+            cid = canon.lookup(lang)
+            if cid in skill_ids:
+                detected.add(canon.name(cid))
 
+    # Topics
+    topics_res = client.get(
+        f"/repos/{owner}/{repo_name}/topics",
+        headers={"Accept": "application/vnd.github.mercy-preview+json"},
+    )
+    if topics_res is not None and topics_res.status_code == 200:
+        for topic in topics_res.json().get("names", []):
+            cid = canon.lookup(topic)
+            if cid in skill_ids:
+                detected.add(canon.name(cid))
+
+    # README
+    readme_res = client.get(f"/repos/{owner}/{repo_name}/readme")
+    if readme_res is not None and readme_res.status_code == 200:
+        download_url = readme_res.json().get("download_url")
+        raw_res = client.get(download_url) if download_url else None
+        if raw_res is not None and raw_res.status_code == 200:
+            readme_text = raw_res.text.lower()
+            for word in registry.normalized:
+                if word in readme_text and canon.lookup(word) in skill_ids:
+                    detected.add(canon.canonical(word))
+
+    return detected
+
+
+def _iter_repos(client: GitHubClient, username: str, per_page: int = 100):
+    """Yield every repo of username, following the Link: rel="next" pages."""
+    url = f"/users/{username}/repos?per_page={per_page}"
+    while url:
+        res = client.get(url)
+        if res is None or res.status_code != 200:
+            return
+        yield from res.json()
+        url = res.links.get("next", {}).get("url")
+
+
+def iter_github_skills(username: str, token: str | None = None, api_url: str = GITHUB_API,
+                       max_workers: int = 8, time_budget: float = 20.0, use_cache: bool = True,
+                       max_repos: int | None = None, patience: int | None = None,
+                       skills_db: list[str] | None = None):
+    """
+    Yield (repo_full_name, skills) for each repo as soon as it has been scanned.
+    Only skills of the registry are reported (of skills_db, if given).
+    Repo pages are listed lazily while languages, topics and README are fetched
+    concurrently (bounded worker pool, one shared session).
+
+    Stops early after max_repos repos, or once `patience` repos in a row have
+    added no new skill. If the time budget runs out, iteration just ends.
+    Responses are cached on disk (see http_cache) unless use_cache is False.
+    """
+    registry = get_registry()  # one snapshot for the whole scan
+    skill_ids = registry.skill_ids if skills_db is None or skills_db is registry.skills \
+        else frozenset(registry.canon.ids(skills_db)) & registry.skill_ids
+    client = GitHubClient(token, api_url=api_url, max_workers=max_workers, time_budget=time_budget,
+                          cache=get_default_cache() if use_cache else None)
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    repos = _iter_repos(client, username)
+    listing = True
+    submitted = 0
+    seen = set()
+    stale = 0
+    try:
+        while True:
+            # keep the pool busy without listing (much) further than needed
+            while listing and len(pending) < 2 * max_workers:
+                # check the cap first, so no further page is fetched once it is reached
+                repo = None if max_repos is not None and submitted >= max_repos else next(repos, None)
+                if repo is None:
+                    listing = False
+                    break
+                owner, repo_name = repo["owner"]["login"], repo["name"]
+                pending[pool.submit(_repo_skills, client, owner, repo_name, registry, skill_ids)] = f"{owner}/{repo_name}"
+                submitted += 1
+
+            if not pending or client.remaining() <= 0:
+                break
+            done, _ = wait(pending, timeout=client.remaining(), return_when=FIRST_COMPLETED)
+            for fut in done:
+                full_name = pending.pop(fut)
+                if fut.exception() is not None:
+                    continue
+                skills = fut.result()
+                stale = 0 if skills - seen else stale + 1
+                seen |= skills
+                yield full_name, skills
+                if patience is not None and stale >= patience:
+                    return
+    finally:
+        # Stopped early or out of time: drop queued repos, don't wait on in-flight requests,
+        # and close the session only after those have finished with it
+        client.exhausted = client.exhausted or bool(pending)
+        pool.shutdown(wait=False, cancel_futures=True)
+        client.close_after(pending)
+
+
+def extract_github_skills(username: str, token: str | None = None, **kwargs):
+    """
+    All skills found across username's repos (see iter_github_skills for options).
+    """
+    detected = set()
+    for _, skills in iter_github_skills(username, token, **kwargs):
+        detected |= skills
     return list(detected)
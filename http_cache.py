@@ -0,0 +1,240 @@
+# http_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "http_cache.sqlite")
+
+# Response headers worth keeping with a cached body
+_KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+class HTTPCache:
+    """
+    On-disk (SQLite) cache of GET responses keyed by URL + Accept header, plus
+    a hash of the Authorization header, so one token's responses (private repos)
+    are never served to another caller.
+
+    - Entries younger than `ttl` seconds are served without touching the network.
+    - Older entries are revalidated with If-None-Match / If-Modified-Since; a 304
+      refreshes the entry (and on GitHub doesn't count against the rate limit).
+    - Entries not used for `max_age` seconds are dropped, and the least recently
+      used entries are evicted once the stored bodies exceed `max_bytes`;
+      the max_age sweep runs at startup and every `expire_every` stored responses.
+    - Cache hits only note their access time in memory; the notes are written
+      in one batch every `flush_every` hits or `flush_interval` seconds (and
+      before any eviction), so a fully cached scan does not write per request.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = 3600,
+                 max_age: float = 7 * 24 * 3600, max_bytes: int = 50 * 1024 * 1024, expire_every: int = 100,
+                 flush_every: int = 64, flush_interval: float = 30.0):
+        self.path = path
+        self.expire_every = expire_every
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._stores = 0
+        self._accessed = {}  # key -> last access time not yet written
+        self._flushed_at = time.monotonic()
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                last_access REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_by_access ON responses (last_access)")
+        self._db.commit()
+        self._bytes = 0  # running total of stored body sizes, recounted at each expire()
+        self.expire()
+
+    def _count(self, stat: str, n: int = 1):
+        with self._lock:
+            self.stats[stat] += n
+
+    @staticmethod
+    def _key(url: str, headers: dict | None) -> str:
+        headers = headers or {}
+        key = f"{headers.get('Accept', '')} {url}"
+        auth = headers.get("Authorization")
+        if auth:
+            key += " " + hashlib.sha256(auth.encode("utf-8")).hexdigest()
+        return key
+
+    def _load(self, key: str):
+        with self._lock:
+            return self._db.execute(
+                "SELECT url, status, headers, body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+    def _touch(self, key: str, revalidated: bool):
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._accessed.pop(key, None)
+                self._db.execute("UPDATE responses SET fetched_at = ?, last_access = ? WHERE key = ?", (now, now, key))
+                self._db.commit()
+                return
+            self._accessed[key] = now
+            if len(self._accessed) >= self.flush_every or time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._flush()
+
+    def _flush(self):
+        """Write the pending access times in one transaction (lock held)."""
+        self._flushed_at = time.monotonic()
+        if not self._accessed:
+            return
+        self._db.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                             ((t, k) for k, t in self._accessed.items()))
+        self._db.commit()
+        self._accessed.clear()
+
+    def flush(self):
+        """Write access times noted by cache hits that are still only in memory."""
+        with self._lock:
+            self._flush()
+
+    def _store(self, key: str, res: requests.Response):
+        headers = {h: res.headers[h] for h in _KEEP_HEADERS if h in res.headers}
+        body = res.content
+        now = time.time()
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, res.url, res.status_code, json.dumps(headers), body, len(body),
+                 res.headers.get("ETag"), res.headers.get("Last-Modified"), now, now),
+            )
+            self._db.commit()
+            self._accessed.pop(key, None)
+            self._bytes += len(body) - (old[0] if old else 0)
+            self._stores += 1
+            sweep = self._stores % self.expire_every == 0
+        if sweep:
+            self.expire()
+        self._evict_to_size()
+
+    @staticmethod
+    def _to_response(row) -> requests.Response:
+        url, status, headers, body, _, _, _ = row
+        res = requests.Response()
+        res.url = url
+        res.status_code = status
+        res.headers = CaseInsensitiveDict(json.loads(headers))
+        res.encoding = get_encoding_from_headers(res.headers)
+        res._content = body
+        res.from_cache = True
+        return res
+
+    def get(self, url: str, headers: dict | None = None, fetch=None, **kwargs) -> requests.Response:
+        """
+        Cached drop-in for requests.get(url, headers=headers, **kwargs).
+        `fetch` is the function doing the real request (e.g. a Session's .get).
+        Responses served from the cache have `from_cache = True`.
+        """
+        fetch = fetch or requests.get
+        key = self._key(url, headers)
+        row = self._load(key)
+
+        if row is not None and time.time() - row[6] < self.ttl:
+            self._count("hits")
+            self._touch(key, revalidated=False)
+            return self._to_response(row)
+
+        req_headers = dict(headers or {})
+        if row is not None:
+            etag, last_modified = row[4], row[5]
+            if etag:
+                req_headers["If-None-Match"] = etag
+            if last_modified:
+                req_headers["If-Modified-Since"] = last_modified
+
+        res = fetch(url, headers=req_headers, **kwargs)
+        if res.status_code == 304 and row is not None:
+            self._count("revalidated")
+            self._touch(key, revalidated=True)
+            return self._to_response(row)
+
+        self._count("misses")
+        if res.status_code == 200:
+            self._store(key, res)
+        res.from_cache = False
+        return res
+
+    def expire(self):
+        """Drop entries that haven't been used for max_age seconds."""
+        with self._lock:
+            self._flush()
+            cur = self._db.execute("DELETE FROM responses WHERE last_access < ?", (time.time() - self.max_age,))
+            self._db.commit()
+            # resync the running total (other processes may share the file)
+            self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._count("evictions", cur.rowcount)
+
+    def _evict_to_size(self):
+        with self._lock:
+            if self._bytes <= self.max_bytes:
+                return
+            self._flush()  # evict by the real access order
+            evicted = 0
+            while self._bytes > self.max_bytes:
+                rows = self._db.execute("SELECT key, size FROM responses ORDER BY last_access LIMIT 64").fetchall()
+                if not rows:
+                    self._bytes = 0
+                    break
+                for key, size in rows:
+                    if self._bytes <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._bytes -= size
+                    evicted += 1
+            self._db.commit()
+        self._count("evictions", evicted)
+
+    def size(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._accessed.clear()
+            self._bytes = 0
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> HTTPCache:
+    """Process-wide cache shared by the GitHub extractors."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = HTTPCache()
+    return _default_cache
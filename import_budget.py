@@ -0,0 +1,95 @@
+# import_budget.py
+"""
+Import-time budget for the Streamlit app's startup imports.
+
+    python import_budget.py
+    python import_budget.py --budget-ms 150
+
+Runs the top-level imports of streamlit_app.py in a fresh interpreter under
+`python -X importtime` (with streamlit itself preloaded, as it is in the server),
+prints the cumulative cost of each one, and exits non-zero if the total is over
+budget or if a module that should load lazily is imported at startup.
+"""
+import argparse
+import ast
+import subprocess
+import sys
+
+APP = "streamlit_app.py"
+PRELOADED = ["streamlit"]
+# only imported on first use (PDF upload, report export, Gemini, analysis, GitHub import)
+LAZY_MODULES = ["pdfplumber", "reportlab", "google.generativeai", "scipy", "requests"]
+DEFAULT_BUDGET_MS = 250
+
+
+def startup_modules(app: str = APP) -> list[str]:
+    """Modules imported at the top level of app, in order."""
+    with open(app, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def measure(modules: list[str], preloaded: list[str] = PRELOADED) -> list[tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for every module newly imported, from -X importtime."""
+    code = "".join(f"import {m}\n" for m in preloaded)
+    code += "import sys; sys.stderr.write('--- app ---\\n')\n"
+    code += "".join(f"import {m}\n" for m in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+    stderr = proc.stderr.split("--- app ---\n", 1)[-1]
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # one space after the bar, then two more per nesting level
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check the app's cold-start import cost.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--app", default=APP)
+    parser.add_argument("--top", type=int, default=15, help="also list the N most expensive nested imports")
+    args = parser.parse_args(argv)
+
+    modules = startup_modules(args.app)
+    app_modules = [m for m in modules if m not in PRELOADED]
+    rows = measure(app_modules)
+
+    # depth-0 rows are the imports the app triggered directly
+    top_level = {name.strip(): cum for name, _, cum in rows if not name.startswith(" ")}
+    total_ms = sum(top_level.values()) / 1000
+
+    print(f"{'module':40} {'cumulative ms':>14}")
+    for m in app_modules:
+        cost = top_level.get(m)
+        print(f"{m:40} {cost / 1000:14.1f}" if cost is not None else f"{m:40} {'(already loaded)':>14}")
+    print(f"{'total':40} {total_ms:14.1f}   (budget {args.budget_ms:.0f} ms)")
+
+    if args.top:
+        print("\nmost expensive imports (cumulative):")
+        for name, _, cum in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+            print(f"  {cum / 1000:8.1f} ms  {name.strip()}")
+
+    failed = False
+    eager = sorted({name.strip() for name, _, _ in rows
+                    if any(name.strip() == m or name.strip().startswith(m + ".") for m in LAZY_MODULES)})
+    if eager:
+        print(f"\nFAIL: should be lazy but imported at startup: {', '.join(eager[:10])}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\nFAIL: startup imports take {total_ms:.1f} ms, budget is {args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import streamlit as st
-import random
+
+from question_bank import QuestionBank
 
 
 # ---------- STYLING (Matches streamlit.py and styles the question container) ----------
@@ -77,23 +78,6 @@ body {
 """, unsafe_allow_html=True)
 
 
-# ---------- QUESTION BANK (MCQ Format) ----------
-QUESTIONS = {
-    "AI Engineer": [
-        {"question": "What is the primary purpose of a validation set in model training?", "options": ["To train the final model", "To tune hyperparameters", "To test the model after training", "To provide initial data"], "answer": "To tune hyperparameters"},
-        {"question": "Which activation function is most commonly used for output layers in binary classification problems?", "options": ["ReLU", "Tanh", "Sigmoid", "Softmax"], "answer": "Sigmoid"},
-        {"question": "What does the term 'overfitting' mean in machine learning?", "options": ["The model performs poorly on training data.", "The model is too simple to capture the data's complexity.", "The model performs well on training data but poorly on unseen data.", "The model has not been trained for enough epochs."], "answer": "The model performs well on training data but poorly on unseen data."},
-        # ... add more questions to reach 15
-    ],
-    "Data Scientist": [
-        {"question": "What is the main difference between classification and regression?", "options": ["Classification predicts continuous values, regression predicts discrete classes.", "Classification predicts discrete classes, regression predicts continuous values.", "Both predict continuous values.", "Both predict discrete classes."], "answer": "Classification predicts discrete classes, regression predicts continuous values."},
-        {"question": "Which of these is a measure of central tendency?", "options": ["Standard Deviation", "Variance", "Range", "Median"], "answer": "Median"},
-        {"question": "In A/B testing, what is the purpose of the p-value?", "options": ["To determine the sample size.", "To measure the effect size of the change.", "To determine the statistical significance of the results.", "To set the budget for the test."], "answer": "To determine the statistical significance of the results."},
-        # ... add more questions to reach 15
-    ],
-    # Add other roles as needed
-}
-
 # ---------- App Logic ----------
 
 st.markdown("<div class='app-title'>🧠 AI Mock Interview</div>", unsafe_allow_html=True)
@@ -102,46 +86,57 @@ st.markdown("<div class='app-title'>🧠 AI Mock Interview</div>", unsafe_allow_
 if "interview_started" not in st.session_state:
     st.session_state.interview_started = False
 
-if "q_index" not in st.session_state:
-    st.session_state.q_index = 0
-    st.session_state.score = 0
-    st.session_state.user_answers = []
-
 role = st.session_state.get("chosen_career", "Data Scientist")
-all_questions_for_role = QUESTIONS.get(role, QUESTIONS["Data Scientist"])
+# ---------- QUESTION BANK (MCQ Format) ----------
+# questions are read one at a time from the catalog; the session only keeps their numbers
+bank = QuestionBank(st.session_state.get("interview_role", role) if st.session_state.interview_started else role)
 
-# --- Difficulty Selection View ---
+# --- Length Selection View ---
 if not st.session_state.interview_started:
     st.subheader(f"Prepare for your {role} Interview")
     
-    difficulty_options = {
-        "Easy (5 questions)": 5,
-        "Medium (10 questions)": 10,
-        "Hard (15 questions)": 15
+    length_options = {
+        "Quick (up to 5 questions)": 5,
+        "Standard (up to 10 questions)": 10,
+        "Thorough (up to 15 questions)": 15
     }
-    selected_diff = st.selectbox("Select Difficulty", difficulty_options.keys())
-    num_questions = difficulty_options[selected_diff]
+    selected_length = st.selectbox("Select Interview Length", length_options.keys(), index=2)
+    st.caption("Questions adapt to your answers, and the interview ends as soon as your level is clear.")
     
     if st.button("Start Interview"):
-        random.shuffle(all_questions_for_role)
-        st.session_state.questions = all_questions_for_role[:num_questions]
+        st.session_state.interview_role = bank.role
+        st.session_state.max_questions = length_options[selected_length]
+        st.session_state.question_ids = []  # asked so far, including the one on screen
+        st.session_state.correct = []       # whether each answered question was right
+        st.session_state.user_answers = []
+        st.session_state.score = 0
+        st.session_state.interview_done = False
         st.session_state.interview_started = True
         st.rerun()
 
 # --- Question View ---
-elif st.session_state.q_index < len(st.session_state.get("questions", [])):
-    questions = st.session_state.questions
-    q_data = questions[st.session_state.q_index]
+elif not st.session_state.interview_done:
+    question_ids, correct = st.session_state.question_ids, st.session_state.correct
+    if len(question_ids) == len(correct):
+        # previous question answered: the engine replays the answers and picks the next one
+        interview = bank.interview(zip(question_ids, correct), max_questions=st.session_state.max_questions)
+        next_id = interview.next_question()
+        if next_id is None:
+            st.session_state.interview_done = True
+            st.rerun()
+        question_ids.append(next_id)
+    q_index = len(correct)
+    q_data = bank[question_ids[q_index]]
     
     # Use st.container with a border to create the card, styled by the CSS above
     with st.container(border=True):
-        st.markdown(f"<p class='q-progress'>Question {st.session_state.q_index + 1} / {len(questions)}</p>", unsafe_allow_html=True)
+        st.markdown(f"<p class='q-progress'>Question {q_index + 1} (up to {st.session_state.max_questions})</p>", unsafe_allow_html=True)
         st.markdown(f"<p class='q-text'>{q_data['question']}</p>", unsafe_allow_html=True)
 
         user_choice = st.radio(
             "Select your answer:",
             q_data["options"],
-            key=f"q_{st.session_state.q_index}",
+            key=f"q_{q_index}",
             index=None # No default selection
         )
 
@@ -149,29 +144,35 @@ elif st.session_state.q_index < len(st.session_state.get("questions", [])):
 
         if st.button("Submit Answer ➡️"):
             if user_choice:
-                st.session_state.user_answers.append(user_choice)
-                if user_choice == q_data["answer"]:
+                st.session_state.user_answers.append(q_data["options"].index(user_choice))
+                correct.append(user_choice == q_data["answer"])
+                if correct[-1]:
                     st.session_state.score += 1
                 
-                st.session_state.q_index += 1
                 st.rerun()
             else:
                 st.warning("Please select an answer before submitting.")
         
 # --- Results View ---
 else:
-    total_questions = len(st.session_state.get("questions", []))
+    total_questions = len(st.session_state.correct)
     if total_questions > 0:
-        final_score = (st.session_state.score / total_questions) * 100
+        # share of the role's whole question bank the candidate would get right (estimated for unasked ones);
+        # the raw count is not comparable across candidates, since questions were picked to match each level
+        interview = bank.interview(zip(st.session_state.question_ids, st.session_state.correct))
+        final_score = interview.score()
 
-        # --- Save score to session state ---
+        # --- Save score to session state (the estimate: courses.py sets its plan threshold on it) ---
         st.session_state.final_score = final_score
         
-        st.success(f"✅ Interview Completed! Your final score is: **{final_score:.1f}%**")
+        st.success(f"✅ Interview Completed! Your estimated score is: **{final_score:.1f}%**")
         
         with st.container(border=True):
             st.subheader("Your Performance")
-            st.write(f"You correctly answered **{st.session_state.score}** out of **{total_questions}** questions.")
+            st.write(f"Estimated score: **{final_score:.1f}%** of all {bank.role} questions you would answer correctly.")
+            st.caption(f"You answered {st.session_state.score} of the {total_questions} questions asked correctly. "
+                       f"They were picked to match your level, so this count is not the score; the estimate "
+                       f"(ability {interview.ability:+.2f} ± {interview.se:.2f}) weighs their difficulty.")
 
             if final_score >= 80:
                 st.write("Excellent work! You have a strong grasp of the concepts.")
@@ -191,11 +192,12 @@ else:
     col1, col2 = st.columns(2)
     with col1:
         if st.button("🔄 Take Another Interview"):
-            for key in ["interview_started", "q_index", "score", "user_answers", "questions", "final_score"]:
+            for key in ["interview_started", "interview_done", "max_questions", "score", "user_answers",
+                        "question_ids", "correct", "interview_role", "final_score"]:
                 if key in st.session_state:
                     del st.session_state[key]
             st.rerun()
 
     with col2:
         if st.button("⬅️ Back to Career Advisor"):
-            st.switch_page("streamlit_app.py")
\ No newline at end of file
+            st.switch_page("streamlit_app.py")
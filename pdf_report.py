@@ -0,0 +1,173 @@
+# pdf_report.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+
+_styles = None
+
+
+def get_styles():
+    """The reportlab sample stylesheet, built once per process."""
+    global _styles
+    if _styles is None:
+        _styles = getSampleStyleSheet()
+    return _styles
+
+
+def report_key(profile: dict, matches: list[dict], advice: str, plans: dict[str, str] | None = None) -> str:
+    """Hash of everything that ends up in the report (only the top 3 matches are shown)."""
+    parts = [profile, matches[:3], advice] + ([plans] if plans else [])
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def report_elements(profile: dict, matches: list[dict], advice: str, plans: dict[str, str] | None = None) -> list:
+    """Flowables of one career report."""
+    styles = get_styles()
+    elements = []
+
+    elements.append(Paragraph("AI Career Advisor Report", styles["Title"]))
+    elements.append(Spacer(1, 8))
+
+    # Profile
+    elements.append(Paragraph("👤 User Profile", styles["Heading2"]))
+    for k, v in profile.items():
+        display_v = ", ".join(v) if isinstance(v, list) else str(v)
+        elements.append(Paragraph(f"<b>{k.capitalize()}:</b> {display_v}", styles["Normal"]))
+    elements.append(Spacer(1, 8))
+
+    # Matches
+    elements.append(Paragraph("📌 Top Career Matches", styles["Heading2"]))
+    for m in matches[:3]:
+        elements.append(Paragraph(f"<b>{m['role']}</b> — {m['match']}% match", styles["Normal"]))
+        elements.append(Paragraph(m["about"], styles["Normal"]))
+        if m.get("missing"):
+            elements.append(Paragraph("Missing Skills: " + ", ".join(m["missing"]), styles["Normal"]))
+        elements.append(Spacer(1, 6))
+
+    elements.append(Paragraph("✨ Personalized Advice", styles["Heading2"]))
+    # Break advice into paragraphs
+    for line in advice.splitlines():
+        if line.strip():
+            elements.append(Paragraph(line.strip(), styles["Normal"]))
+    elements.append(Spacer(1, 8))
+
+    if plans:
+        elements.append(Paragraph("🗺️ Learning Plans", styles["Heading2"]))
+        for role, plan in plans.items():
+            elements.append(Paragraph(role, styles["Heading3"]))
+            for line in plan.splitlines():
+                if line.strip():
+                    elements.append(Paragraph(line.strip(), styles["Normal"]))
+            elements.append(Spacer(1, 6))
+
+    return elements
+
+
+class ReportCache:
+    """
+    Rendered PDFs keyed by report_key(), kept in an in-memory LRU up to
+    max_memory_bytes.
+    """
+
+    def __init__(self, max_memory_bytes: int = 32 * 1024 * 1024):
+        self.max_memory_bytes = max_memory_bytes
+        self.stats = {"hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_bytes(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+            return data
+
+    def put_bytes(self, key: str, data: bytes):
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+                _, old = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old)
+
+
+_cache = ReportCache()
+
+
+def write_report(profile: dict, matches: list[dict], advice: str, out, plans: dict[str, str] | None = None) -> int:
+    """Render one report to out (a path or binary file object); returns its page count."""
+    doc = SimpleDocTemplate(out, pagesize=A4)
+    doc.build(report_elements(profile, matches, advice, plans))
+    return doc.page
+
+
+def render_report(profile: dict, matches: list[dict], advice: str, cache: ReportCache | None = None,
+                  plans: dict[str, str] | None = None) -> bytes:
+    """PDF bytes of one career report; identical inputs are only rendered once."""
+    cache = cache or _cache
+    key = report_key(profile, matches, advice, plans)
+    data = cache.get_bytes(key)
+    if data is None:
+        buffer = BytesIO()
+        write_report(profile, matches, advice, buffer, plans)
+        data = buffer.getvalue()
+        cache.put_bytes(key, data)
+    return data
+
+
+class _ReportFlowables(list):
+    """
+    Flowables of many reports for one doc.build(): build() only takes from the
+    front and checks len(), so each report's flowables are made when the
+    previous report has been laid out, and only one report is held at a time.
+    """
+
+    def __init__(self, reports):
+        super().__init__()
+        self._reports = iter(reports)
+        self._started = False
+
+    def __len__(self):
+        while not list.__len__(self):
+            report = next(self._reports, None)
+            if report is None:
+                return 0
+            if self._started:
+                self.append(PageBreak())
+            self._started = True
+            self.extend(report_elements(*report))
+        return list.__len__(self)
+
+
+def render_multi_report(reports, out_path: str) -> str:
+    """
+    One PDF with a report per (profile, matches, advice) in reports (any
+    iterable, read lazily), one after another. Each report's flowables are
+    built only when the layout reaches it, and the PDF is written to a temp
+    file next to out_path that replaces it once complete.
+    """
+    fd, tmp = tempfile.mkstemp(suffix=".pdf", dir=os.path.dirname(os.path.abspath(out_path)))
+    os.close(fd)
+    try:
+        SimpleDocTemplate(tmp, pagesize=A4).build(_ReportFlowables(reports))
+        os.replace(tmp, out_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return out_path
@@ -0,0 +1,42 @@
+# question_bank.py
+from catalog import Catalog, get_catalog
+from engine.adaptive import AdaptiveInterview
+
+DEFAULT_ROLE = "Data Scientist"  # bank used for roles without questions of their own
+
+
+class QuestionBank:
+    """
+    One role's interview questions, read from the catalog one question at a time.
+    Nothing is loaded up front: the adaptive interview picks question numbers from
+    the difficulty record alone, and only the questions actually shown are decoded.
+    """
+
+    def __init__(self, role: str, catalog: Catalog | None = None, fallback_role: str = DEFAULT_ROLE):
+        self.catalog = catalog or get_catalog()
+        if self.catalog.question_count(role) == 0:
+            role = fallback_role
+        self.role = role
+        self.size = self.catalog.question_count(role)
+        self._difficulties = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> dict:
+        q = self.catalog.question(self.role, i)
+        if q is None:
+            raise IndexError(i)
+        return q
+
+    def difficulties(self) -> tuple[list[float], list[int]]:
+        """Question difficulties, ascending, with the question number of each (one record read)."""
+        if self._difficulties is None:
+            self._difficulties = self.catalog.question_difficulties(self.role)
+        return self._difficulties
+
+    def interview(self, responses=(), **kwargs) -> AdaptiveInterview:
+        """Adaptive interview over this bank, replaying earlier (question, correct) answers."""
+        difficulties, ids = self.difficulties()
+        return AdaptiveInterview(difficulties, ids, responses, **kwargs)
+
@@ -0,0 +1,232 @@
+# resource_index.py
+import bisect
+import csv
+import io
+import logging
+import math
+import operator
+import os
+import re
+import threading
+import time
+
+RESOURCES_PATH = "resources.csv"
+FIELDS = ["role_id", "resource_type", "title", "url", "duration"]
+
+_UNITS = {
+    "min": 1, "mins": 1, "minute": 1, "minutes": 1, "m": 1,
+    "h": 60, "hr": 60, "hrs": 60, "hour": 60, "hours": 60,
+    "day": 1440, "days": 1440,
+    "week": 10080, "weeks": 10080, "wk": 10080, "wks": 10080,
+    "month": 43200, "months": 43200,
+}
+_DURATION_RE = re.compile(r"([\d.]+)\s*([a-z]+)")
+
+log = logging.getLogger(__name__)
+
+
+def parse_duration(text: str) -> float:
+    """'2 hours' / '15 min' / '4 weeks' -> minutes; math.inf when unknown."""
+    total = 0.0
+    found = False
+    for number, unit in _DURATION_RE.findall(text.lower()):
+        if unit in _UNITS:
+            try:
+                total += float(number) * _UNITS[unit]
+            except ValueError:
+                continue
+            found = True
+    return total if found else math.inf
+
+
+class _Groups:
+    """The parsed rows of one version of the file and the lookup groups built from them."""
+
+    def __init__(self, header: list[str] | None = None):
+        self.rows = []       # (role_id, resource_type, title, url, duration, minutes)
+        self.groups = {}     # (role_id | None, type | None) -> sorted [(minutes, row id)]
+        self.types = {}      # role_id | None -> resource types
+        self.minutes = {}    # duration text -> minutes (durations repeat a lot)
+        header = [h.strip() for h in header] if header else FIELDS
+        missing = [name for name in FIELDS if name not in header]
+        if missing:
+            raise ValueError(f"header lacks {', '.join(missing)} (has {', '.join(header)})")
+        self.cols = [header.index(name) for name in FIELDS]  # position of each of FIELDS in the file
+        self.pick = operator.itemgetter(*self.cols)
+
+    def add(self, record: list[str], bulk: bool):
+        if len(record) <= max(self.cols):
+            return
+        role_id, rtype, title, url, duration = self.pick(record)
+        role_id, rtype = role_id.strip(), rtype.strip().lower()
+        minutes = self.minutes.get(duration)
+        if minutes is None:
+            minutes = self.minutes[duration] = parse_duration(duration)
+        i = len(self.rows)
+        self.rows.append((role_id, rtype, title, url, duration, minutes))
+        entry = (minutes, i)
+        self.types.setdefault(role_id, set()).add(rtype)
+        self.types.setdefault(None, set()).add(rtype)
+        for key in ((role_id, rtype), (role_id, None), (None, rtype), (None, None)):
+            group = self.groups.get(key)
+            if group is None:
+                self.groups[key] = [entry]
+            elif bulk or group[-1] <= entry:
+                group.append(entry)
+            else:
+                bisect.insort(group, entry)
+
+    def sort(self):
+        for group in self.groups.values():
+            group.sort()  # one sort per group instead of an insort per row
+
+
+def _records(data: bytes) -> list[list[str]]:
+    """Parse CSV bytes completely first, so a decode error leaves the index untouched."""
+    return [record for record in csv.reader(io.StringIO(data.decode("utf-8"))) if record]
+
+
+class ResourceIndex:
+    """
+    resources.csv indexed by (role_id, resource_type) -> rows sorted by duration,
+    with role_id or resource_type None meaning "any". A filtered lookup is one
+    dict hit plus a bisect on duration, so it never rescans the file. When the
+    CSV only grew (rows appended), refresh() parses just the new bytes;
+    any other change rebuilds the index, which is swapped in only once the new
+    file parsed: a file that can't be read (e.g. a header without one of
+    FIELDS) is logged and the previous index kept.
+    """
+
+    _TAIL = 64  # bytes compared to tell an append from a rewrite
+
+    def __init__(self, path: str = RESOURCES_PATH):
+        self.path = path
+        self.stats = {"rows": 0, "full_loads": 0, "incremental_loads": 0, "failed_loads": 0}
+        self._lock = threading.Lock()
+        self._ix = _Groups()
+        self._offset = 0     # bytes of the file already indexed
+        self._tail = b""
+        self._complete = True  # indexed bytes end on a line break (and match the file)
+        self._file_id = None
+        self.refresh()
+
+    @property
+    def rows(self) -> list[tuple]:
+        return self._ix.rows
+
+    def refresh(self) -> bool:
+        """Index rows added since the last call; returns True if anything changed."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        file_id = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if file_id == self._file_id:
+            return False
+        with self._lock:
+            if file_id == self._file_id:
+                return False
+            with open(self.path, "rb") as f:
+                appended = False
+                if (self._file_id is not None and self._complete and st.st_size > self._offset
+                        and st.st_ino == self._file_id[0]):
+                    f.seek(max(self._offset - len(self._tail), 0))
+                    appended = f.read(len(self._tail)) == self._tail
+                if not appended:
+                    f.seek(0)
+                data = f.read()
+            try:
+                records = _records(data)
+                if appended:
+                    for record in records:
+                        self._ix.add(record, bulk=False)
+                else:
+                    ix = _Groups(records[0] if records else None)
+                    for record in records[1:]:
+                        ix.add(record, bulk=True)
+                    ix.sort()
+                    self._ix = ix  # one reference swap: readers see the old or the new index
+                    self._offset = 0
+                    self._tail = b""
+            except (ValueError, csv.Error) as e:  # UnicodeDecodeError is a ValueError
+                log.warning("%s: not reloaded, keeping the previous %d resources: %s", self.path, len(self.rows), e)
+                self.stats["failed_loads"] += 1
+                self._file_id = file_id  # don't retry until the file changes again
+                self._complete = False   # ...and then read it in full
+                return False
+            self._offset += len(data)
+            self._tail = (self._tail + data)[-self._TAIL:]
+            # a last line without a line break may still be being written: reload in full next time
+            self._complete = not data or data.endswith(b"\n")
+            self._file_id = file_id
+            self.stats["rows"] = len(self.rows)
+            self.stats["incremental_loads" if appended else "full_loads"] += 1
+        return True
+
+    def snapshot(self) -> tuple[list[tuple], int]:
+        """
+        (rows, n) taken under the lock. rows[:n] never changes afterwards: refresh()
+        only appends past n, and a full reload builds a new list.
+        """
+        with self._lock:
+            rows = self._ix.rows
+            return rows, len(rows)
+
+    @staticmethod
+    def as_dict(record: tuple) -> dict:
+        role_id, rtype, title, url, duration, minutes = record
+        return {"role_id": role_id, "resource_type": rtype, "title": title, "url": url,
+                "duration": duration, "minutes": None if minutes == math.inf else minutes}
+
+    def row(self, i: int) -> dict:
+        return self.as_dict(self.rows[i])
+
+    def find(self, role_id: str | None = None, resource_type: str | None = None,
+             max_minutes: float | None = None, limit: int | None = None) -> list[dict]:
+        """
+        Resources for role_id (None = any role) of resource_type (None = any type)
+        lasting at most max_minutes, shortest first. Resources whose duration
+        could not be parsed are only returned without max_minutes.
+        """
+        key = (role_id, resource_type.lower() if resource_type else None)
+        with self._lock:
+            group = self._ix.groups.get(key)
+            if not group:
+                return []
+            end = len(group) if max_minutes is None else bisect.bisect_right(group, (max_minutes, math.inf))
+            if limit is not None:
+                end = min(end, limit)
+            return [self.row(i) for _, i in group[:end]]
+
+    def count(self, role_id: str | None = None, resource_type: str | None = None,
+              max_minutes: float | None = None) -> int:
+        key = (role_id, resource_type.lower() if resource_type else None)
+        with self._lock:
+            group = self._ix.groups.get(key, [])
+            return len(group) if max_minutes is None else bisect.bisect_right(group, (max_minutes, math.inf))
+
+    def resource_types(self, role_id: str | None = None) -> list[str]:
+        with self._lock:
+            return sorted(self._ix.types.get(role_id, ()))
+
+
+CHECK_INTERVAL = 1.0  # seconds between checks of the CSV on disk
+
+_index = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def get_resource_index() -> ResourceIndex:
+    """The process-wide index of resources.csv, refreshed when the file changes."""
+    global _index, _checked_at
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ResourceIndex()
+                _checked_at = time.monotonic()
+                return _index
+    if time.monotonic() - _checked_at >= CHECK_INTERVAL:
+        _checked_at = time.monotonic()
+        _index.refresh()
+    return _index
@@ -0,0 +1,223 @@
+# resume_parser.py
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from skill_detector import SkillStream, get_matcher
+from skill_registry import get_registry
+
+MAX_PAGES = 50          # pages beyond this are ignored
+MAX_CHARS = 200_000     # stop extracting once this much text has been read
+PARALLEL_MIN_PAGES = 8  # smaller PDFs aren't worth a process pool
+
+
+class ResumeCache:
+    """
+    Parsed resumes keyed by the SHA-256 of the uploaded PDF bytes.
+    In-process LRU of max_entries, plus an optional on-disk tier (one JSON file
+    per resume under disk_dir) trimmed to max_disk_bytes, oldest-used first.
+    get() returns a copy, so callers may modify what they get back.
+    """
+
+    def __init__(self, max_entries: int = 32, disk_dir: str | None = None, max_disk_bytes: int = 20 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.disk_dir, f"{digest}.json")
+
+    def get(self, digest: str) -> dict | None:
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                self.stats["memory_hits"] += 1
+                return copy.deepcopy(self._memory[digest])
+        if self.disk_dir:
+            try:
+                with open(self._path(digest), "r") as f:
+                    entry = json.load(f)
+                os.utime(self._path(digest))  # mark as recently used
+            except (OSError, ValueError):
+                entry = None
+            if entry is not None:
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                self._remember(digest, entry)
+                return copy.deepcopy(entry)
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, digest: str, entry: dict):
+        self._remember(digest, copy.deepcopy(entry))
+        if self.disk_dir:
+            path = self._path(digest)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)  # a concurrent get() never reads a half-written entry
+            self._trim_disk()
+
+    def _remember(self, digest: str, entry: dict):
+        with self._lock:
+            self._memory[digest] = entry
+            self._memory.move_to_end(digest)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _trim_disk(self):
+        files = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(".json"):
+                st = os.stat(os.path.join(self.disk_dir, name))
+                files.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.disk_dir, name))
+            except OSError:
+                pass
+            total -= size
+
+
+_cache = ResumeCache(disk_dir=os.environ.get("RESUME_CACHE_DIR"))
+
+
+def get_resume_cache() -> ResumeCache:
+    return _cache
+
+
+def _open_pdf(data: bytes):
+    import pdfplumber  # heavy import, only paid once a PDF is actually parsed
+    return pdfplumber.open(BytesIO(data))
+
+
+def _extract_range(data: bytes, start: int, stop: int) -> list[str]:
+    with _open_pdf(data) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every parse (grown if more workers are asked for)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)  # ranges already submitted still finish
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def _iter_page_text(data: bytes, max_pages: int | None, workers: int | None, info: dict):
+    with _open_pdf(data) as pdf:
+        info["pages"] = len(pdf.pages)
+        n = len(pdf.pages) if max_pages is None else min(len(pdf.pages), max_pages)
+        if n < len(pdf.pages):
+            info["truncated"] = True
+        if not workers or workers < 2 or n < PARALLEL_MIN_PAGES:
+            for page in pdf.pages[:n]:
+                yield page.extract_text() or ""
+            return
+
+    # one contiguous page range per worker, yielded back in page order
+    step = -(-n // workers)
+    pool = _get_pool(workers)
+    futures = [pool.submit(_extract_range, data, start, min(start + step, n)) for start in range(0, n, step)]
+    try:
+        for fut in futures:
+            yield from fut.result()
+    finally:
+        # early cut-off: drop ranges nobody will read that haven't started yet
+        for fut in futures:
+            fut.cancel()
+
+
+def iter_pages(data: bytes, max_pages: int | None = MAX_PAGES, max_chars: int | None = MAX_CHARS,
+               workers: int | None = None, info: dict | None = None):
+    """
+    Yield the text of each page of a PDF as soon as it is extracted.
+    Stops after max_pages pages, or once max_chars characters have been read
+    (the last page is cut at the limit). With workers > 1, large PDFs are split
+    into page ranges extracted in parallel processes.
+    If an info dict is passed it receives pages (in the PDF) and truncated
+    (True when a limit cut the text short).
+    """
+    info = {} if info is None else info
+    info["truncated"] = False
+    total = 0
+    for text in _iter_page_text(data, max_pages, workers, info):
+        if max_chars is not None and total + len(text) > max_chars:
+            info["truncated"] = True
+            yield text[:max_chars - total]
+            return
+        total += len(text)
+        yield text
+
+
+def extract_text(data: bytes, **kwargs) -> str:
+    return "\n".join(iter_pages(data, **kwargs))
+
+
+def _skills_key(skills_db: list[str], aliases_key: str) -> str:
+    # skills are canonicalized with the registry's aliases, so those are part of the key too
+    return hashlib.sha256(("\n".join(skills_db) + "\0" + aliases_key).encode("utf-8")).hexdigest()
+
+
+def parse_resume(data: bytes, skills_db: list[str] | None = None, cache: ResumeCache | None = None,
+                 max_pages: int | None = MAX_PAGES, max_chars: int | None = MAX_CHARS,
+                 workers: int | None = None) -> dict:
+    """
+    Text and detected skills of a PDF resume, memoized by the SHA-256 of its bytes
+    so Streamlit reruns don't re-parse an unchanged upload.
+    Pages are fed to the skill detector as they are extracted (see iter_pages).
+    Uses the shared skill registry unless a skills_db is given.
+    Returns {"text": ..., "skills": [...], "truncated": bool}; truncated is True
+    when max_pages / max_chars (None = no limit) cut the resume short.
+    """
+    cache = cache or _cache
+    digest = hashlib.sha256(data).hexdigest()
+    registry = get_registry()
+    if skills_db is None:
+        matcher, skills_key = registry.matcher, registry.fingerprint
+    else:
+        matcher, skills_key = get_matcher(skills_db), _skills_key(skills_db, registry.fingerprint)
+    limits = [max_pages, max_chars]
+
+    entry = cache.get(digest)
+    if entry is None or entry.get("limits") != limits or "truncated" not in entry:
+        stream = SkillStream(matcher)
+        pages = []
+        info = {}
+        for page in iter_pages(data, max_pages=max_pages, max_chars=max_chars, workers=workers, info=info):
+            pages.append(page)
+            stream.feed(page)
+        skills = registry.canon.canonicalize(stream.skills())
+        entry = {"text": "\n".join(pages), "skills": skills, "skills_key": skills_key, "limits": limits,
+                 "truncated": info["truncated"]}
+        cache.put(digest, entry)
+    elif entry.get("skills_key") != skills_key:
+        # skills database changed since this resume was parsed; text is still good
+        skills = registry.canon.canonicalize(matcher.find(entry["text"]))
+        entry = {**entry, "skills": skills, "skills_key": skills_key}
+        cache.put(digest, entry)
+
+    return {"text": entry["text"], "skills": list(entry["skills"]), "truncated": entry.get("truncated", False)}
@@ -0,0 +1,376 @@
+# session_store.py
+"""
+Server-side store for per-session app state (the last analysis etc.), so
+st.session_state only holds a short session ID. The ID is generated on the
+server and never leaves st.session_state: it is not put in the URL, where a
+shared or bookmarked link would hand the session (and the profile in it) to
+whoever opens it.
+
+Values are kept JSON-encoded, which makes the memory a session uses exact to
+measure (session_bytes) and to cap: a session over max_session_bytes loses its
+oldest-written keys, sessions idle for idle_ttl seconds are evicted, and so are
+the least recently used ones beyond max_sessions. Reads refresh a session's
+last access only once per touch_interval seconds, so a Streamlit rerun's reads
+do not each write to the SQLite store.
+
+    SESSION_STORE=memory  (default) in-process LRU, lost on restart
+    SESSION_STORE=sqlite  on-disk at SESSION_STORE_PATH (.cache/sessions.sqlite),
+                          shared by worker processes
+
+    python session_store.py stats   # sessions and bytes in the SQLite store
+    python session_store.py evict   # drop idle sessions now
+"""
+import abc
+import argparse
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+SESSION_DB_PATH = os.path.join(".cache", "sessions.sqlite")
+MAX_SESSION_BYTES = 256 * 1024
+MAX_SESSIONS = 10_000
+IDLE_TTL = 6 * 3600      # seconds without a request before a session is dropped
+SWEEP_INTERVAL = 60.0    # seconds between idle sweeps
+TOUCH_INTERVAL = 60.0    # reads refresh last_access when it is at least this old
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class SessionStore(abc.ABC):
+    """
+    Common part of the stores: size limits, encoding and the idle sweep.
+    Sizes are of the encoded values plus their key names.
+    """
+
+    def __init__(self, max_session_bytes: int = MAX_SESSION_BYTES, max_sessions: int = MAX_SESSIONS,
+                 idle_ttl: float = IDLE_TTL, sweep_interval: float = SWEEP_INTERVAL,
+                 touch_interval: float = TOUCH_INTERVAL):
+        self.max_session_bytes = max_session_bytes
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self.touch_interval = touch_interval
+        self.stats = {"gets": 0, "puts": 0, "evicted_idle": 0, "evicted_lru": 0, "evicted_keys": 0}
+        self._lock = threading.Lock()
+        self._swept_at = time.time()
+
+    def _check_size(self, key: str, blob: bytes) -> int:
+        size = len(key) + len(blob)
+        if size > self.max_session_bytes:
+            raise ValueError(f"session value {key!r} is {size} bytes, over the {self.max_session_bytes} byte cap")
+        return size
+
+    def _maybe_sweep(self, now: float):
+        if now - self._swept_at >= self.sweep_interval:
+            self._swept_at = now
+            self.evict_idle(now)
+
+    @abc.abstractmethod
+    def get(self, sid: str, key: str, default=None):
+        """The value stored under key for the session (default if there is none)."""
+
+    @abc.abstractmethod
+    def exists(self, sid: str, key: str) -> bool:
+        """Whether the session has a value under key, without decoding it."""
+
+    @abc.abstractmethod
+    def put(self, sid: str, key: str, value):
+        """Store value under key for the session, dropping its oldest keys to stay under the cap."""
+
+    @abc.abstractmethod
+    def delete(self, sid: str, key: str | None = None):
+        """Drop one key of the session, or the whole session when key is None."""
+
+    @abc.abstractmethod
+    def session_bytes(self, sid: str) -> int:
+        """Bytes the session's values (and key names) take up."""
+
+    @abc.abstractmethod
+    def evict_idle(self, now: float | None = None) -> int:
+        """Drop sessions idle for idle_ttl seconds; returns how many were dropped."""
+
+
+class MemorySessionStore(SessionStore):
+    """Sessions in an in-process LRU: session ID -> OrderedDict of key -> encoded value."""
+
+    def __init__(self, **limits):
+        super().__init__(**limits)
+        self._sessions = OrderedDict()  # sid -> {"data": OrderedDict, "bytes": int, "last_access": float}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _touch(self, sid: str, now: float, interval: float = 0.0) -> dict | None:
+        session = self._sessions.get(sid)
+        if session is not None and now - session["last_access"] >= interval:
+            session["last_access"] = now
+            self._sessions.move_to_end(sid)
+        return session
+
+    def get(self, sid: str, key: str, default=None):
+        now = time.time()
+        self._maybe_sweep(now)
+        with self._lock:
+            self.stats["gets"] += 1
+            session = self._touch(sid, now, self.touch_interval)
+            blob = session["data"].get(key) if session else None
+        return default if blob is None else json.loads(blob)
+
+    def exists(self, sid: str, key: str) -> bool:
+        now = time.time()
+        self._maybe_sweep(now)
+        with self._lock:
+            self.stats["gets"] += 1
+            session = self._touch(sid, now, self.touch_interval)
+            return session is not None and key in session["data"]
+
+    def put(self, sid: str, key: str, value):
+        blob = _encode(value)
+        size = self._check_size(key, blob)
+        now = time.time()
+        self._maybe_sweep(now)
+        with self._lock:
+            self.stats["puts"] += 1
+            session = self._touch(sid, now)
+            if session is None:
+                session = self._sessions[sid] = {"data": OrderedDict(), "bytes": 0, "last_access": now}
+            old = session["data"].pop(key, None)
+            if old is not None:
+                session["bytes"] -= len(key) + len(old)
+            while session["bytes"] + size > self.max_session_bytes:
+                k, v = session["data"].popitem(last=False)
+                session["bytes"] -= len(k) + len(v)
+                self.stats["evicted_keys"] += 1
+            session["data"][key] = blob
+            session["bytes"] += size
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.stats["evicted_lru"] += 1
+
+    def delete(self, sid: str, key: str | None = None):
+        with self._lock:
+            session = self._sessions.get(sid)
+            if session is None:
+                return
+            if key is None:
+                del self._sessions[sid]
+            elif key in session["data"]:
+                session["bytes"] -= len(key) + len(session["data"].pop(key))
+
+    def session_bytes(self, sid: str) -> int:
+        with self._lock:
+            session = self._sessions.get(sid)
+            return session["bytes"] if session else 0
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(s["bytes"] for s in self._sessions.values())
+
+    def evict_idle(self, now: float | None = None) -> int:
+        cutoff = (now or time.time()) - self.idle_ttl
+        with self._lock:
+            # sessions are in access order, so the idle ones are at the front
+            evicted = 0
+            while self._sessions and next(iter(self._sessions.values()))["last_access"] < cutoff:
+                self._sessions.popitem(last=False)
+                evicted += 1
+            self.stats["evicted_idle"] += evicted
+        return evicted
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in SQLite: one row per (session, key), plus each session's size and last access."""
+
+    def __init__(self, path: str = SESSION_DB_PATH, **limits):
+        super().__init__(**limits)
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            PRAGMA journal_mode = WAL;  -- worker processes read while one writes
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                session_id TEXT,
+                key TEXT,
+                value BLOB,
+                size INTEGER,
+                updated_at REAL,
+                PRIMARY KEY (session_id, key)
+            );
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                size INTEGER,
+                last_access REAL
+            );
+            CREATE INDEX IF NOT EXISTS sessions_by_access ON sessions (last_access);
+        """)
+        self._db.commit()
+        # kept up to date by this process and recounted at each sweep (other
+        # processes add and drop sessions too), so put() needs no COUNT(*)
+        self._count = self._recount()
+
+    def _recount(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._recount()
+
+    def _drop(self, where: str, args=()) -> int:
+        """Delete the sessions matching a WHERE clause on the sessions table (lock held)."""
+        sids = [r[0] for r in self._db.execute(f"SELECT session_id FROM sessions WHERE {where}", args)]
+        self._db.executemany("DELETE FROM entries WHERE session_id = ?", ((s,) for s in sids))
+        self._db.executemany("DELETE FROM sessions WHERE session_id = ?", ((s,) for s in sids))
+        self._count -= len(sids)
+        return len(sids)
+
+    def _read(self, sid: str, key: str, column: str):
+        """
+        One column of the session's entry under key (None if there is none),
+        refreshing the session's last access if it is touch_interval old.
+        The common case, a recently used session, is a single read.
+        """
+        now = time.time()
+        self._maybe_sweep(now)
+        with self._lock:
+            self.stats["gets"] += 1
+            row = self._db.execute(f"SELECT last_access, (SELECT {column} FROM entries"
+                                   " WHERE session_id = ? AND key = ?) FROM sessions WHERE session_id = ?",
+                                   (sid, key, sid)).fetchone()
+            if row is None:
+                return None
+            if now - row[0] >= self.touch_interval:
+                self._db.execute("UPDATE sessions SET last_access = ? WHERE session_id = ?", (now, sid))
+                self._db.commit()
+        return row[1]
+
+    def get(self, sid: str, key: str, default=None):
+        blob = self._read(sid, key, "value")
+        return default if blob is None else json.loads(blob)
+
+    def exists(self, sid: str, key: str) -> bool:
+        return self._read(sid, key, "1") is not None
+
+    def put(self, sid: str, key: str, value):
+        blob = _encode(value)
+        size = self._check_size(key, blob)
+        now = time.time()
+        self._maybe_sweep(now)
+        with self._lock:
+            self.stats["puts"] += 1
+            db = self._db
+            db.execute("DELETE FROM entries WHERE session_id = ? AND key = ?", (sid, key))
+            used = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries WHERE session_id = ?", (sid,)).fetchone()[0]
+            if used + size > self.max_session_bytes:
+                for k, s in db.execute("SELECT key, size FROM entries WHERE session_id = ? ORDER BY updated_at",
+                                       (sid,)).fetchall():
+                    db.execute("DELETE FROM entries WHERE session_id = ? AND key = ?", (sid, k))
+                    used -= s
+                    self.stats["evicted_keys"] += 1
+                    if used + size <= self.max_session_bytes:
+                        break
+            db.execute("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", (sid, key, blob, size, now))
+            if db.execute("UPDATE sessions SET size = ?, last_access = ? WHERE session_id = ?",
+                          (used + size, now, sid)).rowcount == 0:
+                db.execute("INSERT INTO sessions VALUES (?, ?, ?)", (sid, used + size, now))
+                self._count += 1
+            if self._count > self.max_sessions:
+                self._count = self._recount()  # only when it looks over: other processes may have dropped some
+            over = self._count - self.max_sessions
+            if over > 0:
+                self.stats["evicted_lru"] += self._drop(
+                    "session_id IN (SELECT session_id FROM sessions ORDER BY last_access LIMIT ?)", (over,))
+            db.commit()
+
+    def delete(self, sid: str, key: str | None = None):
+        with self._lock:
+            if key is None:
+                self._drop("session_id = ?", (sid,))
+            else:
+                self._db.execute("DELETE FROM entries WHERE session_id = ? AND key = ?", (sid, key))
+                self._db.execute("UPDATE sessions SET size = (SELECT COALESCE(SUM(size), 0) FROM entries"
+                                 " WHERE session_id = ?) WHERE session_id = ?", (sid, sid))
+            self._db.commit()
+
+    def session_bytes(self, sid: str) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT size FROM sessions WHERE session_id = ?", (sid,)).fetchone()
+        return row[0] if row else 0
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM sessions").fetchone()[0]
+
+    def largest(self, n: int = 5) -> list[tuple[str, int]]:
+        with self._lock:
+            return self._db.execute("SELECT session_id, size FROM sessions ORDER BY size DESC LIMIT ?",
+                                    (n,)).fetchall()
+
+    def evict_idle(self, now: float | None = None) -> int:
+        cutoff = (now or time.time()) - self.idle_ttl
+        with self._lock:
+            evicted = self._drop("last_access < ?", (cutoff,))
+            self._db.commit()
+            self._count = self._recount()
+            self.stats["evicted_idle"] += evicted
+        return evicted
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """The process-wide store, picked by the SESSION_STORE environment variable (memory or sqlite)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                kind = os.environ.get("SESSION_STORE", "memory")
+                if kind == "sqlite":
+                    _store = SQLiteSessionStore(os.environ.get("SESSION_STORE_PATH", SESSION_DB_PATH))
+                elif kind == "memory":
+                    _store = MemorySessionStore()
+                else:
+                    raise ValueError(f"unknown SESSION_STORE {kind!r} (expected memory or sqlite)")
+    return _store
+
+
+def session_id() -> str:
+    """
+    This browser session's key in the store: random, made on the server and
+    kept only in st.session_state (shared by the app's pages). A new browser
+    session starts with a new ID; the old one's entries are dropped when idle.
+    """
+    import streamlit as st
+    sid = st.session_state.get("session_id")
+    if sid is None:
+        sid = st.session_state["session_id"] = secrets.token_hex(16)
+    return sid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the SQLite session store.")
+    parser.add_argument("command", choices=["stats", "evict"])
+    parser.add_argument("--path", default=os.environ.get("SESSION_STORE_PATH", SESSION_DB_PATH))
+    args = parser.parse_args(argv)
+
+    store = SQLiteSessionStore(args.path)
+    if args.command == "evict":
+        print(f"evicted {store.evict_idle()} idle sessions")
+    sessions, total = len(store), store.total_bytes()
+    print(f"{sessions} sessions, {total} bytes ({total / max(sessions, 1):.0f} bytes/session, "
+          f"cap {store.max_session_bytes})")
+    for sid, size in store.largest():
+        print(f"  {sid}  {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# simulate_interview.py
+"""
+Offline simulation of the interview: how many questions the adaptive engine
+needs, and how close its score gets to the candidate's true score, compared
+with the old fixed-length random interviews scored by percent correct.
+
+    python simulate_interview.py --candidates 2000 --bank 5000
+
+Candidates have a true ability drawn from N(0, 1) and answer according to the
+same item-response model the engine assumes; their true score is the expected
+percentage correct over the whole bank.
+"""
+import argparse
+import random
+import statistics
+import time
+
+from engine.adaptive import AdaptiveInterview, p_correct
+
+
+def true_score(theta: float, difficulties: list[float]) -> float:
+    return 100 * sum(p_correct(theta, b) for b in difficulties) / len(difficulties)
+
+
+def simulate_fixed(theta: float, difficulties: list[float], k: int, rng: random.Random) -> tuple[int, float]:
+    asked = rng.sample(range(len(difficulties)), k)
+    correct = sum(rng.random() < p_correct(theta, difficulties[i]) for i in asked)
+    return k, 100 * correct / k
+
+
+def simulate_adaptive(theta: float, difficulties: list[float], ids: list[int], rng: random.Random,
+                      **kwargs) -> tuple[int, float]:
+    engine = AdaptiveInterview(difficulties, ids, rng=rng, **kwargs)
+    while (qid := engine.next_question()) is not None:
+        engine.record(qid, rng.random() < p_correct(theta, engine.difficulty(qid)))
+    return len(engine.responses), engine.score()
+
+
+def summarize(name: str, runs: list[tuple[int, float, float]], seconds: float) -> str:
+    asked = [n for n, _, _ in runs]
+    errors = [abs(est - true) for _, est, true in runs]
+    rmse = (sum(e * e for e in errors) / len(errors)) ** 0.5
+    p90 = sorted(asked)[int(0.9 * (len(asked) - 1))]
+    return (f"{name:<26}{statistics.mean(asked):>8.1f}{p90:>6}{rmse:>9.1f}{statistics.mean(errors):>9.1f}"
+            f"{seconds / len(runs) * 1000:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate fixed vs adaptive interviews.")
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--bank", type=int, default=5000, help="questions per role")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    difficulties = sorted(rng.gauss(0, 1.2) for _ in range(args.bank))
+    ids = list(range(args.bank))
+    thetas = [rng.gauss(0, 1) for _ in range(args.candidates)]
+    truths = [true_score(t, difficulties) for t in thetas]
+
+    variants = [(f"fixed {k}", lambda t, k=k: simulate_fixed(t, difficulties, k, rng)) for k in (5, 10, 15)]
+    variants += [
+        (f"adaptive se<={se} (max 15)", lambda t, se=se: simulate_adaptive(t, difficulties, ids, rng, target_se=se))
+        for se in (0.8, 0.7, 0.6)
+    ]
+    print(f"{'interview':<26}{'asked':>8}{'p90':>6}{'rmse':>9}{'mae':>9}{'ms/run':>10}   (score points)")
+    for name, run in variants:
+        start = time.perf_counter()
+        runs = [(*run(t), truth) for t, truth in zip(thetas, truths)]
+        print(summarize(name, runs, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
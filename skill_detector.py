@@ -0,0 +1,137 @@
+# skill_detector.py
+import re
+
+from skill_normalizer import get_canonicalizer
+
+_BOUNDARY = re.compile(r"\b")
+
+
+def _is_word(ch: str) -> bool:
+    # same definition of a "word" character as regex \w
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Precompiled skill detector. Builds a character trie over the skill list once
+    and finds every skill in a single pass over the text.
+
+    Matching rules are the same as the per-skill regex it replaces:
+    \\b<skill>\\b, case-insensitive, with spaces in a skill also matching
+    hyphens (e.g. 'machine learning' matches 'machine-learning').
+    """
+
+    def __init__(self, skills_db: list[str]):
+        self.skills = [s.lower() for s in skills_db]
+        self.trie = {}
+        for idx, skill in enumerate(self.skills):
+            if not skill:
+                continue
+            node = self.trie
+            for ch in skill:
+                node = node.setdefault(ch, {})
+            node.setdefault(None, []).append(idx)
+
+    def _walk(self, text: str, start: int, hits: set):
+        n = len(text)
+        stack = [(self.trie, start)]
+        while stack:
+            node, pos = stack.pop()
+            if None in node and (pos > 0 and _is_word(text[pos - 1])) != (pos < n and _is_word(text[pos])):
+                hits.update(node[None])
+            if pos >= n:
+                continue
+            ch = text[pos]
+            child = node.get(ch)
+            if child is not None:
+                stack.append((child, pos + 1))
+            # a space in the skill accepts any whitespace or a hyphen
+            if ch != " " and (ch == "-" or ch.isspace()):
+                child = node.get(" ")
+                if child is not None:
+                    stack.append((child, pos + 1))
+
+    def find_indices(self, text: str, start: int = 0) -> set[int]:
+        """
+        Positions (in the skill list) of the skills present in text, counting only
+        matches that begin at or after start (text[:start] is left context).
+        """
+        text_lower = text.lower()
+        hits = set()
+        first_chars = self.trie
+        for m in _BOUNDARY.finditer(text_lower, start):
+            pos = m.start()
+            if pos < len(text_lower) and (text_lower[pos] in first_chars or " " in first_chars):
+                self._walk(text_lower, pos, hits)
+        return hits
+
+    def find(self, text: str) -> list[str]:
+        """Return the skills present in text, in skill-list order."""
+        return [self.skills[i] for i in sorted(self.find_indices(text))]
+
+
+class SkillStream:
+    """
+    Skill detection over text that arrives in chunks (e.g. PDF pages).
+    Feeding chunks c1, c2, ... gives the same skills as find(sep.join(chunks)):
+    each chunk is scanned together with the tail of the previous one, so
+    skills spanning a chunk break ('machine' / 'learning') are still found.
+    """
+
+    def __init__(self, matcher: SkillMatcher, sep: str = "\n"):
+        self.matcher = matcher
+        self.sep = sep
+        self.hits = set()
+        self._carry = None
+        self._start = 0  # matches in the carry start at or after this (what's before is context)
+        # a match is exactly as long as its skill (a space matches one whitespace/hyphen)
+        self._overlap = max((len(s) for s in matcher.skills), default=0)
+
+    def feed(self, chunk: str) -> set[int]:
+        """Scan one more chunk; returns the skill positions first seen in it."""
+        if self._carry is None:
+            window, start = chunk, 0
+        else:
+            window, start = self._carry + self.sep + chunk, self._start
+        new = self.matcher.find_indices(window, start) - self.hits
+        self.hits |= new
+        # Skills starting before the last `overlap` characters end inside this
+        # window and were found already, so only those characters carry over,
+        # plus one before them to decide the word boundary. The carry stays
+        # bounded whatever the text (long tokens, URLs, base64).
+        cut = len(window) - self._overlap
+        if cut > start:
+            self._carry, self._start = window[cut - 1:], 1
+        else:
+            self._carry, self._start = window, start
+        return new
+
+    def skills(self) -> list[str]:
+        return [self.matcher.skills[i] for i in sorted(self.hits)]
+
+
+_MATCHERS = {}
+
+
+def get_matcher(skills_db: list[str]) -> SkillMatcher:
+    """Return a cached SkillMatcher for this skill list (built once per list)."""
+    key = tuple(skills_db)
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        matcher = _MATCHERS[key] = SkillMatcher(skills_db)
+    return matcher
+
+
+def detect_skills(text: str, skills_db: list[str] | None = None) -> list[str]:
+    """
+    Detect skills from resume text (case-insensitive, word boundaries).
+    Allows flexible matches (e.g., 'C++', 'TensorFlow 2.0', 'machine-learning').
+    Aliases are folded into one canonical skill (e.g. 'ML' -> 'machine learning').
+    Uses the shared skill registry's matcher unless a skills_db is given.
+    """
+    if skills_db is None:
+        from skill_registry import get_registry
+        matcher = get_registry().matcher
+    else:
+        matcher = get_matcher(skills_db)
+    return get_canonicalizer().canonicalize(matcher.find(text))
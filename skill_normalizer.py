@@ -0,0 +1,76 @@
+# skill_normalizer.py
+ALIASES_PATH = "skill_aliases.json"
+
+
+class SkillCanonicalizer:
+    """
+    Maps skill spellings to interned integer IDs, so that e.g. 'ML',
+    'machine-learning' and 'Machine Learning' are the same skill.
+
+    A skill is normalized (lowercase, '-'/'_' as spaces, single spaces) and then
+    looked up in an alias -> canonical ID table compiled once from the skills
+    database and the alias file. Comparing skills is then an int set operation.
+
+    The table is fixed once built (the shared instance is read by every
+    session); extended() gives a private copy with more skills added.
+    """
+
+    def __init__(self, skills_db: list[str], aliases: dict[str, list[str]] | None = None):
+        self._ids = {}    # normalized spelling -> id
+        self._names = []  # id -> canonical name
+        for canonical, spellings in (aliases or {}).items():
+            cid = self._intern(canonical)
+            for s in spellings:
+                self._ids[self.key(s)] = cid
+        for s in skills_db:
+            self._intern(s)
+
+    @staticmethod
+    def key(skill: str) -> str:
+        return " ".join(skill.lower().replace("-", " ").replace("_", " ").split())
+
+    def lookup(self, skill: str) -> int | None:
+        """ID of a known skill, or None."""
+        return self._ids.get(self.key(skill))
+
+    def _intern(self, skill: str) -> int:
+        """ID of skill, adding it as its own canonical skill if unknown (only while building)."""
+        k = self.key(skill)
+        cid = self._ids.get(k)
+        if cid is None:
+            cid = self._ids[k] = len(self._names)
+            self._names.append(skill.strip().lower())
+        return cid
+
+    def extended(self, skills) -> "SkillCanonicalizer":
+        """
+        Copy of this canonicalizer that also knows skills (e.g. role skills
+        missing from the skills database); existing IDs are unchanged.
+        """
+        copy = SkillCanonicalizer.__new__(SkillCanonicalizer)
+        copy._ids, copy._names = dict(self._ids), list(self._names)
+        for s in skills:
+            copy._intern(s)
+        return copy
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def canonical(self, skill: str) -> str:
+        """Canonical name of skill; unknown skills come back normalized."""
+        cid = self.lookup(skill)
+        return self._names[cid] if cid is not None else " ".join(skill.lower().split())
+
+    def canonicalize(self, skills: list[str]) -> list[str]:
+        """Canonical names, duplicates (incl. aliases of each other) removed, order kept."""
+        return list(dict.fromkeys(self.canonical(s) for s in skills))
+
+    def ids(self, skills: list[str]) -> set[int]:
+        """IDs of the known skills in skills."""
+        return {self._ids.get(self.key(s)) for s in skills} - {None}
+
+
+def get_canonicalizer() -> SkillCanonicalizer:
+    """Shared canonicalizer built from skills_database.json + skill_aliases.json (see skill_registry)."""
+    from skill_registry import get_registry
+    return get_registry().canon
@@ -0,0 +1,101 @@
+# skill_registry.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+from skill_detector import SkillMatcher
+from skill_normalizer import ALIASES_PATH, SkillCanonicalizer
+
+SKILLS_DB_PATH = "skills_database.json"
+
+
+class SkillSet:
+    """
+    Everything derived from one version of the skills and alias files: the
+    skill list, the lowercase skill set, the compiled SkillMatcher, the
+    alias -> canonical ID table and a fingerprint of both files' contents.
+    Never modified after construction, so a reader holding one always sees
+    a matcher and canonicalizer built from the same data.
+    """
+
+    __slots__ = ("skills", "normalized", "fingerprint", "matcher", "canon", "skill_ids")
+
+    def __init__(self, skills: list[str], aliases: dict[str, list[str]]):
+        self.skills = skills
+        self.normalized = frozenset(s.lower() for s in skills)
+        # identifies what detection + canonicalization produce: the skills and the aliases
+        self.fingerprint = hashlib.sha256(json.dumps([skills, aliases], sort_keys=True).encode("utf-8")).hexdigest()
+        self.matcher = SkillMatcher(skills)
+        self.canon = SkillCanonicalizer(skills, aliases)
+        self.skill_ids = frozenset(self.canon.ids(skills))
+
+
+class SkillRegistry:
+    """
+    skills_database.json + skill_aliases.json loaded once per process into a
+    SkillSet (`current`), replaced as a whole when either file's mtime changes.
+    """
+
+    def __init__(self, path: str = SKILLS_DB_PATH, aliases_path: str = ALIASES_PATH):
+        self.path = path
+        self.aliases_path = aliases_path
+        self._lock = threading.Lock()
+        self._mtimes = None
+        self.current = None
+        self.refresh()
+
+    def _current_mtimes(self) -> tuple:
+        return tuple(os.stat(p).st_mtime_ns if os.path.exists(p) else None for p in (self.path, self.aliases_path))
+
+    def refresh(self) -> bool:
+        """Reload if either file changed on disk. Returns True if it reloaded."""
+        mtimes = self._current_mtimes()
+        if mtimes == self._mtimes:
+            return False
+        with self._lock:
+            if mtimes == self._mtimes:
+                return False
+            # build everything before swapping it in, so a bad edit keeps the old data
+            try:
+                with open(self.path, "r") as f:
+                    skills = json.load(f)
+                aliases = {}
+                if os.path.exists(self.aliases_path):
+                    with open(self.aliases_path, "r") as f:
+                        aliases = json.load(f)
+                skill_set = SkillSet(skills, aliases)
+            except (OSError, ValueError):
+                if self._mtimes is None:
+                    raise
+                return False
+            self.current = skill_set  # one reference swap: readers see the old or the new set
+            self._mtimes = mtimes
+        return True
+
+
+CHECK_INTERVAL = 1.0  # seconds between checks of the files on disk
+
+_registry = None
+_checked_at = 0.0
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> SkillSet:
+    """
+    The process-wide skill set, reloaded if the skills or alias file changed
+    (checked at most every CHECK_INTERVAL seconds). Keep the returned object
+    for a whole operation rather than calling this again per item.
+    """
+    global _registry, _checked_at
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SkillRegistry()
+                _checked_at = time.monotonic()
+                return _registry.current
+    if time.monotonic() - _checked_at >= CHECK_INTERVAL:
+        _checked_at = time.monotonic()
+        _registry.refresh()
+    return _registry.current
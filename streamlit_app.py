@@ -1,19 +1,11 @@
 import streamlit as st
-from io import BytesIO
-import pdfplumber
-import re
-import json
-import requests
-
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-
-from engine.matcher import match_careers
-from engine.advisor import get_personalized_advice
-from engine.planner import generate_learning_plan
+
+from engine.advisor import Restart
+from engine.orchestrator import start_analysis
 from user_profile import collect_user_profile
-from github_extractor import extract_github_skills
+from resume_parser import MAX_CHARS, MAX_PAGES, parse_resume
+from session_store import get_session_store, session_id
+from skill_registry import get_registry
 
 from ui_components import show_career_card
 from utils import clean_skills
@@ -177,6 +169,8 @@ body {
 # ---------- Sidebar: samples + settings ----------
 st.sidebar.header("⚙️ Settings & Samples")
 enable_gemini = st.sidebar.checkbox("🔑 Enable Gemini (one-time test)", value=False)
+github_max_repos = st.sidebar.number_input("Max GitHub repos to scan (0 = all)", min_value=0, value=0, step=10)
+github_patience = st.sidebar.number_input("Stop after N repos with no new skills (0 = never)", min_value=0, value=0, step=5)
 st.sidebar.markdown("**Load sample profile:**")
 sample_choice = st.sidebar.selectbox("Pick a sample profile", ["None", "Alice (Data Scientist)", "Bob (AI Engineer)", "Charlie (Career Switcher)"])
 
@@ -210,68 +204,8 @@ st.divider()
 
 
 
-# Load your skills database (JSON file)
-with open("skills_database.json", "r") as f:
-    SKILL_DB = json.load(f)   # Example: ["python", "c++", "tensorflow", "machine learning", "sql", "excel"]
-
-def detect_skills(text: str, skills_db: list[str]) -> list[str]:
-    """
-    Detect skills from resume text using regex (case-insensitive).
-    Allows flexible matches (e.g., 'C++', 'TensorFlow 2.0', 'machine-learning').
-    """
-    text_lower = text.lower()
-    found = []
-
-    for skill in skills_db:
-        # Build regex pattern for each skill
-        # \b ensures word boundaries (exact match)
-        # also allow hyphen/space variations (e.g., "machine-learning")
-        pattern = r"\b" + re.escape(skill.lower()).replace(r"\ ", r"[\s-]") + r"\b"
-
-        if re.search(pattern, text_lower, flags=re.IGNORECASE):
-            found.append(skill.lower())
-
-    return found
-
-
-
-#-----------extract skills from GitHub ----------
-
-def extract_github_skills(username: str, skills_db: list[str]) -> list[str]:
-    """
-    Extracts skills from a user's GitHub repos using GitHub API.
-    Looks at repo languages + topics, and cross-matches with skills_db.
-    """
-    skills_found = set()
-    headers = {"Accept": "application/vnd.github.mercy-preview+json"}  # enable topics API
-
-    repos_url = f"https://api.github.com/users/{username}/repos"
-    repos = requests.get(repos_url, headers=headers).json()
-
-    if isinstance(repos, dict) and repos.get("message"):
-        return []
-
-    for repo in repos:
-        # Languages
-        lang_url = repo.get("languages_url")
-        if lang_url:
-            langs = requests.get(lang_url, headers=headers).json()
-            for lang in langs.keys():
-                lang_norm = lang.lower()
-                # map special cases
-                if lang_norm in ["jupyter notebook"]:
-                    lang_norm = "python"
-                if lang_norm in [s.lower() for s in skills_db]:
-                    skills_found.add(lang_norm)
-
-        # Topics
-        for topic in repo.get("topics", []):
-            topic_norm = topic.lower()
-            if topic_norm in [s.lower() for s in skills_db]:
-                skills_found.add(topic_norm)
-
-    return list(skills_found)
-
+# Skills database (JSON file), loaded once per process by the shared registry
+SKILL_DB = get_registry().skills   # Example: ["python", "c++", "tensorflow", "machine learning", "sql", "excel"]
 
 
 
@@ -294,9 +228,25 @@ with st.container(border=True):
 github_skills = []
 
 if github_username:
+    from github_extractor import iter_github_skills  # requests + pool only load when a username is given
+
     with st.spinner("Fetching skills from GitHub..."):
         try:
-            github_skills = extract_github_skills(github_username, SKILL_DB)
+            # show skills as each repo comes in
+            live_skills = st.empty()
+            found = set()
+            # concurrent, rate-limit aware and time-budgeted: a slow GitHub gives partial results
+            for repo_name, repo_skills in iter_github_skills(
+                github_username,
+                skills_db=SKILL_DB,
+                max_repos=github_max_repos or None,
+                patience=github_patience or None,
+            ):
+                if repo_skills - found:
+                    found |= repo_skills
+                    live_skills.caption(f"{repo_name}: " + ", ".join(sorted(found)))
+            live_skills.empty()
+            github_skills = list(found)
             if github_skills:
                 st.success(f"✅ Found {len(github_skills)} skills from GitHub!")
                 st.write(", ".join(github_skills))
@@ -316,11 +266,13 @@ if github_username:
 
 parsed_profile = None
 if uploaded_resume is not None:
-    with pdfplumber.open(uploaded_resume) as pdf:
-        text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-
-    # Detect skills using regex
-    detected_skills = detect_skills(text, SKILL_DB)
+    # Parse + detect skills (memoized by content hash, so reruns don't re-parse)
+    parsed = parse_resume(uploaded_resume.getvalue())
+    text = parsed["text"]
+    detected_skills = parsed["skills"]
+    if parsed["truncated"]:
+        st.warning(f"Your resume is very long: only the first {MAX_PAGES} pages / {MAX_CHARS:,} characters "
+                   "were scanned for skills.")
 
 
     parsed_profile = {
@@ -387,11 +339,15 @@ user_skills = clean_skills([s for s in skills_input.split(",") if s.strip()])
 profile["skills"] = user_skills
 
 # ---------- Helpers: caching match results for speed ----------
+TOP_MATCHES = 3  # cards shown, and roles the advice / learning plans cover
+
 @st.cache_data(ttl=300)
-def cached_match(skills_tuple):
-    # cache key uses tuple of skills
+def cached_match(skills_tuple, top_k=TOP_MATCHES):
+    # numpy/scipy are only imported once somebody analyzes
+    from engine.matcher import match_careers
+    # cache key uses tuple of skills; only the top roles are shown, so only those are ranked
     skills_list = list(skills_tuple)
-    return match_careers(skills_list)
+    return match_careers(skills_list, top_k=top_k)
 
 # ---------- Analyze button ----------
 col1, col2 = st.columns([1, 3])
@@ -401,6 +357,7 @@ with col1:
 # Result containers
 result_holder = st.container()
 advice_holder = st.container()
+plan_holder = st.container()
 controls_holder = st.container()
 
 if analyze:
@@ -410,18 +367,21 @@ if analyze:
         # get matches (cached)
         matches = cached_match(tuple(user_skills))
 
-        # persist into session for later (pdf download etc.)
-        st.session_state["analysis"] = {
+        # advice, a learning plan per top role and the PDF run concurrently from here on
+        analysis = start_analysis(profile, matches, top_n=TOP_MATCHES, use_mock=not enable_gemini)
+
+        # persist server-side for later (courses page etc.); session_state only keeps the ID
+        get_session_store().put(session_id(), "analysis", {
             "profile": profile,
             "matches": matches
-        }
+        })
 
         # ---------- Show Top 3 Matches as cards ----------
         with result_holder:
             st.subheader("📌 Top 3 Career Matches")
-            cols = st.columns(3)
+            cols = st.columns(TOP_MATCHES)
 
-            for i, m in enumerate(matches[:3]):
+            for i, m in enumerate(matches[:TOP_MATCHES]):
                 role = m["role"]
 
                 with cols[i]:
@@ -453,54 +413,34 @@ if analyze:
         # ---------- Personalized Advice (mock or Gemini one-time) ----------
         with advice_holder:
             st.subheader("✨ Personalized AI Career Guidance")
-            with st.spinner("Thinking..."):
-                advice = get_personalized_advice(profile, matches[:3], use_mock=not enable_gemini)
-            st.text(advice)
+            # render chunks as they arrive instead of waiting for the whole response
+            advice_box = st.empty()
+            advice = ""
+            for chunk in analysis.iter_advice():
+                # a Restart chunk (model failed mid-stream) replaces the partial response
+                advice = chunk if isinstance(chunk, Restart) else advice + chunk
+                advice_box.text(advice)
+
+        # plans and the report were generated while the advice streamed
+        outcome = analysis.result()
+        for step, error in outcome["errors"].items():
+            st.warning(f"{step}: {error}")
+
+        # ---------- Learning plans for the top roles ----------
+        with plan_holder:
+            if outcome["plans"]:
+                st.subheader("🗺️ Learning Plans")
+                for role, plan in outcome["plans"].items():
+                    with st.expander(role):
+                        st.text(plan)
 
         # ---------- Download / Export controls ----------
         with controls_holder:
-            def export_pdf_bytes(profile_obj, matches_obj, advice_text):
-                buffer = BytesIO()
-                doc = SimpleDocTemplate(buffer, pagesize=A4)
-                styles = getSampleStyleSheet()
-                elements = []
-
-                elements.append(Paragraph("AI Career Advisor Report", styles["Title"]))
-                elements.append(Spacer(1, 8))
-
-                # Profile
-                elements.append(Paragraph("👤 User Profile", styles["Heading2"]))
-                for k, v in profile_obj.items():
-                    display_v = ", ".join(v) if isinstance(v, list) else str(v)
-                    elements.append(Paragraph(f"<b>{k.capitalize()}:</b> {display_v}", styles["Normal"]))
-                elements.append(Spacer(1, 8))
-
-                # Matches
-                elements.append(Paragraph("📌 Top Career Matches", styles["Heading2"]))
-                for m in matches_obj[:3]:
-                    elements.append(Paragraph(f"<b>{m['role']}</b> — {m['match']}% match", styles["Normal"]))
-                    elements.append(Paragraph(m["about"], styles["Normal"]))
-                    if m.get("missing"):
-                        elements.append(Paragraph("Missing Skills: " + ", ".join(m["missing"]), styles["Normal"]))
-                    elements.append(Spacer(1, 6))
-
-                elements.append(Paragraph("✨ Personalized Advice", styles["Heading2"]))
-                # Break advice into paragraphs
-                for line in advice_text.splitlines():
-                    if line.strip():
-                        elements.append(Paragraph(line.strip(), styles["Normal"]))
-                elements.append(Spacer(1, 8))
-
-                doc.build(elements)
-                buffer.seek(0)
-                return buffer.getvalue()
-
-            if "analysis" in st.session_state:
-                pdf_bytes = export_pdf_bytes(st.session_state["analysis"]["profile"], st.session_state["analysis"]["matches"], advice)
-                st.download_button("📥 Export Report as PDF", data=pdf_bytes, file_name="career_advisor_report.pdf", mime="application/pdf")
+            if outcome["report"]:
+                st.download_button("📥 Export Report as PDF", data=outcome["report"], file_name="career_advisor_report.pdf", mime="application/pdf")
             else:
                 st.info("Run analysis to enable export.")
 
 # If not analyzed yet, show a friendly sample preview
-if "analysis" not in st.session_state:
+if not get_session_store().exists(session_id(), "analysis"):
     st.info("Fill your profile and skills, then click **Analyze** to see tailored matches and a learning plan.")
\ No newline at end of file
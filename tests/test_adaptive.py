@@ -0,0 +1,89 @@
+# tests/test_adaptive.py
+import random
+
+import pytest
+
+from engine.adaptive import AdaptiveInterview, p_correct
+
+DIFFICULTIES = [-2.0 + 0.1 * i for i in range(41)]
+IDS = list(range(100, 141))  # question numbers differ from positions
+
+
+def _engine(responses=(), **kwargs):
+    return AdaptiveInterview(DIFFICULTIES, IDS, responses, rng=random.Random(0), **kwargs)
+
+
+def test_p_correct_is_bounded_by_the_guess_rate():
+    assert p_correct(0.0, 0.0) == pytest.approx(0.625)
+    assert 0.25 < p_correct(-5.0, 3.0) < p_correct(5.0, -3.0) < 1.0
+
+
+def test_answers_move_the_ability_estimate():
+    start = _engine()
+    assert start.ability == pytest.approx(0.0, abs=1e-9)
+    right, wrong = _engine([(120, True)]), _engine([(120, False)])
+    assert wrong.ability < start.ability < right.ability
+    assert right.se < start.se and wrong.se < start.se
+    # a wrong answer to an easy question says more than one to a hard question
+    assert _engine([(100, False)]).ability < _engine([(140, False)]).ability
+
+
+def test_stops_on_standard_error_after_min_questions():
+    engine = _engine(min_questions=3, max_questions=40, target_se=0.8)
+    rng = random.Random(1)
+    while (qid := engine.next_question()) is not None:
+        engine.record(qid, rng.random() < p_correct(0.5, engine.difficulty(qid)))
+    n = len(engine.responses)
+    assert engine.done and 3 <= n < 40
+    assert engine.se <= 0.8
+    assert _engine(engine.responses[:n - 1], min_questions=3, max_questions=40, target_se=0.8).se > 0.8
+
+
+def test_min_and_max_questions_bound_the_length():
+    assert not _engine([(120, True)], min_questions=3, target_se=10.0).done
+    assert _engine([(120, True)] * 3, min_questions=3, target_se=10.0).done
+    engine = _engine(max_questions=2, target_se=0.0)
+    for _ in range(2):
+        engine.record(engine.next_question(), True)
+    assert engine.next_question() is None
+    assert AdaptiveInterview([0.0], [7], [(7, True)], min_questions=3).done  # bank exhausted
+
+
+def test_next_question_is_unused_and_near_the_ability():
+    engine = _engine(randomesque=1, max_questions=41, target_se=0.0)
+    asked = set()
+    for correct in [True, True, False, True, False, False, True]:
+        qid = engine.next_question()
+        assert qid not in asked
+        assert abs(engine.difficulty(qid) - engine.ability) < 0.5
+        asked.add(qid)
+        engine.record(qid, correct)
+
+
+def test_score_counts_answers_and_estimates_the_rest():
+    assert AdaptiveInterview([], []).score() == 0.0
+    start = _engine()
+    expected = 100 * sum(p_correct(start.ability, b) for b in DIFFICULTIES) / len(DIFFICULTIES)
+    assert start.score() == pytest.approx(expected)
+    all_right = _engine([(qid, True) for qid in IDS])
+    all_wrong = _engine([(qid, False) for qid in IDS])
+    assert all_right.score() == pytest.approx(100.0)  # every question asked: the actual result
+    assert all_wrong.score() == pytest.approx(0.0)
+    assert 0 < _engine([(120, False)]).score() < start.score() < _engine([(120, True)]).score() < 100
+
+
+def test_replaying_answers_matches_recording_them():
+    # the interview page keeps (question_ids, correct) in the session and rebuilds the engine each rerun
+    live = _engine()
+    question_ids, correct = [], []
+    rng = random.Random(2)
+    while (qid := live.next_question()) is not None:
+        question_ids.append(qid)
+        correct.append(rng.random() < 0.6)
+        live.record(qid, correct[-1])
+        replayed = _engine(zip(question_ids, correct))
+        assert replayed.responses == live.responses
+        assert replayed.ability == pytest.approx(live.ability)
+        assert replayed.se == pytest.approx(live.se)
+        assert replayed.score() == pytest.approx(live.score())
+        assert replayed.done == live.done
@@ -0,0 +1,110 @@
+# tests/test_catalog.py
+import json
+import os
+
+import pytest
+
+import catalog
+from catalog import Catalog, build
+
+ROLES = [
+    {"id": "da", "role": "Data Analyst", "about": "Dashboards.", "skills": ["sql", "excel"]},
+    {"id": "ds", "role": "Data Scientist", "about": "Models.", "skills": ["python", "statistics"]},
+]
+QUESTIONS = {"Data Analyst": [{"q": "easy", "difficulty": -1.0}, {"q": "hard", "difficulty": 2.0}, {"q": "mid"}]}
+PLANS = {"Data Analyst": {"weeks": 12}}
+
+
+def _write_sources(src, roles=ROLES, questions=QUESTIONS, plans=PLANS):
+    paths = {"roles": str(src / "roles.json"), "questions": str(src / "questions.json"),
+             "plans": str(src / "plans.json")}
+    for name, data in (("roles", roles), ("questions", questions), ("plans", plans)):
+        with open(paths[name], "w") as f:
+            json.dump(data, f)
+    return paths
+
+
+def test_build_open_and_look_up(tmp_path):
+    sources = _write_sources(tmp_path)
+    counts = build(str(tmp_path / "cat"), sources)
+    assert counts == {"roles": 2, "plans": 1, "questions": 3}
+
+    cat = Catalog(str(tmp_path / "cat"))
+    assert cat.role("Data Scientist")["skills"] == ["python", "statistics"]
+    assert cat.role("Nope") is None
+    assert [r["role"] for r in cat.roles()] == ["Data Analyst", "Data Scientist"]  # source order
+    assert cat.role_id("Data Analyst") == "da"
+    assert cat.plans("Data Analyst") == {"weeks": 12}
+    assert cat.question_count("Data Analyst") == 3
+    assert cat.question("Data Analyst", 1) == {"q": "hard", "difficulty": 2.0}
+    assert cat.question("Data Analyst", 3) is None
+    assert cat.question_difficulties("Data Analyst") == ([-1.0, 0.0, 2.0], [0, 2, 1])
+    assert cat.question_difficulties("Data Scientist") == ([], [])
+
+
+def test_open_without_complete_build_fails(tmp_path):
+    with pytest.raises(ValueError):
+        Catalog(str(tmp_path))
+
+
+def test_rebuild_switches_generations_and_old_readers_keep_their_tables(tmp_path):
+    sources = _write_sources(tmp_path)
+    out = str(tmp_path / "cat")
+    build(out, sources)
+    old = Catalog(out)
+    old.role("Data Analyst")  # opened before the rebuild
+
+    _write_sources(tmp_path, roles=ROLES + [{"role": "ML Engineer", "about": "", "skills": ["python"]}])
+    build(out, sources)
+    new = Catalog(out)
+    assert new.generation != old.generation
+    assert new.role("ML Engineer") is not None
+    # the old reader still sees one consistent build, including tables it opens only now
+    assert old.role("ML Engineer") is None
+    assert old.question_count("Data Analyst") == 3
+
+    build(out, sources)  # a third build drops the first generation
+    assert sorted(n for n in os.listdir(out) if n.startswith("g")) == sorted([new.generation, Catalog(out).generation])
+
+
+def test_failed_build_keeps_previous_catalog(tmp_path, monkeypatch):
+    sources = _write_sources(tmp_path)
+    out = str(tmp_path / "cat")
+    build(out, sources)
+    before = Catalog(out).generation
+
+    real_write = catalog.write_table
+
+    def crash_on_questions(path, items):
+        if path.endswith("questions.tbl"):
+            raise OSError("disk full")
+        return real_write(path, items)
+
+    monkeypatch.setattr(catalog, "write_table", crash_on_questions)
+    _write_sources(tmp_path, roles=ROLES[:1])
+    with pytest.raises(OSError):
+        build(out, sources)
+    cat = Catalog(out)
+    assert cat.generation == before
+    assert len(cat.roles()) == 2
+    assert sorted(os.listdir(out)) == sorted([before, "manifest.json"])
+
+
+def test_get_catalog_rebuilds_when_a_source_changes(tmp_path, monkeypatch):
+    sources = _write_sources(tmp_path)
+    monkeypatch.delenv("CATALOG_DIR", raising=False)
+    monkeypatch.setattr(catalog, "SOURCES", sources)
+    monkeypatch.setattr(catalog, "CATALOG_DIR", str(tmp_path / "cat"))
+    monkeypatch.setattr(catalog, "CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(catalog, "_catalog", None)
+
+    first = catalog.get_catalog()
+    assert first is catalog.get_catalog()  # unchanged sources: same catalog
+    assert first.role("ML Engineer") is None
+
+    _write_sources(tmp_path, roles=ROLES + [{"role": "ML Engineer", "about": "", "skills": ["python"]}])
+    stat = os.stat(sources["roles"])
+    os.utime(sources["roles"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # newer than the manifest
+    second = catalog.get_catalog()
+    assert second is not first
+    assert second.role("ML Engineer") is not None
@@ -0,0 +1,115 @@
+# tests/test_github_extractor.py
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from github_extractor import GitHubClient, extract_github_skills, iter_github_skills
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Just enough of the GitHub REST API for the extractor, served from `routes`."""
+
+    routes = {}
+    hits = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            n = self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        route = self.routes.get(self.path)
+        if route is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        status, headers, body = route(n, self.server.url) if callable(route) else route
+        if not isinstance(body, (str, bytes)):
+            body = json.dumps(body)
+        body = body.encode() if isinstance(body, str) else body
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v.format(url=self.server.url))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _repo(name):
+    return {"name": name, "owner": {"login": "alice"}}
+
+
+def _rate_limited_once(n, url):
+    if n == 1:
+        return 429, {"Retry-After": "0.2"}, {"message": "slow down"}
+    return 200, {}, {"Go": 1200}
+
+
+ROUTES = {
+    "/users/alice/repos?per_page=100": (
+        200, {"Link": '<{url}/users/alice/repos?per_page=100&page=2>; rel="next"'}, [_repo("ml")]),
+    "/users/alice/repos?per_page=100&page=2": (200, {}, [_repo("svc")]),
+    "/repos/alice/ml/languages": (200, {}, {"Python": 5000, "Jupyter Notebook": 100}),
+    "/repos/alice/ml/topics": (200, {}, {"names": ["docker"]}),
+    "/repos/alice/ml/readme": lambda n, url: (200, {}, {"download_url": f"{url}/raw/ml/README.md"}),
+    "/raw/ml/README.md": (200, {"Content-Type": "text/plain"}, "Trained with pytorch, data in postgresql."),
+    "/repos/alice/svc/languages": _rate_limited_once,
+    "/repos/alice/svc/topics": (200, {}, {"names": []}),
+}
+
+
+@pytest.fixture
+def github():
+    FakeGitHub.routes = ROUTES
+    FakeGitHub.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_extracts_skills_across_pages_and_retries_rate_limit(github):
+    skills = extract_github_skills("alice", api_url=github.url, use_cache=False, time_budget=10)
+    assert {"python", "docker", "pytorch", "postgresql", "go"} <= set(skills)
+    assert FakeGitHub.hits["/users/alice/repos?per_page=100&page=2"] == 1
+    assert FakeGitHub.hits["/repos/alice/svc/languages"] == 2  # retried after Retry-After
+
+
+def test_skills_db_limits_reported_skills(github):
+    skills = extract_github_skills("alice", api_url=github.url, use_cache=False, skills_db=["Python", "Docker"])
+    assert sorted(skills) == ["docker", "python"]
+
+
+def test_iter_yields_each_repo(github):
+    names = [name for name, _ in iter_github_skills("alice", api_url=github.url, use_cache=False)]
+    assert sorted(names) == ["alice/ml", "alice/svc"]
+
+
+def test_max_repos_stops_listing(github):
+    names = [name for name, _ in iter_github_skills("alice", api_url=github.url, use_cache=False, max_repos=1)]
+    assert names == ["alice/ml"]
+    assert "/users/alice/repos?per_page=100&page=2" not in FakeGitHub.hits
+
+
+def test_get_returns_none_once_budget_is_spent(github):
+    client = GitHubClient(api_url=github.url, time_budget=0.05)
+    time.sleep(0.1)
+    assert client.get("/repos/alice/ml/topics") is None
+    assert client.exhausted
+    client.close()
+
+
+def test_get_returns_none_when_budget_ends_before_the_request(github, monkeypatch):
+    client = GitHubClient(api_url=github.url, time_budget=5)
+    # the budget runs out between _wait_turn and the request: no ValueError from a negative timeout
+    monkeypatch.setattr(client, "_wait_turn", lambda: True)
+    client.deadline = time.monotonic() - 1
+    assert client.get("/repos/alice/ml/topics") is None
+    client.close()
@@ -0,0 +1,108 @@
+# tests/test_http_cache.py
+import threading
+import time
+
+import requests
+
+import http_cache
+from http_cache import HTTPCache
+
+
+class FakeFetch:
+    """requests.get stand-in: 200 with `bodies[url]` and an ETag, or 304 when the ETag matches."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.calls = []
+
+    def __call__(self, url, headers=None, **kwargs):
+        self.calls.append(url)
+        body = self.bodies[url]
+        etag = f'"{len(body)}"'
+        res = requests.Response()
+        res.url = url
+        res.headers["ETag"] = etag
+        if (headers or {}).get("If-None-Match") == etag:
+            res.status_code = 304
+            res._content = b""
+        else:
+            res.status_code = 200
+            res._content = body
+        return res
+
+
+def _stored_bytes(cache):
+    return cache._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+
+def test_hit_serves_from_cache_and_revalidates_when_stale(tmp_path):
+    fetch = FakeFetch({"u": b"hello"})
+    cache = HTTPCache(str(tmp_path / "c.sqlite"))
+    assert cache.get("u", fetch=fetch).content == b"hello"
+    res = cache.get("u", fetch=fetch)
+    assert res.from_cache and res.content == b"hello"
+    assert fetch.calls == ["u"]
+
+    cache.ttl = 0
+    assert cache.get("u", fetch=fetch).content == b"hello"  # 304 -> cached body
+    assert cache.stats == {"hits": 1, "revalidated": 1, "misses": 1, "evictions": 0}
+
+
+def test_authorization_is_part_of_the_key(tmp_path):
+    fetch = FakeFetch({"u": b"private"})
+    cache = HTTPCache(str(tmp_path / "c.sqlite"))
+    cache.get("u", headers={"Authorization": "token a"}, fetch=fetch)
+    assert not cache.get("u", headers={"Authorization": "token b"}, fetch=fetch).from_cache
+    assert not cache.get("u", fetch=fetch).from_cache
+
+
+def test_hits_write_access_times_in_batches(tmp_path):
+    fetch = FakeFetch({"a": b"1", "b": b"2", "c": b"3"})
+    cache = HTTPCache(str(tmp_path / "c.sqlite"), flush_every=3, flush_interval=3600)
+    for url in "abc":
+        cache.get(url, fetch=fetch)
+    written = cache._db.total_changes
+    for url in "aab":  # repeated hits on one entry are coalesced
+        cache.get(url, fetch=fetch)
+    assert cache._db.total_changes == written  # noted in memory only
+    cache.get("c", fetch=fetch)
+    assert cache._db.total_changes == written + 3  # one batch: an update per entry
+    assert cache._accessed == {}
+
+
+def test_running_size_matches_table_and_evicts_least_recently_used(tmp_path):
+    bodies = {f"u{i}": b"x" * 100 for i in range(10)}
+    cache = HTTPCache(str(tmp_path / "c.sqlite"), max_bytes=450, ttl=3600)
+    fetch = FakeFetch(bodies)
+    for i in range(4):
+        cache.get(f"u{i}", fetch=fetch)
+    cache.get("u0", fetch=fetch)  # hit: u0 becomes the most recent (not yet flushed)
+    cache.get("u4", fetch=fetch)
+    assert cache.size() == _stored_bytes(cache) == 400
+    kept = {r[0] for r in cache._db.execute("SELECT url FROM responses")}
+    assert "u0" in kept and "u1" not in kept
+
+    bodies["u4"] = b"y" * 10  # replacing an entry adjusts the total by the difference
+    cache.ttl = 0
+    cache.get("u4", fetch=fetch)
+    assert cache.size() == _stored_bytes(cache) == 310
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_default_cache_is_created_once(tmp_path, monkeypatch):
+    made = []
+
+    def slow_cache():
+        time.sleep(0.05)  # widen the window between the check and the assignment
+        made.append(HTTPCache(str(tmp_path / "c.sqlite")))
+        return made[-1]
+
+    monkeypatch.setattr(http_cache, "_default_cache", None)
+    monkeypatch.setattr(http_cache, "HTTPCache", slow_cache)
+    threads = [threading.Thread(target=http_cache.get_default_cache) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(made) == 1
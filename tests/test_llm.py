@@ -0,0 +1,177 @@
+# tests/test_llm.py
+import threading
+import time
+
+import pytest
+
+import engine.llm as llm
+from engine.advisor import Restart, _mock_advice, get_personalized_advice, stream_personalized_advice
+from engine.llm import LLMCache, generate_stream
+from engine.orchestrator import run_analysis
+from engine.planner import _plan_prompt, generate_learning_plan
+
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """
+    Stands in for genai.GenerativeModel: streams `text` in chunks, or fails with
+    `error` (after `fail_after` chunks, so 0 fails before the first).
+    """
+
+    def __init__(self, text="Learn SQL. Then learn Python.", error=None, fail_after=0):
+        self.text = text
+        self.error = error
+        self.fail_after = fail_after
+        self.prompts = []
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return self._chunks()
+
+    def _chunks(self):
+        for i, text in enumerate(llm.iter_chunks(self.text, words=2)):
+            if self.error is not None and i == self.fail_after:
+                raise self.error
+            yield Chunk(text)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = LLMCache(":memory:")
+    monkeypatch.setattr(llm, "_cache", cache)  # what get_llm_cache() hands the advisor and planner
+    return cache
+
+
+def test_miss_calls_model_then_hit_replays_it(cache):
+    model = FakeModel()
+    assert "".join(generate_stream("prompt", model=model, cache=cache)) == model.text
+    assert "".join(generate_stream("prompt", model=model, cache=cache)) == model.text
+    assert len(model.prompts) == 1
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_key_ignores_whitespace_but_not_model_name(cache):
+    model = FakeModel()
+    "".join(generate_stream("  make a plan\n\n   for  me ", model=model, cache=cache))
+    "".join(generate_stream("make a plan\nfor me", model=model, cache=cache))
+    assert len(model.prompts) == 1
+    "".join(generate_stream("make a plan\nfor me", model_name="other", model=model, cache=cache))
+    assert len(model.prompts) == 2
+
+
+def test_expired_and_evicted_entries_miss():
+    expired = LLMCache(":memory:", ttl=0)
+    expired.put("p", "m", "text")
+    assert expired.get("p", "m") is None
+
+    small = LLMCache(":memory:", max_entries=2)
+    for prompt in ("a", "b", "c"):
+        small.put(prompt, "m", prompt.upper())
+    assert small.get("a", "m") is None
+    assert small.get("c", "m") == "C"
+
+
+def test_advice_cache_key_ignores_profile_key_order(cache):
+    model = FakeModel()
+    matches = [{"role": "Data Analyst", "match": 80, "missing": ["python"]}]
+    first = get_personalized_advice({"name": "A", "skills": ["sql"]}, matches, use_mock=False, model=model)
+    second = get_personalized_advice({"skills": ["sql"], "name": "A"}, matches, use_mock=False, model=model)
+    assert first == second == model.text
+    assert len(model.prompts) == 1
+
+
+def test_plan_is_cached(cache):
+    model = FakeModel()
+    assert generate_learning_plan(["sql"], "Data Analyst", model=model) == model.text
+    assert generate_learning_plan(["sql"], "Data Analyst", model=model) == model.text
+    assert len(model.prompts) == 1
+
+
+def test_model_error_falls_back_to_mock_and_is_not_cached(cache):
+    profile = {"name": "A", "skills": ["sql"]}
+    matches = [{"role": "Data Analyst", "match": 80, "missing": ["python"]}]
+    failing = FakeModel(error=RuntimeError("quota exceeded"))
+    advice = get_personalized_advice(profile, matches, use_mock=False, model=failing)
+    assert "quota exceeded" in advice
+    assert advice.endswith(_mock_advice(profile, matches))
+
+    model = FakeModel()
+    assert get_personalized_advice(profile, matches, use_mock=False, model=model) == model.text
+    assert len(model.prompts) == 1
+
+
+def test_planner_error_propagates_and_is_not_cached(cache):
+    with pytest.raises(RuntimeError):
+        generate_learning_plan(["sql"], "Data Analyst", model=FakeModel(error=RuntimeError("down")))
+    assert cache.get(_plan_prompt(["sql"], "Data Analyst"), llm.MODEL_NAME) is None
+    model = FakeModel()
+    assert generate_learning_plan(["sql"], "Data Analyst", model=model) == model.text
+    assert len(model.prompts) == 1
+
+
+def test_mid_stream_error_discards_partial_response(cache):
+    profile = {"name": "A", "skills": ["sql"]}
+    matches = [{"role": "Data Analyst", "match": 80, "missing": ["python"]}]
+    failing = FakeModel(text="PARTIAL " * 20, error=RuntimeError("connection reset"), fail_after=3)
+    chunks = list(stream_personalized_advice(profile, matches, use_mock=False, model=failing))
+    assert chunks[0].startswith("PARTIAL")
+    assert sum(isinstance(c, Restart) for c in chunks) == 1
+
+    advice = get_personalized_advice(profile, matches, use_mock=False, model=failing)
+    assert "PARTIAL" not in advice
+    assert advice.startswith("⚠️ Error calling Gemini: connection reset")
+    assert advice.endswith(_mock_advice(profile, matches))
+
+    outcome = run_analysis(profile, matches, top_n=1, use_mock=False, model=failing, render=False)
+    assert outcome["advice"] == advice
+
+
+def test_eviction_keeps_recently_hit_entries():
+    cache = LLMCache(":memory:", max_entries=2, flush_interval=3600)
+    cache.put("a", "m", "A")
+    cache.put("b", "m", "B")
+    assert cache.get("a", "m") == "A"  # only noted in memory so far
+    cache.put("c", "m", "C")
+    assert cache.get("b", "m") is None
+    assert cache.get("a", "m") == "A"
+    assert cache._count == cache._recount() == 2
+
+
+def test_hits_are_written_in_batches():
+    cache = LLMCache(":memory:", flush_every=2, flush_interval=3600)
+    cache.put("a", "m", "A")
+    cache.put("b", "m", "B")
+    written = cache._db.total_changes
+    cache.get("a", "m")
+    cache.get("a", "m")
+    assert cache._db.total_changes == written
+    cache.get("b", "m")
+    assert cache._db.total_changes == written + 2
+
+
+def test_empty_response_is_not_cached(cache):
+    empty = FakeModel(text="")
+    assert "".join(generate_stream("prompt", model=empty, cache=cache)) == ""
+    assert cache.get("prompt", llm.MODEL_NAME) is None
+
+
+def test_default_cache_is_created_once(monkeypatch):
+    made = []
+
+    def slow_cache():
+        time.sleep(0.05)  # widen the window between the check and the assignment
+        made.append(LLMCache(":memory:"))
+        return made[-1]
+
+    monkeypatch.setattr(llm, "_cache", None)
+    monkeypatch.setattr(llm, "LLMCache", slow_cache)
+    threads = [threading.Thread(target=llm.get_llm_cache) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(made) == 1
@@ -0,0 +1,55 @@
+# tests/test_matcher.py
+import random
+
+import pytest
+
+from engine.matcher import CareerIndex, match_careers_batch
+
+VOCAB = [f"skill{i}" for i in range(40)]
+
+
+def _careers(rng, n):
+    return [{"role": f"Role {i}", "about": "", "skills": rng.sample(VOCAB, rng.randint(1, 6))} for i in range(n)]
+
+
+@pytest.mark.parametrize("top_k", [1, 3, 25, None])
+def test_batch_matches_single_user_results(top_k):
+    rng = random.Random(top_k or 0)
+    index = CareerIndex(_careers(rng, 30))
+    users = [rng.sample(VOCAB, rng.randint(0, 8)) for _ in range(50)]
+    assert index.match_batch(users, top_k) == [index.match(u, top_k) for u in users]
+
+
+def test_batch_stats_report_the_product_size():
+    stats = {}
+    results = match_careers_batch([["python", "sql"], ["docker"], []], top_k=2, chunk_size=2, stats=stats)
+    assert [len(r) for r in results] == [2, 2, 2]
+    assert stats["profiles"] == 3 and stats["chunks"] == 2 and stats["chunk_size"] == 2
+    assert stats["roles"] > 0
+    assert 0 < stats["max_product_nnz"] <= 2 * stats["roles"]
+    assert stats["max_product_bytes"] > 0
+
+
+def full_ranking(careers, user_skills):
+    """Every role by score, ties in catalog order (the stable sort match() replaced)."""
+    have = set(user_skills)
+    scored = [(c["role"], int(sum(s in have for s in c["skills"]) / max(len(c["skills"]), 1) * 100))
+              for c in careers]
+    return sorted(scored, key=lambda rs: -rs[1])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_top_k_equals_full_sort_prefix(seed):
+    rng = random.Random(seed)
+    # few skills per role and a small vocabulary: many tied scores and many zero-score roles
+    careers = _careers(rng, rng.randint(5, 60))
+    index = CareerIndex(careers)
+    for _ in range(30):
+        user = rng.sample(VOCAB, rng.randint(0, 5))
+        expected = full_ranking(careers, user)
+        nonzero = sum(score > 0 for _, score in expected)
+        assert [(m["role"], m["match"]) for m in index.match(user)] == expected
+        for k in {1, 2, 3, nonzero, nonzero + 1, nonzero + 7, len(careers) - 1, len(careers), len(careers) + 5}:
+            if k < 1:
+                continue
+            assert [(m["role"], m["match"]) for m in index.match(user, k)] == expected[:k], (user, k)
@@ -0,0 +1,108 @@
+# tests/test_orchestrator.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import engine.llm as llm
+from engine.llm import LLMCache
+from engine.orchestrator import run_analysis, start_analysis
+
+PROFILE = {"name": "A", "skills": ["sql", "python"]}
+MATCHES = [{"role": role, "match": 50, "about": "Works with data.", "missing": ["statistics"]}
+           for role in ("Data Analyst", "Data Scientist", "ML Engineer")]
+
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class SlowModel:
+    """Streams a few chunks `delay` seconds apart; blocks on `stall` (if given) before the second."""
+
+    def __init__(self, delay=0.0, stall=None):
+        self.delay = delay
+        self.stall = stall
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate_content(self, prompt, stream=False):
+        return self._chunks(prompt)
+
+    def _chunks(self, prompt):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            for i in range(3):
+                if i == 1 and self.stall is not None:
+                    self.stall.wait()
+                time.sleep(self.delay)
+                yield Chunk(f"{prompt[:10]} {i} ")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setattr(llm, "_cache", LLMCache(":memory:"))
+
+
+def test_stalled_stream_times_out_on_time():
+    stall = threading.Event()
+    try:
+        start = time.monotonic()
+        outcome = run_analysis(PROFILE, MATCHES, top_n=1, use_mock=False, model=SlowModel(stall=stall),
+                               timeouts={"advice": 0.3, "plan": 0.3}, render=False)
+        assert time.monotonic() - start < 1.5
+        assert outcome["errors"]["advice"].startswith("TimeoutError")
+        assert outcome["advice"] is None
+    finally:
+        stall.set()
+
+
+def test_queued_steps_do_not_spend_their_timeout_waiting():
+    # one worker for two analyses: every step waits behind the others, but only
+    # its own running time counts against its timeout
+    executor = ThreadPoolExecutor(max_workers=1)
+    model = SlowModel(delay=0.1)
+    analyses = [start_analysis({**PROFILE, "skills": [skill]}, MATCHES, top_n=2, use_mock=False, model=model,
+                               render=False, executor=executor, timeouts={"advice": 0.6, "plan": 0.6})
+                for skill in ("sql", "go")]  # different prompts, so nothing is served from the cache
+    outcomes = [a.result(timeout=10) for a in analyses]
+    executor.shutdown()
+    for outcome in outcomes:
+        assert outcome["errors"] == {}
+        assert outcome["advice"] and len(outcome["plans"]) == 2
+    assert max(o["seconds"] for o in outcomes) > 0.6  # longer than any one timeout
+
+
+def test_max_parallel_bounds_steps_per_analysis():
+    model = SlowModel(delay=0.05)
+    outcome = run_analysis(PROFILE, MATCHES, use_mock=False, model=model, render=False, max_parallel=2)
+    assert outcome["errors"] == {}
+    assert len(outcome["plans"]) == 3
+    assert model.peak <= 2
+
+
+def test_cancel_stops_running_steps():
+    stall = threading.Event()
+    try:
+        analysis = start_analysis(PROFILE, MATCHES, use_mock=False, model=SlowModel(stall=stall), render=False)
+        time.sleep(0.1)
+        analysis.cancel()
+        outcome = analysis.result(timeout=2)
+        assert set(outcome["errors"]) == {"advice", "plan:Data Analyst", "plan:Data Scientist", "plan:ML Engineer"}
+        list(analysis.iter_advice())  # ends instead of blocking
+    finally:
+        stall.set()
+
+
+def test_mock_analysis_builds_report():
+    outcome = run_analysis(PROFILE, MATCHES)
+    assert outcome["errors"] == {}
+    assert outcome["report"][:4] == b"%PDF"
@@ -0,0 +1,42 @@
+# tests/test_pdf_report.py
+import os
+
+import pdfplumber
+import pytest
+
+from engine.advisor import get_personalized_advice
+from engine.matcher import match_careers
+from pdf_report import render_multi_report, write_report
+
+
+def _report(name, skills):
+    profile = {"name": name, "skills": skills}
+    matches = match_careers(skills, 3)
+    return profile, matches, get_personalized_advice(profile, matches, use_mock=True)
+
+
+def test_multi_report_reads_reports_lazily_and_keeps_every_page(tmp_path):
+    reports = [_report(f"U{i}", ["python", "sql", "docker"][: i % 4]) for i in range(5)]
+    pages = sum(write_report(*r, str(tmp_path / f"{i}.pdf")) for i, r in enumerate(reports))
+    made = []
+
+    def lazily():
+        for r in reports:
+            made.append(r[0]["name"])
+            yield r
+
+    out = render_multi_report(lazily(), str(tmp_path / "all.pdf"))
+    assert made == [f"U{i}" for i in range(5)]
+    with pdfplumber.open(out) as pdf:
+        assert len(pdf.pages) == pages  # each report starts on its own page
+        assert "U4" in pdf.pages[-1].extract_text()
+
+
+def test_failed_multi_report_leaves_no_files(tmp_path):
+    def failing():
+        yield _report("ok", ["python"])
+        raise RuntimeError("bad row")
+
+    with pytest.raises(RuntimeError):
+        render_multi_report(failing(), str(tmp_path / "all.pdf"))
+    assert os.listdir(tmp_path) == []
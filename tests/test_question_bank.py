@@ -0,0 +1,50 @@
+# tests/test_question_bank.py
+import json
+
+import pytest
+
+from catalog import Catalog, build
+from question_bank import QuestionBank
+
+QUESTIONS = {
+    "Data Scientist": [
+        {"question": "p-value?", "options": ["a", "b"], "answer": "a", "difficulty": 0.5},
+        {"question": "Bias?", "options": ["a", "b"], "answer": "b", "difficulty": -1.0},
+        {"question": "Lasso?", "options": ["a", "b"], "answer": "a", "difficulty": 1.5},
+    ],
+    "Data Analyst": [{"question": "JOIN?", "options": ["a", "b"], "answer": "b"}],
+}
+
+
+@pytest.fixture
+def cat(tmp_path):
+    sources = {}
+    for name, data in (("roles", []), ("questions", QUESTIONS), ("plans", {})):
+        sources[name] = str(tmp_path / f"{name}.json")
+        with open(sources[name], "w") as f:
+            json.dump(data, f)
+    build(str(tmp_path / "cat"), sources)
+    return Catalog(str(tmp_path / "cat"))
+
+
+def test_questions_are_looked_up_by_number(cat):
+    bank = QuestionBank("Data Scientist", cat)
+    assert bank.role == "Data Scientist" and len(bank) == 3
+    assert bank[2]["question"] == "Lasso?"
+    assert bank[0] == QUESTIONS["Data Scientist"][0]
+    with pytest.raises(IndexError):
+        bank[3]
+
+
+def test_role_without_questions_falls_back(cat):
+    assert QuestionBank("Data Analyst", cat).role == "Data Analyst"
+    bank = QuestionBank("Astronaut", cat)
+    assert bank.role == "Data Scientist" and bank[1]["question"] == "Bias?"
+    assert QuestionBank("Astronaut", cat, fallback_role="Data Analyst").role == "Data Analyst"
+
+
+def test_interview_runs_over_the_bank_difficulties(cat):
+    bank = QuestionBank("Data Scientist", cat)
+    assert bank.difficulties() == ([-1.0, 0.5, 1.5], [1, 0, 2])
+    interview = bank.interview([(0, True)], max_questions=2)
+    assert interview.next_question() in (1, 2)
@@ -0,0 +1,100 @@
+# tests/test_recommender.py
+import pytest
+
+from engine.recommender import ResourceRecommender
+from resource_index import ResourceIndex
+
+HEADER = "role_id,resource_type,title,url,duration\n"
+
+
+@pytest.fixture
+def make(tmp_path):
+    path = tmp_path / "resources.csv"
+
+    def make(rows):
+        with open(path, "w") as f:
+            f.write(HEADER + "".join(f"r,{rtype},{title},https://x/{i},{duration}\n"
+                                     for i, (rtype, title, duration) in enumerate(rows)))
+        return ResourceRecommender(ResourceIndex(str(path)))
+
+    return make
+
+
+def _titles(result):
+    return [r["title"] for r in result["resources"]]
+
+
+def test_covers_every_required_skill_it_can(make):
+    rec = make([
+        ("course", "Python for everyone", "2 hours"),
+        ("course", "SQL essentials", "1 hour"),
+        ("course", "Docker and Kubernetes", "3 hours"),
+        ("course", "Cooking basics", "10 min"),
+    ])
+    result = rec.recommend(["python", "SQL", "docker"])
+    assert result["covered"] == ["docker", "python", "sql"]
+    assert result["uncovered"] == []
+    assert "Cooking basics" not in _titles(result)
+    assert result["minutes"] == 360
+    for r in result["resources"]:
+        assert r["covers"]  # every pick teaches something not yet covered
+
+
+def test_prefers_more_skills_per_minute(make):
+    rec = make([
+        ("course", "Python course", "50 min"),
+        ("course", "SQL course", "50 min"),
+        ("course", "Python and SQL bootcamp", "60 min"),
+    ])
+    result = rec.recommend(["python", "sql"])
+    assert _titles(result) == ["Python and SQL bootcamp"]
+    assert result["minutes"] == 60
+
+
+def test_equal_ratio_takes_the_shorter_resource_first(make):
+    rec = make([
+        ("course", "Python and SQL course", "120 min"),
+        ("course", "Python course", "60 min"),
+    ])
+    result = rec.recommend(["python", "sql"])
+    assert _titles(result)[0] == "Python course"
+    assert result["covered"] == ["python", "sql"]
+
+
+def test_budget_limits_total_minutes(make):
+    rec = make([
+        ("course", "Python course", "60 min"),
+        ("course", "SQL course", "90 min"),
+        ("course", "Docker course", "30 min"),
+    ])
+    result = rec.recommend(["python", "sql", "docker"], budget_minutes=100)
+    assert result["minutes"] <= 100
+    assert set(_titles(result)) == {"Docker course", "Python course"}
+    assert result["uncovered"] == ["sql"]
+
+
+def test_skills_no_resource_covers_are_uncovered(make):
+    rec = make([("course", "Python course", "1 hour")])
+    result = rec.recommend(["python", "docker", "underwater basket weaving"])
+    assert result["covered"] == ["python"]
+    assert result["uncovered"] == ["docker", "underwater basket weaving"]
+    assert rec.recommend(["docker"]) == {"resources": [], "covered": [], "uncovered": ["docker"], "minutes": 0.0}
+
+
+def test_resource_type_filter_and_unknown_duration(make):
+    rec = make([
+        ("youtube", "Python in 10 minutes", "10 min"),
+        ("course", "Python course", "self-paced"),
+    ])
+    assert _titles(rec.recommend(["python"], resource_type="Course")) == ["Python course"]
+    assert rec.recommend(["python"], resource_type="course")["minutes"] == 60  # DEFAULT_MINUTES
+
+
+def test_appended_rows_are_picked_up(make, tmp_path):
+    rec = make([("course", "Python course", "1 hour")])
+    assert rec.recommend(["sql"])["uncovered"] == ["sql"]
+    with open(tmp_path / "resources.csv", "a") as f:
+        f.write("r,course,SQL course,https://x/new,1 hour\n")
+    rec.index.refresh()
+    assert _titles(rec.recommend(["sql"])) == ["SQL course"]
+
@@ -0,0 +1,104 @@
+# tests/test_resource_index.py
+import logging
+
+from resource_index import ResourceIndex, parse_duration
+
+HEADER = "role_id,resource_type,title,url,duration\n"
+ROWS = [
+    "ds,course,Stats 101,https://a,4 weeks\n",
+    "ds,youtube,Pandas in 20,https://b,20 min\n",
+    "da,course,SQL basics,https://c,2 hours\n",
+]
+
+
+def _write(path, text, mode="w"):
+    with open(path, mode) as f:
+        f.write(text)
+
+
+def _titles(found):
+    return [r["title"] for r in found]
+
+
+def test_parse_duration():
+    assert parse_duration("2 hours") == 120
+    assert parse_duration("1h 30 min") == 90
+    assert parse_duration("self-paced") == float("inf")
+
+
+def test_lookups_are_sorted_by_duration(tmp_path):
+    path = tmp_path / "r.csv"
+    _write(path, HEADER + "".join(ROWS))
+    index = ResourceIndex(str(path))
+    assert _titles(index.find("ds")) == ["Pandas in 20", "Stats 101"]
+    assert _titles(index.find(None, "COURSE")) == ["SQL basics", "Stats 101"]
+    assert _titles(index.find(max_minutes=120)) == ["Pandas in 20", "SQL basics"]
+    assert index.count("ds", max_minutes=60) == 1
+    assert index.resource_types("ds") == ["course", "youtube"]
+    assert index.find("ds", limit=1)[0]["minutes"] == 20
+
+
+def test_append_is_parsed_incrementally(tmp_path):
+    path = tmp_path / "r.csv"
+    _write(path, HEADER + "".join(ROWS))
+    index = ResourceIndex(str(path))
+    rows, n = index.snapshot()
+    _write(path, "ds,article,Quick read,https://d,5 min\n", mode="a")
+    assert index.refresh()
+    assert index.stats["incremental_loads"] == 1 and index.stats["full_loads"] == 1
+    assert _titles(index.find("ds")) == ["Quick read", "Pandas in 20", "Stats 101"]
+    assert rows[:n] == index.rows[:n]  # earlier snapshots stay valid
+    assert not index.refresh()  # unchanged file
+
+
+def test_rewrite_rebuilds_and_follows_a_reordered_header(tmp_path):
+    path = tmp_path / "r.csv"
+    _write(path, HEADER + "".join(ROWS))
+    index = ResourceIndex(str(path))
+    old_rows, _ = index.snapshot()
+    _write(path, "title,duration,url,role_id,resource_type\nNew course,1 hour,https://e,da,course\n")
+    assert index.refresh()
+    assert index.stats["full_loads"] == 2
+    assert _titles(index.find("da")) == ["New course"]
+    assert index.find("ds") == []
+    assert len(old_rows) == 3  # a full reload builds new lists
+
+
+def test_partial_last_line_is_read_again_once_complete(tmp_path):
+    path = tmp_path / "r.csv"
+    _write(path, HEADER + "".join(ROWS) + "da,youtube,Joins,https://f,15")
+    index = ResourceIndex(str(path))
+    assert index.find("da", "youtube")[0]["minutes"] is None  # "15" without a unit yet
+    _write(path, " min\n", mode="a")
+    assert index.refresh()
+    assert index.stats["full_loads"] == 2  # not appended onto the half-read line
+    found = index.find("da", "youtube")
+    assert len(found) == 1 and found[0]["minutes"] == 15
+    assert len(index.rows) == 4
+
+
+def test_bad_header_keeps_the_previous_index(tmp_path, caplog):
+    path = tmp_path / "r.csv"
+    _write(path, HEADER + "".join(ROWS))
+    index = ResourceIndex(str(path))
+    with caplog.at_level(logging.WARNING, logger="resource_index"):
+        _write(path, "role_id,type,title,url,duration\nds,course,Other,https://g,1 hour\n")
+        assert not index.refresh()
+    assert "resource_type" in caplog.text
+    assert index.stats["failed_loads"] == 1
+    assert _titles(index.find("ds")) == ["Pandas in 20", "Stats 101"]
+    assert not index.refresh()  # logged once, not on every check
+
+    # fixing the file (even by appending to it) loads it in full
+    _write(path, HEADER + "ds,course,Fixed,https://h,1 hour\n")
+    assert index.refresh()
+    assert _titles(index.find("ds")) == ["Fixed"]
+
+
+def test_bad_header_on_first_load_gives_an_empty_index(tmp_path, caplog):
+    path = tmp_path / "r.csv"
+    _write(path, "role,type\nds,course\n")
+    with caplog.at_level(logging.WARNING, logger="resource_index"):
+        index = ResourceIndex(str(path))
+    assert index.find() == [] and index.count() == 0
+    assert "not reloaded" in caplog.text
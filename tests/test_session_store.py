@@ -0,0 +1,131 @@
+# tests/test_session_store.py
+import threading
+
+import pytest
+
+from session_store import MemorySessionStore, SessionStore, SQLiteSessionStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**limits):
+        if request.param == "memory":
+            return MemorySessionStore(**limits)
+        return SQLiteSessionStore(str(tmp_path / "sessions.sqlite"), **limits)
+    return make
+
+
+def test_base_store_is_abstract():
+    with pytest.raises(TypeError):
+        SessionStore()
+
+
+def test_put_get_delete(make_store):
+    store = make_store()
+    store.put("s1", "analysis", {"skills": ["sql"], "age": 30})
+    assert store.get("s1", "analysis") == {"skills": ["sql"], "age": 30}
+    assert store.get("s1", "missing", "default") == "default"
+    assert store.get("s2", "analysis") is None
+    assert store.session_bytes("s1") == len("analysis") + len('{"skills":["sql"],"age":30}')
+    store.delete("s1", "analysis")
+    assert store.session_bytes("s1") == 0
+    store.delete("s1")
+    assert len(store) == 0
+
+
+def test_session_over_cap_drops_oldest_keys(make_store):
+    store = make_store(max_session_bytes=100)
+    store.put("s", "a", "x" * 40)
+    store.put("s", "b", "y" * 40)
+    store.put("s", "c", "z" * 40)
+    assert store.get("s", "a") is None
+    assert store.get("s", "c") == "z" * 40
+    assert store.session_bytes("s") <= 100
+    with pytest.raises(ValueError):
+        store.put("s", "big", "x" * 200)
+
+
+def test_least_recently_used_sessions_go_beyond_max_sessions(make_store):
+    store = make_store(max_sessions=3, touch_interval=0)
+    for sid in ("a", "b", "c"):
+        store.put(sid, "k", sid)
+    store.get("a", "k")  # a is now more recent than b
+    store.put("d", "k", "d")
+    assert len(store) == 3
+    assert store.get("b", "k") is None
+    assert store.get("a", "k") == "a"
+    store.put("a", "k2", "again")  # an existing session does not count twice
+    assert len(store) == 3
+    assert store.get("c", "k") == "c"
+
+
+def test_exists_checks_a_key_without_reading_it(make_store):
+    store = make_store()
+    store.put("s", "analysis", {"skills": ["sql"]})
+    assert store.exists("s", "analysis")
+    assert not store.exists("s", "other")
+    assert not store.exists("t", "analysis")
+    assert len(store) == 1  # checking does not create a session
+
+
+def test_reads_refresh_last_access_once_per_interval(make_store):
+    store = make_store(max_sessions=2, touch_interval=3600)
+    store.put("a", "k", 1)
+    store.put("b", "k", 2)
+    store.get("a", "k")  # a was used too recently to be touched again
+    store.exists("a", "k")
+    store.put("c", "k", 3)
+    assert not store.exists("a", "k")
+    assert store.exists("b", "k")
+
+
+def test_sqlite_reads_within_the_interval_do_not_write(tmp_path):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.sqlite"), touch_interval=3600)
+    store.put("s", "analysis", {"skills": ["sql"]})
+    written = store._db.total_changes
+    for _ in range(5):  # a rerun's reads
+        store.get("s", "analysis")
+        store.exists("s", "analysis")
+        store.get("other", "analysis")
+    assert store._db.total_changes == written
+    store.touch_interval = 0
+    store.exists("s", "analysis")
+    assert store._db.total_changes == written + 1
+
+
+def test_idle_sessions_are_evicted(make_store):
+    store = make_store(idle_ttl=10)
+    store.put("old", "k", 1)
+    store.put("new", "k", 2)
+    store.get("new", "k")
+    assert store.evict_idle(now=store._swept_at + 5) == 0
+    assert store.evict_idle(now=store._swept_at + 3600) == 2
+    assert len(store) == 0
+
+
+def test_sqlite_count_follows_other_processes(tmp_path):
+    path = str(tmp_path / "sessions.sqlite")
+    one, two = SQLiteSessionStore(path, max_sessions=2), SQLiteSessionStore(path, max_sessions=2)
+    one.put("a", "k", 1)
+    two.put("b", "k", 2)
+    one.evict_idle()  # the sweep picks up sessions other processes added
+    one.put("c", "k", 3)
+    assert len(one) == 2
+    assert one.get("a", "k") is None
+
+
+def test_concurrent_puts_keep_sizes_consistent(make_store):
+    store = make_store()
+
+    def write(i):
+        for j in range(50):
+            store.put(f"s{i}", f"k{j % 5}", "v" * j)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for i in range(4):
+        expected = sum(len(f"k{j}") + len(f'"{"v" * (45 + j)}"') for j in range(5))
+        assert store.session_bytes(f"s{i}") == expected
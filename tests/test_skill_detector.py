@@ -0,0 +1,89 @@
+# tests/test_skill_detector.py
+import json
+import random
+import re
+
+import pytest
+
+from skill_detector import SkillMatcher, SkillStream
+
+SKILLS = [
+    "c", "c++", "c#", ".net", "asp.net", "node.js", "express.js", "objective-c", "r", "go",
+    "java", "javascript", "sql", "nosql", "machine learning", "deep learning", "learning",
+    "scikit-learn", "ci/cd", "spring boot", "Power BI", "a/b testing",
+]
+
+CORPUS = [
+    "C++ and C# developer; also wrote C.",
+    "Built APIs in C++17, c++, and C#/.NET with ASP.NET Core",
+    "Backend: Node.js, node.js; frontend: Express.js, express.jsx, nodeXjs",
+    "Objective-C, objective c, objective-c++",
+    "Machine Learning, machine-learning, MACHINE\tLEARNING, machine\nlearning, machinelearning",
+    "deep learning (deep-learning) and learning_rate tuning; e-learning",
+    "JavaScript is not Java; java-script, JAVA.",
+    "SQL, NoSQL, MySQL, postgresql, sql_server, T-SQL",
+    "scikit-learn / Scikit Learn / scikit_learn",
+    "R, R&D, Go, golang, Go-lang, ergo",
+    "CI/CD pipelines, ci / cd, Spring Boot, spring-boot, Power  BI, A/B testing",
+    "",
+    "c",
+    ".net",
+    "x.net ..net _net net.",
+    "C++C#",
+]
+
+
+def regex_find(text: str, skills: list[str]) -> list[str]:
+    """The per-skill regex detect_skills used before the trie (kept here as the reference)."""
+    text_lower = text.lower()
+    found = []
+    for skill in skills:
+        pattern = r"\b" + re.escape(skill.lower()).replace(r"\ ", r"[\s-]") + r"\b"
+        if re.search(pattern, text_lower, flags=re.IGNORECASE):
+            found.append(skill.lower())
+    return found
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_matches_regex_on_fixed_corpus(text):
+    assert SkillMatcher(SKILLS).find(text) == regex_find(text, SKILLS)
+
+
+def test_matches_regex_with_skills_database():
+    with open("skills_database.json") as f:
+        skills = json.load(f)
+    matcher = SkillMatcher(skills)
+    for text in CORPUS:
+        assert matcher.find(text) == regex_find(text, skills)
+
+
+def test_matches_regex_on_generated_text():
+    rng = random.Random(0)
+    pieces = SKILLS + [s.upper() for s in SKILLS] + ["foo", "x", "1", "-", "_", ".", "/", "+", "#", " ", "\n"]
+    matcher = SkillMatcher(SKILLS)
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) + rng.choice(["", " ", "-", ",", "\n"]) for _ in range(rng.randint(1, 12)))
+        assert matcher.find(text) == regex_find(text, SKILLS), text
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stream_matches_whole_text(seed):
+    rng = random.Random(seed)
+    matcher = SkillMatcher(SKILLS)
+    pieces = SKILLS + ["x" * 50, "https://example.com/" + "a" * 80, "foo", "-", " ", "\n", ".", "c"]
+    chunks = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 6))) for _ in range(rng.randint(1, 8))]
+    stream = SkillStream(matcher)
+    for chunk in chunks:
+        stream.feed(chunk)
+    assert stream.skills() == matcher.find("\n".join(chunks))
+
+
+def test_stream_carry_is_bounded_without_whitespace():
+    matcher = SkillMatcher(SKILLS)
+    stream = SkillStream(matcher)
+    for _ in range(200):
+        stream.feed("QUJD" * 500)  # one endless token, as in a base64 blob
+    assert len(stream._carry) <= stream._overlap + 1
+    stream.feed("zz machine")
+    stream.feed("learning")
+    assert stream.skills() == ["machine learning", "learning"]
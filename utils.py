@@ -1,3 +1,6 @@
+from skill_normalizer import get_canonicalizer
+
+
 def clean_skills(skills):
-    """Given list of strings or comma split, return cleaned lowercase skills."""
-    return [s.strip().lower() for s in skills if isinstance(s, str) and s.strip()]
+    """Given list of strings or comma split, return cleaned lowercase skills (aliases canonicalized, deduplicated)."""
+    return get_canonicalizer().canonicalize([s for s in skills if isinstance(s, str) and s.strip()])